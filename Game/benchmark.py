@@ -0,0 +1,227 @@
+import argparse
+import copy
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+
+from game_logic import WEIGHT_CLASSES, GameData, Fighter, update_rankings_logic, generate_rookie, process_monthly_events
+from fight_engine import ENGINE_VERSION, simulate_fight, snapshot_fighter, _rebuild
+from registry import RosterRegistry
+from roster_view import RosterTableModel
+from storage import RosterStore
+
+# --- BENCHMARKS ---
+# Times the hot paths on synthetic rosters of increasing size and writes the numbers to JSON, so two
+# runs (e.g. before and after a change) can be compared with --compare. Headless: nothing here
+# imports tkinter, and the roster store is a temp file, never the game's own roster.db.
+# Each benchmark is a setup function returning a callable; the callable does the timed work and
+# returns how many operations it did. Every repeat gets a fresh setup from the same seed.
+DEFAULT_SIZES = [100, 1000, 10000, 100000]
+REPEATS = 3
+_scratch = None  # temp folder for store files, removed when the run ends
+
+def _scratch_db():
+    return os.path.join(tempfile.mkdtemp(dir=_scratch), 'bench.db')
+
+def _template_fighters():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    with open(os.path.join(script_dir, 'roster.json'), 'r') as f: return json.load(f)
+
+def synthetic_roster(size, seed=0):
+    # roster.json records with jittered stats and unique names, spread evenly over the divisions.
+    # The top fighter of each division is champion, careers get a short fight history.
+    rng = random.Random(seed)
+    templates = _template_fighters()
+    roster = []
+    for i in range(size):
+        data = copy.deepcopy(templates[i % len(templates)])
+        data['id'] = i + 1
+        data['name'] = f"{data['name']} {i // len(templates) + 1}" if i >= len(templates) else data['name']
+        data['weight_class'] = WEIGHT_CLASSES[i % len(WEIGHT_CLASSES)]
+        data['stats'] = {k: max(30, min(99, v + rng.randint(-8, 8))) for k, v in data['stats'].items()}
+        data['is_champion'] = i < len(WEIGHT_CLASSES)
+        data['age'] = rng.randint(20, 38); data['popularity'] = rng.randint(5, 95)
+        data['injury_months'] = rng.choice([0] * 9 + [rng.randint(1, 6)])
+        data['history'] = [{"result": rng.choice(["Win", "Loss"]), "opponent": templates[rng.randrange(len(templates))]['name'],
+                            "method": "DECISION", "round": 3, "event": f"UFC {100 + n}", "fight_id": None} for n in range(rng.randint(0, 10))]
+        data['record'] = {"wins": sum(h['result'] == "Win" for h in data['history']), "losses": sum(h['result'] == "Loss" for h in data['history']), "draws": 0}
+        roster.append(data)
+    return roster
+
+def _world(size, seed):
+    random.seed(seed)
+    registry = RosterRegistry(Fighter(d) for d in synthetic_roster(size, seed))
+    return registry, GameData()
+
+# --- CASES ---
+def bench_simulate_fight(size, seed):
+    # Headless engine, no sink, so no commentary pacing. Fighters are rebuilt from snapshots so the
+    # roster doesn't drift between repeats.
+    registry, _ = _world(size, seed)
+    rng = random.Random(seed)
+    pairs = [rng.sample(registry.roster, 2) for _ in range(500)]
+    snaps = [(snapshot_fighter(a), snapshot_fighter(b)) for a, b in pairs]
+    def run():
+        for i, (a, b) in enumerate(snaps):
+            simulate_fight(_rebuild(a), _rebuild(b), is_main=(i % 8 == 0), rng=random.Random(i))
+        return len(snaps)
+    return run
+
+def bench_process_monthly_events(size, seed):
+    registry, game_data = _world(size, seed)
+    def run():
+        for _ in range(12):
+            process_monthly_events(registry, game_data); game_data.advance_time()
+        return 12
+    return run
+
+def bench_update_rankings_logic(size, seed):
+    registry, _ = _world(size, seed)
+    return lambda: (update_rankings_logic(registry.roster), 1)[1]
+
+def bench_rankings_update(size, seed):
+    # Incremental path used after every fight: change a score, re-file that fighter
+    registry, _ = _world(size, seed)
+    rankings = update_rankings_logic(registry.roster)
+    rng = random.Random(seed)
+    picks = [rng.choice(registry.roster) for _ in range(1000)]
+    def run():
+        for f in picks:
+            f.ranking_score += rng.randint(-150, 200); rankings.update(f)
+        return len(picks)
+    return run
+
+def bench_save_roster(size, seed):
+    # First save of a fresh store: every fighter and history row is written
+    registry, _ = _world(size, seed)
+    path = _scratch_db()
+    def run():
+        store = RosterStore(path); store.save(registry.roster); store.close()
+        return len(registry.roster)
+    return run
+
+def bench_save_roster_incremental(size, seed):
+    # A month's worth of changes (1% of fighters) on top of an existing store
+    registry, _ = _world(size, seed)
+    store = RosterStore(_scratch_db()); store.save(registry.roster)
+    rng = random.Random(seed)
+    for f in rng.sample(registry.roster, max(1, size // 100)):
+        f.popularity += 1
+        f.history.append({"result": "Win", "opponent": "Bench", "method": "DECISION", "round": 3, "event": "UFC 999", "fight_id": None})
+    def run():
+        store.save(registry.roster); store.close()
+        return max(1, size // 100)
+    return run
+
+def bench_load_roster(size, seed):
+    # What load_starting_world does once roster.db exists
+    registry, _ = _world(size, seed)
+    path = _scratch_db()
+    store = RosterStore(path); store.save(registry.roster); store.close()
+    def run():
+        store = RosterStore(path)
+        roster = [Fighter(data) for data in store.load_records()]
+        store.close()
+        return len(roster)
+    return run
+
+def bench_generate_rookie(size, seed):
+    registry, _ = _world(size, seed)
+    def run():
+        for _ in range(1000): registry.add(generate_rookie(registry))
+        return 1000
+    return run
+
+def bench_refresh_list(size, seed):
+    # refresh_list without Tk: a fight's worth of ranking updates, then the visible window of the
+    # roster table for "All" and for one division, at scattered scroll positions
+    registry, _ = _world(size, seed)
+    rankings = update_rankings_logic(registry.roster)
+    model = RosterTableModel(rankings)
+    rng = random.Random(seed)
+    def run():
+        for n in range(200):
+            a, b = rng.sample(registry.roster, 2)
+            a.ranking_score += 150; b.ranking_score = max(0, b.ranking_score - 50)
+            rankings.update(a); rankings.update(b)
+            model.choice = "All" if n % 2 else a.weight_class
+            start = rng.randrange(max(1, model.size() - 30))
+            model.window(start, 30)
+        return 200
+    return run
+
+BENCHMARKS = {
+    "simulate_fight": bench_simulate_fight,
+    "process_monthly_events": bench_process_monthly_events,
+    "update_rankings_logic": bench_update_rankings_logic,
+    "rankings_update": bench_rankings_update,
+    "save_roster": bench_save_roster,
+    "save_roster_incremental": bench_save_roster_incremental,
+    "load_roster": bench_load_roster,
+    "generate_rookie": bench_generate_rookie,
+    "refresh_list": bench_refresh_list,
+}
+
+# --- RUNNER ---
+def run_case(setup, size, seed, repeats):
+    times = []; ops = 0
+    for _ in range(repeats):
+        work = setup(size, seed)
+        start = time.perf_counter(); ops = work(); times.append(time.perf_counter() - start)
+    best = min(times)
+    return {"ops": ops, "best_s": best, "median_s": statistics.median(times), "per_op_us": best / ops * 1e6}
+
+def _git_revision():
+    try:
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=script_dir, capture_output=True, text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError): return None
+
+def run_benchmarks(sizes=DEFAULT_SIZES, names=None, repeats=REPEATS, seed=0, log=print):
+    global _scratch
+    results = {}
+    _scratch = tempfile.mkdtemp(prefix="mma_bench_")
+    try:
+        for size in sizes:
+            results[str(size)] = {}
+            for name in names or BENCHMARKS:
+                results[str(size)][name] = r = run_case(BENCHMARKS[name], size, seed, repeats)
+                log(f"{size:>7}  {name:<26}{r['best_s'] * 1000:>10.1f} ms  {r['per_op_us']:>10.1f} us/op")
+    finally:
+        shutil.rmtree(_scratch, ignore_errors=True); _scratch = None
+    return {"revision": _git_revision(), "engine_version": ENGINE_VERSION, "python": platform.python_version(),
+            "platform": platform.platform(), "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "seed": seed,
+            "repeats": repeats, "results": results}
+
+def compare(old, new, log=print):
+    # Ratio of per-op time, > 1 means the new run is slower
+    for size, cases in new["results"].items():
+        for name, r in cases.items():
+            before = old["results"].get(size, {}).get(name)
+            if before: log(f"{size:>7}  {name:<26}{r['per_op_us'] / before['per_op_us']:>8.2f}x")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the game's hot paths on synthetic rosters.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), default=None)
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None, help="Write the results to this JSON file (default benchmarks/<revision>.json)")
+    parser.add_argument("--compare", default=None, help="Earlier results JSON to compare against")
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.sizes, args.only, args.repeats, args.seed)
+    out = args.out
+    if out is None:
+        out = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks', f"{report['revision'] or report['timestamp']}.json")
+        os.makedirs(os.path.dirname(out), exist_ok=True)
+    with open(out, 'w') as f: json.dump(report, f, indent=4)
+    print(f"Results written to {out}")
+    if args.compare:
+        with open(args.compare, 'r') as f: compare(json.load(f), report)
@@ -0,0 +1,163 @@
+from bisect import bisect_left, insort
+
+# --- CAREER & PROMOTION STATS ---
+# Aggregates kept up to date as fights and events are committed (run_card -> record_fight,
+# GameData.archive_event -> record_event), so the Records tab never walks fighter histories or the
+# event archive. Per-fighter totals and per-division counters are dict lookups, leaderboards are
+# sorted lists where an update only moves the one fighter it touched, and the PPV trend keeps
+# running sums so any recent-window average is a subtraction.
+LEADERBOARDS = {"wins": "Most Wins", "finishes": "Most Finishes", "ko_wins": "Most KO Wins", "sub_wins": "Most Submission Wins",
+                "best_streak": "Longest Win Streak", "title_wins": "Most Title Wins", "title_defenses": "Most Title Defenses",
+                "main_events": "Most Main Events"}
+CAREER_KEYS = ["fights", "wins", "losses", "finishes", "ko_wins", "sub_wins", "dec_wins", "ko_losses", "sub_losses", "dec_losses",
+               "streak", "best_streak", "title_fights", "title_wins", "title_defenses", "main_events"]
+METHOD_KEYS = {"KNOCKOUT": "ko", "SUBMISSION": "sub"}
+
+class Leaderboard:
+    # (-value, fighter id) kept sorted, one entry per fighter
+    def __init__(self):
+        self.keys = []; self.values = {}
+
+    def set(self, fid, value):
+        old = self.values.get(fid)
+        if old == value: return
+        if old is not None: del self.keys[bisect_left(self.keys, (-old, fid))]
+        if value: insort(self.keys, (-value, fid)); self.values[fid] = value
+        else: self.values.pop(fid, None)
+
+    def rebuild(self, values):
+        self.values = {fid: v for fid, v in values.items() if v}
+        self.keys = sorted((-v, fid) for fid, v in self.values.items())
+
+    def top(self, n=10): return [(fid, -v) for v, fid in self.keys[:n]]
+    def position(self, fid):
+        value = self.values.get(fid)
+        return None if value is None else bisect_left(self.keys, (-value, fid)) + 1
+
+class CareerStats:
+    def __init__(self):
+        self.fighters = {}     # fighter id -> career totals (CAREER_KEYS) plus name and division
+        self.divisions = {}    # division -> {"fights", "ko", "sub", "dec", "title_fights"}
+        self.lineages = {}     # division -> reigns, oldest first
+        self.boards = {key: Leaderboard() for key in LEADERBOARDS}
+        self.events = []       # (name, date, buys, rating)
+        self.buys_sums = [0]   # running total of buys, buys_sums[i] = sum of the first i events
+        self.best_event = None
+        self.touched = []      # (winner id, loser id, division) per recorded fight, append-only, see changes()
+
+    # --- UPDATES ---
+    def career_of(self, f):
+        c = self.fighters.get(f.id)
+        if c is None: c = self.fighters[f.id] = dict.fromkeys(CAREER_KEYS, 0)
+        c["name"] = f.name; c["division"] = f.weight_class
+        return c
+
+    def record_fight(self, res, winner, loser, event_name, date):
+        w = self.career_of(winner); l = self.career_of(loser)
+        kind = METHOD_KEYS.get(res['method'], "dec")
+        w["fights"] += 1; l["fights"] += 1
+        w["wins"] += 1; w[kind + "_wins"] += 1; l["losses"] += 1; l[kind + "_losses"] += 1
+        if kind != "dec": w["finishes"] += 1
+        w["streak"] += 1; l["streak"] = 0
+        w["best_streak"] = max(w["best_streak"], w["streak"])
+        if res['slot'] == "Main Event": w["main_events"] += 1; l["main_events"] += 1
+
+        div = self.divisions.setdefault(winner.weight_class, {"fights": 0, "ko": 0, "sub": 0, "dec": 0, "title_fights": 0})
+        div["fights"] += 1; div[kind] += 1
+        if res['title_fight']:
+            div["title_fights"] += 1; w["title_fights"] += 1; l["title_fights"] += 1
+            reigns = self.lineages.setdefault(winner.weight_class, [])
+            if res['new_champ']:
+                w["title_wins"] += 1
+                if reigns and reigns[-1]["lost"] is None: reigns[-1]["lost"] = (event_name, date)
+                reigns.append({"id": winner.id, "name": winner.name, "won": (event_name, date), "lost": None, "defenses": 0})
+            elif res['still_champ']:
+                w["title_defenses"] += 1
+                if not reigns or reigns[-1]["id"] != winner.id:
+                    # Champion from the starting roster, the reign began before records were kept
+                    reigns.append({"id": winner.id, "name": winner.name, "won": None, "lost": None, "defenses": 0})
+                reigns[-1]["defenses"] += 1
+
+        for key, board in self.boards.items():
+            board.set(winner.id, w[key]); board.set(loser.id, l[key])
+        self.touched.append((winner.id, loser.id, winner.weight_class))
+
+    def record_event(self, event):
+        self.events.append((event["name"], event["date"], event["buys"], event["rating"]))
+        self.buys_sums.append(self.buys_sums[-1] + event["buys"])
+        if self.best_event is None or event["buys"] > self.events[self.best_event][2]: self.best_event = len(self.events) - 1
+
+    # --- QUERIES ---
+    def leaderboard(self, key, n=10):
+        return [(self.fighters[fid]["name"], value) for fid, value in self.boards[key].top(n)]
+
+    def career(self, fid):
+        c = self.fighters.get(fid)
+        if c is None: return None
+        c = dict(c)
+        c["finish_rate"] = c["finishes"] / c["wins"] if c["wins"] else 0.0
+        c["positions"] = {key: board.position(fid) for key, board in self.boards.items()}
+        return c
+
+    def finish_rates(self):
+        rates = {}
+        for name, d in self.divisions.items():
+            n = d["fights"] or 1
+            rates[name] = {"fights": d["fights"], "ko": d["ko"] / n, "sub": d["sub"] / n, "dec": d["dec"] / n, "title_fights": d["title_fights"]}
+        return rates
+
+    def lineage(self, division): return self.lineages.get(division, [])
+
+    def average_buys(self, last=None):
+        count = len(self.events) if last is None else min(last, len(self.events))
+        return (self.buys_sums[-1] - self.buys_sums[-1 - count]) / count if count else 0
+
+    def buys_trend(self, last=12):
+        # Recent events next to the average of the window before them
+        recent = self.events[-last:]
+        before = len(self.events) - len(recent)
+        prev = min(last, before)
+        prev_avg = (self.buys_sums[before] - self.buys_sums[before - prev]) / prev if prev else 0
+        return {"events": recent, "average": self.average_buys(last), "previous_average": prev_avg,
+                "best": self.events[self.best_event] if self.best_event is not None else None}
+
+    # --- PERSISTENCE ---
+    # Saved as one row per fighter and one per division. A save remembers how far into `touched` it
+    # has written and only rewrites the rows touched since, like the append-only event archive.
+    def changes(self, since=None):
+        # (fighter ids, divisions) recorded since position `since` of touched, everything for None
+        if since is None: return set(self.fighters), set(self.divisions) | set(self.lineages)
+        fids = set(); divs = set()
+        for w, l, div in self.touched[since:]: fids.add(w); fids.add(l); divs.add(div)
+        return fids, divs
+
+    def division_data(self, div):
+        return {"counts": self.divisions.get(div), "lineage": self.lineages.get(div, [])}
+
+    @classmethod
+    def from_rows(cls, fighters, divisions, events):
+        # fighters: (id, career) pairs, divisions: (name, division_data()) pairs, events: the event archive
+        stats = cls()
+        stats.fighters = dict(fighters)
+        for div, data in divisions:
+            if data["counts"]: stats.divisions[div] = data["counts"]
+            if data["lineage"]: stats.lineages[div] = data["lineage"]
+        return stats._restored(events)
+
+    @classmethod
+    def from_dict(cls, data):
+        # The single JSON blob saves used to keep in meta
+        stats = cls()
+        if not data: return stats
+        stats.fighters = {int(fid): c for fid, c in data["fighters"].items()}
+        stats.divisions = data["divisions"]
+        stats.lineages = data["lineages"]
+        return stats._restored({"name": name, "date": date, "buys": buys, "rating": rating} for name, date, buys, rating in data["events"])
+
+    def _restored(self, events):
+        # JSON turns the (event, date) tuples of a reign into lists
+        self.lineages = {div: [dict(r, won=tuple(r["won"]) if r["won"] else None, lost=tuple(r["lost"]) if r["lost"] else None) for r in reigns]
+                         for div, reigns in self.lineages.items()}
+        for key, board in self.boards.items(): board.rebuild({fid: c[key] for fid, c in self.fighters.items()})
+        for event in events: self.record_event(event)
+        return self
@@ -0,0 +1,132 @@
+import numpy as np
+
+from game_logic import Fighter
+
+# --- COMPACT FIGHTER STORAGE ---
+# Struct-of-arrays alternative to Fighter for very large generated rosters. The numeric fields of
+# every fighter live in shared typed columns, each CompactFighter is just a __slots__ handle
+# (columns + row) plus the few non-numeric fields. It duck-types as a Fighter for the engine,
+# rankings and registry, and only builds the nested JSON dict in to_dict() at save time. A registry
+# created with columns= puts its new fighters here too, and process_monthly_events then reads and
+# writes whole columns instead of going fighter by fighter.
+STAT_COLUMNS = ["striking", "grappling", "tdd", "sub_off", "sub_def", "chin", "cardio"]
+COLUMN_TYPES = dict([(k, np.int16) for k in STAT_COLUMNS] + [
+    ("popularity", np.int16), ("ranking_score", np.int32), ("age", np.int16), ("injury_months", np.int16),
+    ("wins", np.int32), ("losses", np.int32), ("draws", np.int32), ("annual_wins", np.int16), ("annual_finishes", np.int16),
+])
+
+class FighterColumns:
+    def __init__(self, capacity=1024):
+        self.capacity = max(1, capacity)
+        self.cols = {k: np.zeros(self.capacity, dtype=t) for k, t in COLUMN_TYPES.items()}
+        self.size = 0
+        self.free_rows = []
+        self._traits = {}  # interned trait tuples, most fighters share a handful of combinations
+
+    def _grow(self):
+        self.capacity *= 2
+        for k, col in self.cols.items():
+            grown = np.zeros(self.capacity, dtype=col.dtype); grown[:self.size] = col[:self.size]
+            self.cols[k] = grown
+
+    def column(self, name):
+        # Live view over all rows (released rows included), for whole-column updates
+        return self.cols[name][:self.size]
+
+    def add(self, data):
+        if self.free_rows: row = self.free_rows.pop()
+        else:
+            if self.size == self.capacity: self._grow()
+            row = self.size; self.size += 1
+        return CompactFighter(self, row, data)
+
+    def release(self, f):
+        self.free_rows.append(f._row)
+
+    def intern_traits(self, traits):
+        key = tuple(traits)
+        return self._traits.setdefault(key, key)
+
+    def rows(self, fighters):
+        # Row of each fighter, in order, to index the columns with
+        return np.fromiter((f._row for f in fighters), dtype=np.int64, count=len(fighters))
+
+def _column_property(name):
+    def getter(self): return int(self._store.cols[name][self._row])
+    def setter(self, value): self._store.cols[name][self._row] = value
+    return property(getter, setter)
+
+class _ColumnDict:
+    # Dict-like view so code doing f.record['wins'] += 1 keeps working against the columns
+    __slots__ = ("_store", "_row", "_keys")
+    def __init__(self, store, row, keys): self._store = store; self._row = row; self._keys = keys
+    def __getitem__(self, key): return int(self._store.cols[self._keys[key]][self._row])
+    def __setitem__(self, key, value): self._store.cols[self._keys[key]][self._row] = value
+    def get(self, key, default=None): return self[key] if key in self._keys else default
+    def keys(self): return self._keys.keys()
+    def items(self): return [(k, self[k]) for k in self._keys]
+    def __iter__(self): return iter(self._keys)
+    def __contains__(self, key): return key in self._keys
+    def to_dict(self): return {k: self[k] for k in self._keys}
+
+RECORD_KEYS = {"wins": "wins", "losses": "losses", "draws": "draws"}
+ANNUAL_KEYS = {"wins": "annual_wins", "finishes": "annual_finishes"}
+
+class CompactFighter:
+    __slots__ = ("_store", "_row", "id", "name", "nickname", "weight_class", "traits", "is_champion", "rank", "total_damage_taken", "history")
+
+    def __init__(self, store, row, data):
+        self._store = store; self._row = row
+        self.id = data.get('id', 0)
+        self.name = data['name']
+        self.nickname = data.get('nickname', "")
+        self.weight_class = data['weight_class']
+        for k in STAT_COLUMNS: store.cols[k][row] = data['stats'][k]
+        self.traits = store.intern_traits(data.get('traits', []))
+        record = data.get('record', {"wins": 0, "losses": 0, "draws": 0})
+        self.record = record
+        self.is_champion = data.get('is_champion', False)
+        self.rank = 999
+        self.total_damage_taken = 0
+        self.injury_months = data.get('injury_months', 0)
+        self.popularity = data.get('popularity', 10)
+        self.age = data.get('age', 25)
+        self.history = list(data.get('history', []))
+        self.annual_stats = data.get('annual_stats', {'wins': 0, 'finishes': 0})
+
+        # Same squashed ranking init as Fighter
+        raw_score = (record['wins'] * 50) - (record['losses'] * 10)
+        self.ranking_score = data.get('ranking_score', min(raw_score, 1500))
+        if self.is_champion: self.ranking_score = 2000
+
+    @property
+    def record(self): return _ColumnDict(self._store, self._row, RECORD_KEYS)
+    @record.setter
+    def record(self, value):
+        for k, col in RECORD_KEYS.items(): self._store.cols[col][self._row] = value.get(k, 0)
+
+    @property
+    def annual_stats(self): return _ColumnDict(self._store, self._row, ANNUAL_KEYS)
+    @annual_stats.setter
+    def annual_stats(self, value):
+        for k, col in ANNUAL_KEYS.items(): self._store.cols[col][self._row] = value.get(k, 0)
+
+    @property
+    def stats(self): return {k: getattr(self, k) for k in STAT_COLUMNS}
+
+    def to_dict(self, include_history=True):
+        data = {
+            "id": self.id, "name": self.name, "nickname": self.nickname, "weight_class": self.weight_class,
+            "stats": self.stats, "traits": list(self.traits), "record": self.record.to_dict(), "is_champion": self.is_champion,
+            "injury_months": self.injury_months, "popularity": self.popularity, "age": self.age,
+            "ranking_score": self.ranking_score,
+            "annual_stats": self.annual_stats.to_dict()
+        }
+        if include_history: data["history"] = list(self.history)
+        return data
+
+    scout_score = Fighter.scout_score
+    get_scout_grade = Fighter.get_scout_grade
+
+for _name in STAT_COLUMNS + ["popularity", "ranking_score", "age", "injury_months"]:
+    setattr(CompactFighter, _name, _column_property(_name))
@@ -0,0 +1,319 @@
+import random
+from collections import Counter
+from types import SimpleNamespace
+
+from game_logic import UPDATE_RECORDS, CARD_SLOTS_KEYS, generate_post_fight_news
+from history import count_against
+from traits import trait_mods
+import metrics
+
+# --- COMMENTARY ENGINE ---
+COMMENTARY_DB = {
+    "strike_light": ["lands a jab.", "pops the jab.", "connects with a quick left.", "touches them with a right.", "lands a glancing blow.", "nice 1-2 combo."],
+    "leg_kick": ["CHOPS the leg!", "lands a heavy leg kick.", "invests in a low kick.", "kicks the lead leg.", "that leg kick echoed!"],
+    "body_shot": ["digs to the body!", "lands a knee to the ribs.", "rips a left hook to the liver.", "teep kick to the gut."],
+    "strike_heavy": ["HUGE RIGHT HAND!", "LANDS A BOMB!", "BIG KNEE TO THE HEAD!", "HEAD KICK CONNECTS!", "THEY ARE WOBBLED!", "CRUSHING overhand!", "massive elbow!"],
+    "knockdown": ["OH! HE DROPPED HIM!", "DOWN GOES THE OPPONENT!", "A HUGE KNOCKDOWN!", "HE'S HURT BADLY!"],
+    "takedown": ["shoots and SCORES the double leg.", "trips them to the mat.", "beautiful blast double leg.", "dumps them on their head!", "drags them down."],
+    "takedown_stuff": ["stuffs the takedown.", "shrugs them off.", "nice sprawl.", "defends the shot easily."],
+    "ko": ["OUT COLD!", "FACE PLANT!", "IT IS ALL OVER!", "JUST LIKE THAT!", "SENT TO THE SHADOW REALM!"],
+    "sub": ["HE TAPS! HE TAPS!", "IT IS TIGHT! IT'S OVER!", "GOES TO SLEEP!", "GETS THE SUBMISSION!"]
+}
+
+def get_commentary(category, rng=random): return rng.choice(COMMENTARY_DB[category])
+
+# Bump whenever simulate_fight consumes random numbers differently, old records then can't be replayed
+ENGINE_VERSION = 2
+SNAPSHOT_KEYS = ["name", "striking", "grappling", "tdd", "sub_off", "sub_def", "chin", "cardio", "is_champion", "ranking_score", "popularity", "age", "traits"]
+COMMIT_KEYS = ["striking", "grappling", "tdd", "chin", "is_champion", "ranking_score", "popularity"]  # what a bout can change
+
+# --- FIGHT ENGINE ---
+# Headless: no sleeps, no Tk. Every commentary line goes to sink(kind, text) where kind is one of
+# "intro", "round", "status", "action", "scorecard", "result" or "note" so consumers can pace or filter.
+def simulate_fight(f1, f2, is_main=False, slot_name="", event_name="", sink=None, rng=random, update_records=UPDATE_RECORDS, fight_id=None):
+    def emit(kind, text):
+        if sink: sink(kind, text)
+
+    is_title = is_main and (f1.is_champion or f2.is_champion)
+    if f2.is_champion and not f1.is_champion: f1, f2 = f2, f1
+    rounds = 5 if is_title or is_main else 3
+    emit("intro", f"\n>> {f1.name} vs {f2.name} <<")
+
+    # Traits are compiled to plain numbers once per fight, see traits.py
+    fighters = {
+        f1.name: {"obj": f1, "mods": trait_mods(f1), "stamina": 100, "damage_head": 0, "damage_legs": 0, "damage_body": 0, "is_gassed": False, "total_damage_dealt": 0},
+        f2.name: {"obj": f2, "mods": trait_mods(f2), "stamina": 100, "damage_head": 0, "damage_legs": 0, "damage_body": 0, "is_gassed": False, "total_damage_dealt": 0}
+    }
+    m1 = fighters[f1.name]["mods"]; m2 = fighters[f2.name]["mods"]
+    red_share = m1.volume / (m1.volume + m2.volume)
+
+    judge_scores = [[0,0] for _ in range(3)]
+    winner = None; method = "Decision"; finish_round = 0; fight_stars = 2; damage_exchanged = 0
+
+    for r in range(1, rounds+1):
+        emit("round", f"🔔 R{r}...")
+        r_stats = {f1.name: 0, f2.name: 0}; knockdown_scored = {f1.name: False, f2.name: False}
+        for fname, state in fighters.items():
+            rec = (10 + (state["obj"].cardio * 0.1)) * state["mods"].recovery
+            state["stamina"] = min(100, state["stamina"] + rec)
+            if state["stamina"] < 40:
+                state["is_gassed"] = True
+                emit("status", f"⚠️ {fname} looks EXHAUSTED!")
+
+        for _ in range(5):
+            att_name = f1.name if rng.random() < red_share else f2.name
+            def_name = f2.name if att_name == f1.name else f1.name
+            att = fighters[att_name]; defe = fighters[def_name]
+            am = att["mods"]; dm = defe["mods"]
+            att_skill_pen = (0.6 if att["is_gassed"] else 1.0) * am.round_scale[r - 1]; def_skill_pen = (0.6 if defe["is_gassed"] else 1.0) * dm.round_scale[r - 1]
+            att["stamina"] -= 8
+
+            if att["obj"].grappling > att["obj"].striking:
+                off = att["obj"].grappling * att_skill_pen; defn = defe["obj"].tdd * def_skill_pen
+                if defe["damage_legs"] > 30: defn -= 15
+                if off + am.takedown + rng.randint(-20, 20) > defn:
+                    emit("action", f"  > {att_name} {get_commentary('takedown', rng)}")
+                    r_stats[att_name] += 10; att["stamina"] -= 5; att["total_damage_dealt"] += 5
+                    if att["obj"].sub_off + am.submission + rng.randint(0,20) > defe["obj"].sub_def + 30:
+                        winner = att["obj"]; method = "SUBMISSION"; finish_round = r
+                        emit("action", f"  > {get_commentary('sub', rng)}"); break
+                else:
+                    emit("action", f"  > {att_name} shoots... {get_commentary('takedown_stuff', rng)}")
+                    att["stamina"] -= 12
+            else:
+                off = att["obj"].striking * att_skill_pen; defn = defe["obj"].striking * def_skill_pen
+                if off + am.accuracy + rng.randint(-20, 20) > defn:
+                    roll = rng.randint(1, 10)
+                    damage_val = 0
+                    if roll <= 2:
+                        emit("action", f"  > {att_name} {get_commentary('leg_kick', rng)}")
+                        defe["damage_legs"] += 15 * am.damage; r_stats[att_name] += 5; damage_val = 5
+                    elif roll <= 4:
+                        emit("action", f"  > {att_name} {get_commentary('body_shot', rng)}")
+                        defe["damage_body"] += 15 * am.damage; defe["stamina"] -= 15 * am.damage; r_stats[att_name] += 8; damage_val = 8
+                    elif roll <= 8:
+                        emit("action", f"  > {att_name} {get_commentary('strike_light', rng)}")
+                        defe["damage_head"] += 8 * am.damage; r_stats[att_name] += 5; damage_val = 5
+                    else:
+                        emit("action", f"  > {att_name} {get_commentary('strike_heavy', rng)}")
+                        defe["damage_head"] += 20 * am.damage; r_stats[att_name] += 15; damage_val = 20
+                        damage_exchanged += 20
+                        chin_stat = defe["obj"].chin * dm.chin - (defe["damage_head"] * 0.5) - am.power
+                        if rng.randint(0, 100) > chin_stat:
+                            winner = att["obj"]; method = "KNOCKOUT"; finish_round = r
+                            emit("action", f"  > {get_commentary('ko', rng)}"); break
+                        if rng.randint(0, 100) > (chin_stat + 15):
+                            emit("action", f"  > {get_commentary('knockdown', rng)}")
+                            r_stats[att_name] += 20; knockdown_scored[att_name] = True
+                            if am.finish and rng.random() < am.finish:
+                                winner = att["obj"]; method = "KNOCKOUT"; finish_round = r
+                                emit("action", f"  > {att_name} swarms and finishes it! {get_commentary('ko', rng)}"); break
+                    att["total_damage_dealt"] += damage_val
+        if winner: break
+
+        s1 = r_stats[f1.name]; s2 = r_stats[f2.name]
+        for j in range(3):
+             variance = rng.randint(-2, 2)
+             j_s1 = s1 + variance; j_s2 = s2
+             if j_s1 > j_s2: p1 = 10; p2 = 8 if knockdown_scored[f1.name] or (j_s1 - j_s2 > 25) else 9
+             elif j_s2 > j_s1: p2 = 10; p1 = 8 if knockdown_scored[f2.name] or (j_s2 - j_s1 > 25) else 9
+             else: p1 = 10; p2 = 10
+             judge_scores[j][0] += p1; judge_scores[j][1] += p2
+
+    if not winner:
+        finish_round = rounds
+        votes_f1 = 0; votes_f2 = 0
+        for s in judge_scores:
+            if s[0] > s[1]: votes_f1 += 1
+            elif s[1] > s[0]: votes_f2 += 1
+        if votes_f1 > votes_f2: winner = f1; method = "DECISION" if votes_f2 == 0 else "SPLIT DECISION"
+        elif votes_f2 > votes_f1: winner = f2; method = "DECISION" if votes_f1 == 0 else "SPLIT DECISION"
+        else:
+            if fighters[f1.name]["total_damage_dealt"] > fighters[f2.name]["total_damage_dealt"]: winner = f1; method = "SPLIT DECISION"
+            else: winner = f2; method = "SPLIT DECISION"
+        emit("scorecard", f"\n📝 OFFICIAL SCORECARDS:")
+        for i, s in enumerate(judge_scores):
+            j_res = f1.name if s[0] > s[1] else (f2.name if s[1] > s[0] else "Draw")
+            emit("scorecard", f"   Judge {i+1}: {s[0]} - {s[1]} ({j_res})")
+
+    loser = f2 if winner == f1 else f1
+    emit("result", f"🏆 {winner.name} via {method}")
+
+    if method == "KNOCKOUT": fight_stars += 2
+    elif method == "SUBMISSION": fight_stars += 1
+    if finish_round == 1: fight_stars += 1
+    if damage_exchanged > 100: fight_stars += 1
+    if damage_exchanged < 30 and "DECISION" in method: fight_stars -= 1
+    if is_title: fight_stars += 1
+    fight_stars = max(1, min(5, fight_stars))
+
+    new_champ = False; still_champ = False
+    if is_title:
+        if winner.is_champion: emit("result", "👑 AND STILL!"); still_champ = True
+        else: emit("result", "👑 AND NEW!"); new_champ = True; winner.is_champion = True; loser.is_champion = False
+
+    if update_records:
+        winner.record['wins'] += 1; loser.record['losses'] += 1
+        winner.annual_stats['wins'] += 1
+        if method in ["KNOCKOUT", "SUBMISSION"]: winner.annual_stats['finishes'] += 1
+
+        points_gained = 150
+        if winner.ranking_score < loser.ranking_score:
+            diff = loser.ranking_score - winner.ranking_score
+            upset_bonus = int(diff * 0.40)
+            points_gained += upset_bonus
+            emit("note", f"🚀 RANKINGS: Upset! {winner.name} takes {upset_bonus} bonus points!")
+
+        if method in ["KNOCKOUT", "SUBMISSION"]: points_gained += 50
+        winner.ranking_score += points_gained
+        loss_penalty = 50
+        if loser.ranking_score > 1000: loss_penalty = 150
+        if loser.ranking_score > 2000: loss_penalty = 300
+        loser.ranking_score = max(0, loser.ranking_score - loss_penalty)
+
+        if winner.popularity < 90: winner.popularity += rng.randint(1, 3)
+        if winner.age < 28 and rng.randint(1,100) < 50:
+            stat = rng.choice(["striking", "grappling", "tdd"])
+            curr = getattr(winner, stat)
+            if curr < 95: setattr(winner, stat, curr + 1); emit("note", f"📈 DEVELOPMENT: {winner.name} improved {stat} (+1)!")
+        if method == "KNOCKOUT":
+            loser.chin -= 1
+            emit("note", f"📉 DAMAGE: {loser.name}'s chin degraded (-1).")
+
+        # Scorecards and commentary are not stored, they are regenerated from the fight record on demand
+        winner.history.append({"result": "Win", "opponent": loser.name, "method": method, "round": finish_round, "event": event_name, "fight_id": fight_id})
+        loser.history.append({"result": "Loss", "opponent": winner.name, "method": method, "round": finish_round, "event": event_name, "fight_id": fight_id})
+
+    return {"slot": slot_name, "winner": winner.name, "loser": loser.name, "method": method, "round": finish_round, "title_fight": is_title, "new_champ": new_champ, "still_champ": still_champ, "stars": fight_stars, "scores": judge_scores}
+
+# --- CARD ENGINE ---
+# Runs a full card (slot -> [f1, f2]) prelims first, settles the awards and PPV economics and
+# archives the event in game_data. Returns the archived event dict. Pass a RankingIndex to have
+# it re-file just the two fighters after each bout.
+#
+# Bouts are simulated on snapshots (like replays) and committed to the real fighters in card order.
+# Every bout's seed and fight id are fixed up front, so with an executor (thread or process pool)
+# the independent bouts run concurrently and the outcome is the same as running them inline.
+# A double-booked fighter's later bouts are simulated at commit time, after their earlier ones.
+def simulate_bout(task):
+    # Worker side: task = (red snapshot, blue snapshot, is_main, slot, event name, seed, fight id)
+    red, blue, is_main, slot, event_name, seed, fight_id = task
+    a = _rebuild(red); b = _rebuild(blue); lines = []
+    res = simulate_fight(a, b, is_main, slot, event_name, sink=lambda kind, text: lines.append((kind, text)),
+                         rng=random.Random(seed), update_records=UPDATE_RECORDS, fight_id=fight_id)
+    return res, _outcome(a), _outcome(b), lines
+
+def _outcome(ns):
+    return {"snap": snapshot_fighter(ns), "record": ns.record, "annual_stats": ns.annual_stats, "history": ns.history}
+
+def _commit(f, outcome):
+    # The snapshot started from f's pre-fight values, so its final values are f's post-fight values
+    for k in COMMIT_KEYS: setattr(f, k, outcome["snap"][k])
+    for k, v in outcome["record"].items(): f.record[k] += v
+    for k, v in outcome["annual_stats"].items(): f.annual_stats[k] += v
+    for entry in outcome["history"]: f.history.append(entry)
+
+def run_card(card, roster, game_data, sink=None, rng=random, fight_sink=None, rankings=None, executor=None):
+    def emit(kind, text):
+        if sink: sink(kind, text)
+    if fight_sink is None: fight_sink = sink
+
+    event_name = game_data.get_event_name()
+    event_results = []
+    total_card_stars = 0
+    main_event_pop = 0
+    best_fight_name = "None"; max_stars = 0; best_fight = ()
+    potn_name = "None"; fastest_win = 999; potn = None
+
+    slots = list(reversed(CARD_SLOTS_KEYS))
+    seeds = [rng.getrandbits(32) for _ in slots]
+    first_id = game_data.next_fight_id
+    bookings = Counter(id(f) for slot in slots for f in card[slot])
+    def task(i):
+        f1, f2 = card[slots[i]]
+        return (snapshot_fighter(f1), snapshot_fighter(f2), slots[i] == "Main Event", slots[i], event_name, seeds[i], first_id + i)
+    independent = [i for i, slot in enumerate(slots) if all(bookings[id(f)] == 1 for f in card[slot])]
+    if executor is not None:
+        pending = {i: executor.submit(simulate_bout, task(i)) for i in independent}
+    else:
+        pending = {}
+
+    for i, slot in enumerate(slots):
+        f1, f2 = card[slot]
+        is_main = (slot == "Main Event")
+        if is_main: main_event_pop = (f1.popularity + f2.popularity)
+
+        fights_against = count_against(f1.history, f2.name)
+        if fights_against > 0:
+            emit("note", f"⚔️ RIVALRY ALERT: This is fight #{fights_against+1} between them!")
+
+        # Each fight gets its own seeded RNG so it can be replayed later from a compact record
+        bout = task(i)
+        fight_id = game_data.add_fight_record(seeds[i], ENGINE_VERSION, bout[0], bout[1], is_main, slot, event_name)
+        with metrics.span("card.simulate"):
+            res, out1, out2, lines = pending.pop(i).result() if i in pending else simulate_bout(bout)
+        with metrics.span("card.commentary"):
+            for kind, text in lines:
+                if fight_sink: fight_sink(kind, text)
+        metrics.count("card.fights"); metrics.count("card.commentary_lines", len(lines))
+        with metrics.span("card.commit"):
+            _commit(f1, out1); _commit(f2, out2)
+        winner, loser = (f1, f2) if res['winner'] == f1.name else (f2, f1)
+        if res['stars'] > max_stars or (res['stars'] == max_stars and is_main):
+            max_stars = res['stars']; best_fight_name = f"{res['winner']} vs {res['loser']}"; best_fight = (winner, loser)
+        if res['method'] in ["KNOCKOUT", "SUBMISSION"]:
+            if res['round'] < fastest_win: fastest_win = res['round']; potn_name = res['winner']; potn = winner
+        with metrics.span("card.post_fight"):
+            if rankings is not None: rankings.update(winner); rankings.update(loser)
+            generate_post_fight_news(winner, loser, res['method'], game_data)
+            game_data.stats.record_fight(res, winner, loser, event_name, game_data.get_date_str())
+        total_card_stars += res['stars']
+        res.pop('scores'); res['fight_id'] = fight_id
+        event_results.append(res)
+
+    if UPDATE_RECORDS:
+        # The award winners themselves, not everyone whose name matches
+        if potn is not None: potn.popularity += 5
+        for f in best_fight: f.popularity += 5
+
+    avg_stars = total_card_stars / len(CARD_SLOTS_KEYS)
+    base_buys = 100000
+    pop_buys = main_event_pop * 4000
+    quality_bonus = avg_stars * 25000
+    total_buys = int(base_buys + pop_buys + quality_bonus + rng.randint(-20000, 20000))
+    event_rating = int(avg_stars)
+    if event_rating < 1: event_rating = 1
+    if event_rating > 5: event_rating = 5
+
+    emit("summary", "\n" + "="*30)
+    emit("summary", f"💰 PPV BUYS: {total_buys:,}")
+    emit("summary", f"⭐ EVENT RATING: {event_rating}/5 Stars")
+    emit("summary", f"⚔️ FIGHT OF THE NIGHT: {best_fight_name}")
+    emit("summary", f"⚡ PERFORMANCE OF THE NIGHT: {potn_name}")
+    emit("summary", "="*30)
+
+    awards = {"fotn": best_fight_name, "potn": potn_name}
+    game_data.archive_event(event_name, game_data.get_date_str(), event_results, total_buys, event_rating, awards)
+    return game_data.event_history[-1]
+
+# --- FIGHT REPLAY ---
+def snapshot_fighter(f):
+    snap = {k: getattr(f, k) for k in SNAPSHOT_KEYS}
+    snap["traits"] = list(f.traits)
+    return snap
+
+def _rebuild(snap):
+    return SimpleNamespace(**snap, record={"wins": 0, "losses": 0, "draws": 0}, annual_stats={'wins': 0, 'finishes': 0}, history=[])
+
+def replay_fight(record, sink=None):
+    # Re-runs the fight on throwaway copies of the pre-fight snapshots with the recorded seed,
+    # reproducing the exact commentary, scorecards and post-fight notes of the original.
+    if record['engine_version'] != ENGINE_VERSION:
+        raise ValueError(f"Fight {record['id']} was recorded with engine v{record['engine_version']}, can't replay with v{ENGINE_VERSION}")
+    return simulate_fight(_rebuild(record['red']), _rebuild(record['blue']), record['is_main'], record['slot'], record['event'],
+                          sink=sink, rng=random.Random(record['seed']), update_records=True, fight_id=record['id'])
+
+def replay_play_by_play(record):
+    lines = []
+    result = replay_fight(record, sink=lambda kind, text: lines.append(text))
+    return result, lines
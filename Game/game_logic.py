@@ -0,0 +1,450 @@
+import bisect
+import itertools
+import json
+import os
+import random
+from operator import attrgetter
+
+import numpy as np
+
+from career_stats import CareerStats
+from importer import SOURCES, import_world
+from news import NewsFeed, news_category
+from rankings import RankingIndex
+from registry import RosterRegistry
+from storage import get_store
+from traits import injury_chance_ceiling, trait_mods
+import metrics
+
+# --- CONFIGURATION ---
+UPDATE_RECORDS = True
+ROSTER_DB = 'roster.db'
+
+# --- CONSTANTS ---
+WEIGHT_CLASSES = ["Heavyweight", "Light Heavyweight", "Middleweight", "Welterweight", 
+                  "Lightweight", "Featherweight", "Bantamweight", "Flyweight"]
+MONTHS = ["JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"]
+CARD_SLOTS_KEYS = ["Main Event", "Co-Main", "Main Card 3", "Main Card 4", "Main Card 5", "Prelim 1", "Prelim 2", "Prelim 3"]
+
+# Name Database (For random regens)
+FIRST_NAMES = ["Mike", "Joe", "Kevin", "Liam", "Thiago", "Magomed", "Khabib", "Conor", "Dustin", "Max", "Israel", "Kamaru", "Jorge", "Nate", "Nick", "Sean", "Justin", "Charles", "Francis", "Stipe", "Ciryl", "Tom", "Paddy", "Ian", "Shavkat", "Islam", "Alex", "Glover", "Jan", "Jiri", "Jamahal", "Aljamain", "Merab", "Cory", "Petr", "Henry", "Deiveson", "Brandon", "Kai", "Amir", "Movsar", "Ilia", "Arman", "Beneil", "Rafael", "Gilbert", "Belal", "Colby", "Robert", "Jared", "Paulo", "Marvin", "Dricus", "Khamzat", "Bo", "Raul"]
+LAST_NAMES = ["Smith", "Silva", "Johnson", "Jones", "Pereira", "Oliveira", "Magomedov", "Nurmagomedov", "McGregor", "Poirier", "Holloway", "Adesanya", "Usman", "Masvidal", "Diaz", "O'Malley", "Gaethje", "Ngannou", "Miocic", "Gane", "Aspinall", "Pimblett", "Garry", "Rakhmonov", "Makhachev", "Teixeira", "Blachowicz", "Prochazka", "Hill", "Sterling", "Dvalishvili", "Sandhagen", "Yan", "Cejudo", "Figueiredo", "Moreno", "Kara-France", "Albazi", "Evloev", "Topuria", "Tsarukyan", "Dariush", "Fiziev", "Burns", "Muhammad", "Covington", "Whittaker", "Cannonier", "Costa", "Vettori", "Du Plessis", "Chimaev", "Nickal", "Rosas"]
+NICKNAMES = ["The Eraser", "The Eagle", "Notorious", "Diamond", "Blessed", "Stylebender", "Nigerian Nightmare", "Gamebred", "Suga", "Highlight", "Predator", "Bon Gamin", "The Baddy", "The Future", "Nomad", "Poatan", "Polish Power", "Samurai", "Sweet Dreams", "Funk Master", "The Machine", "Sandman", "No Mercy", "The Messenger", "God of War", "Assassin Baby", "Don't Blink", "The Prince", "Matador", "Ahalkalakets", "Benny", "Ataman", "Durinho", "Remember the Name", "Chaos", "The Reaper", "Killa Gorilla", "The Italian Dream", "Stillknocks", "Borz"]
+
+# --- GAME LOGIC CLASSES ---
+class GameData:
+    def __init__(self, news_archive=None, promotion="UFC"):
+        self.promotion = promotion # names the events, see promotions.py for several side by side
+        self.month_index = 0
+        self.year = 2012
+        self.event_number = 142
+        self.news = NewsFeed(archive_path=news_archive) # bounded, newest items in memory (see news.py)
+        self.event_history = []
+        self.spawned_legends = [] # Track names of prospects already spawned
+        self._spawned_set = set()  # same names, rebuilt if spawned_legends is replaced (e.g. loading a save)
+        self.prospect_cursor = (None, 0) # (prospect index generation, position already processed)
+        self.fight_records = {} # fight_id -> seed + pre-fight snapshots, see fight_engine.replay_fight
+        self.next_fight_id = 1
+        self.stats = CareerStats() # records, leaderboards and lineages, updated as results come in
+        
+    def is_spawned(self, name):
+        if len(self._spawned_set) != len(self.spawned_legends): self._spawned_set = set(self.spawned_legends)
+        return name in self._spawned_set
+
+    def mark_spawned(self, name):
+        self.is_spawned(name)
+        self.spawned_legends.append(name); self._spawned_set.add(name)
+
+    def get_date_str(self): return f"{MONTHS[self.month_index]} {self.year}"
+    def get_event_name(self): return f"{self.promotion} {self.event_number}"
+
+    def advance_time(self):
+        self.month_index += 1
+        self.event_number += 1
+        if self.month_index > 11:
+            self.month_index = 0
+            self.year += 1
+            
+    def add_news(self, message, fighters=()):
+        date = self.get_date_str()
+        self.news.add(f"[{date}] {message}", [f.name for f in fighters], category=news_category(message))
+        metrics.count("news.items")
+
+    def add_news_many(self, items):
+        # add_news() for a batch of (message, fighter, category), e.g. a month's injuries. The category
+        # is passed in since the caller knows it, None works it out from the message like add_news().
+        date = self.get_date_str()
+        added = self.news.add_many((f"[{date}] {message}", (f.name,), category or news_category(message)) for message, f, category in items)
+        metrics.count("news.items", added)
+
+    def add_fight_record(self, seed, engine_version, red, blue, is_main, slot, event_name):
+        fight_id = self.next_fight_id
+        self.next_fight_id += 1
+        self.fight_records[fight_id] = {"id": fight_id, "seed": seed, "engine_version": engine_version, "red": red, "blue": blue,
+                                        "is_main": is_main, "slot": slot, "event": event_name}
+        return fight_id
+
+    def archive_event(self, event_name, date_str, results_list, total_buys, event_rating, awards):
+        self.event_history.append({"name": event_name, "date": date_str, "buys": total_buys, "rating": event_rating, "results": results_list, "awards": awards})
+        self.stats.record_event(self.event_history[-1])
+
+_changes = itertools.count(1)
+UNSAVED_ATTRS = {"rank", "total_damage_taken", "changed"}  # not part of to_dict(), writing them doesn't dirty the fighter
+
+class Fighter:
+    # Every write to a saved attribute stamps the fighter with a new `changed` number, so a store only
+    # re-serializes fighters whose stamp moved since it last wrote them. In-place edits of record and
+    # annual_stats don't stamp; the engine always writes ranking_score alongside them.
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name not in UNSAVED_ATTRS: object.__setattr__(self, "changed", next(_changes))
+
+    def __init__(self, data):
+        self.id = data.get('id', 0)
+        self.name = data['name']
+        self.nickname = data.get('nickname', "")
+        self.weight_class = data['weight_class']
+        self.stats = data['stats']
+        self.striking = self.stats['striking']
+        self.grappling = self.stats['grappling']
+        self.tdd = self.stats['tdd']
+        self.sub_off = self.stats['sub_off']
+        self.sub_def = self.stats['sub_def']
+        self.chin = self.stats['chin']
+        self.cardio = self.stats['cardio']
+        
+        self.traits = data.get('traits', [])
+        self.record = data.get('record', {"wins": 0, "losses": 0, "draws": 0})
+        self.is_champion = data.get('is_champion', False)
+        self.rank = 999 
+        self.total_damage_taken = 0
+        self.injury_months = data.get('injury_months', 0)
+        self.popularity = data.get('popularity', 10)
+        self.age = data.get('age', 25)
+        self.history = data.get('history', []) # list, or a lazy FightHistory when loaded from a store (see history.py)
+        
+        self.annual_stats = data.get('annual_stats', {'wins': 0, 'finishes': 0})
+        
+        # Rankings Init (Squashed)
+        raw_score = (self.record['wins'] * 50) - (self.record['losses'] * 10)
+        self.ranking_score = data.get('ranking_score', min(raw_score, 1500))
+        if self.is_champion: self.ranking_score = 2000
+
+    def to_dict(self, include_history=True):
+        data = {
+            "id": self.id, "name": self.name, "nickname": self.nickname, "weight_class": self.weight_class,
+            "stats": {"striking": self.striking, "grappling": self.grappling, "tdd": self.tdd, "sub_off": self.sub_off, "sub_def": self.sub_def, "chin": self.chin, "cardio": self.cardio},
+            "traits": self.traits, "record": self.record, "is_champion": self.is_champion,
+            "injury_months": self.injury_months, "popularity": self.popularity, "age": self.age,
+            "ranking_score": self.ranking_score,
+            "annual_stats": self.annual_stats
+        }
+        if include_history: data["history"] = list(self.history)
+        return data
+    
+    def scout_score(self):
+        avg_stat = (self.striking + self.grappling + self.tdd + self.chin + self.cardio) / 5
+        potential_bonus = 0
+        if self.age < 25: potential_bonus = 10
+        elif self.age < 29: potential_bonus = 5
+        elif self.age > 35: potential_bonus = -10
+        return avg_stat + potential_bonus
+
+    def get_scout_grade(self):
+        score = self.scout_score()
+        if score >= 95: return "A+"
+        if score >= 90: return "A"
+        if score >= 85: return "B+"
+        if score >= 80: return "B"
+        if score >= 75: return "C+"
+        if score >= 70: return "C"
+        if score >= 60: return "D"
+        return "F"
+
+def _roster_db_path():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(script_dir, ROSTER_DB)
+
+def load_starting_world(next_id=1):
+    # The SQLite store is the save file once it exists, the JSON files are only the starting world.
+    # Free agents always come from data/free_agents.json, minus anyone already signed.
+    registry = RosterRegistry(next_id=next_id)
+    store = get_store(_roster_db_path())
+    if not store.is_empty():
+        for data in store.load_records(): registry.add(Fighter(data))
+        sources = [s for s in SOURCES if s[1] == "free_agent"]
+    else: sources = SOURCES
+    import_world(registry, sources).log()
+    return registry
+
+def save_roster_objects(roster):
+    # Incremental: only changed fighters and new history entries are written, in one transaction
+    return get_store(_roster_db_path()).save(roster)
+
+def reset_roster_store():
+    get_store(_roster_db_path()).reset()
+
+def update_rankings_logic(roster):
+    # Full rebuild, only needed when loading a roster. Afterwards keep the returned index
+    # and call update()/sync() on it instead of re-ranking everyone.
+    return RankingIndex(roster)
+
+def new_fighter(registry, data):
+    # In the registry's compact columns if it has them (see compact.py), a plain Fighter otherwise
+    return registry.columns.add(data) if registry.columns is not None else Fighter(data)
+
+def generate_rookie(registry):
+    new_id = registry.allocate_id()
+    
+    f_name = random.choice(FIRST_NAMES); l_name = random.choice(LAST_NAMES)
+    full_name = f"{f_name} {l_name}"
+    nick = random.choice(NICKNAMES) if random.randint(0,1) else ""
+    wc = random.choice(WEIGHT_CLASSES)
+    
+    style = random.choice(["Striker", "Grappler", "Balanced"])
+    stats = {}
+    if style == "Striker":
+        stats = {"striking": random.randint(70, 88), "grappling": random.randint(50, 70), "tdd": random.randint(60, 80),
+                 "sub_off": random.randint(40, 60), "sub_def": random.randint(60, 75), "chin": random.randint(80, 95), "cardio": random.randint(70, 90)}
+        traits = ["Head Hunter"]
+    elif style == "Grappler":
+        stats = {"striking": random.randint(50, 70), "grappling": random.randint(75, 92), "tdd": random.randint(70, 85),
+                 "sub_off": random.randint(70, 90), "sub_def": random.randint(70, 90), "chin": random.randint(80, 95), "cardio": random.randint(75, 90)}
+        traits = ["Submission Magician"]
+    else:
+        stats = {"striking": random.randint(65, 82), "grappling": random.randint(65, 82), "tdd": random.randint(65, 80),
+                 "sub_off": random.randint(60, 80), "sub_def": random.randint(65, 80), "chin": random.randint(85, 95), "cardio": random.randint(75, 90)}
+        traits = ["Well Rounded"]
+        
+    data = {
+        "id": new_id, "name": full_name, "nickname": nick, "weight_class": wc,
+        "stats": stats, "traits": traits, "record": {"wins": 0, "losses": 0, "draws": 0},
+        "is_champion": False, "age": random.randint(19, 25), "popularity": random.randint(5, 15),
+        "injury_months": 0, "history": [], "annual_stats": {'wins': 0, 'finishes': 0}
+    }
+    return new_fighter(registry, data)
+
+# --- NEW DATA LOADING FUNCTIONS ---
+class ProspectIndex:
+    # data/prospects.json sorted by debut date, parsed once and re-read only when the file changes
+    def __init__(self, path):
+        self.path = path
+        self.mtime = None
+        self.generation = 0
+        self.prospects = []; self.keys = []
+
+    def refresh(self):
+        try: mtime = os.stat(self.path).st_mtime_ns
+        except OSError: mtime = None
+        if mtime == self.mtime: return
+        self.mtime = mtime; self.generation += 1
+        try:
+            with open(self.path, 'r') as f: data = json.load(f)
+        except (OSError, ValueError): data = []
+        self.prospects = sorted(data, key=lambda p: (p['debut_year'], p['debut_month']))
+        self.keys = [(p['debut_year'], p['debut_month']) for p in self.prospects]
+
+    def due(self, year, month_index):
+        # Number of prospects whose debut is on or before this month
+        return bisect.bisect_right(self.keys, (year, month_index))
+
+_prospect_index = None
+
+def get_prospect_index():
+    global _prospect_index
+    if _prospect_index is None:
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        _prospect_index = ProspectIndex(os.path.join(script_dir, 'data', 'prospects.json'))
+    _prospect_index.refresh()
+    return _prospect_index
+
+def process_monthly_events(registry, game_data):
+    roster = registry.roster
+    events_log = []
+    is_january = (game_data.month_index == 0)
+    is_december = (game_data.month_index == 11)
+    
+    if is_january:
+        game_data.add_news("🎆 HAPPY NEW YEAR! Contracts reviewed.")
+        events_log.append("Happy New Year!")
+
+    # 1. HISTORICAL SPAWNS (REAL FIGHTERS from prospects.json)
+    # Only prospects between the cursor and today's date need looking at, the rest already debuted
+    index = get_prospect_index()
+    generation, start = game_data.prospect_cursor
+    if generation != index.generation: start = 0
+    end = index.due(game_data.year, game_data.month_index)
+    game_data.prospect_cursor = (index.generation, max(start, end))
+    for prospect in index.prospects[start:end]:
+        if game_data.is_spawned(prospect['name']): continue
+        # Create the fighter
+        new_data = prospect.copy()
+        new_data['id'] = registry.allocate_id()
+        new_data['record'] = {"wins": 0, "losses": 0, "draws": 0}
+        new_data['is_champion'] = False
+        new_data['age'] = 22 # Generic debut age
+        new_data['injury_months'] = 0
+        new_data['popularity'] = 20
+        new_data['history'] = []
+        
+        debut = new_fighter(registry, new_data)
+        registry.add(debut, free_agent=True, front=True)
+        game_data.mark_spawned(prospect['name'])
+        game_data.add_news(f"🔥 PROSPECT ALERT: {debut.name} has made their pro debut and is now scountable!", (debut,))
+
+    # 2. SCOUTING REFRESH (Randoms)
+    if len(registry.free_agents) < 10:
+        num_new = random.randint(2, 4)
+        for _ in range(num_new):
+            fa = generate_rookie(registry)
+            registry.add(fa, free_agent=True)
+    
+    # 3. YEAR-END AWARDS (December)
+    if is_december:
+        best_fighter = None; max_wins = -1
+        best_rookie = None; max_rookie_wins = -1
+        
+        for f in roster:
+            w = f.annual_stats['wins']
+            if w > max_wins:
+                max_wins = w
+                best_fighter = f
+            if f.age <= 25 and w > max_rookie_wins:
+                max_rookie_wins = w
+                best_rookie = f
+            # Reset for next year
+            f.annual_stats = {'wins': 0, 'finishes': 0}
+            
+        msg = "🏆 AWARDS SEASON:\n"
+        if best_fighter: 
+            msg += f"Fighter of the Year: {best_fighter.name} ({max_wins} Wins)\n"
+            best_fighter.popularity += 10
+        if best_rookie: 
+            msg += f"Rookie of the Year: {best_rookie.name}"
+            best_rookie.popularity += 10
+        
+        game_data.add_news(msg, [f for f in (best_fighter, best_rookie) if f])
+
+    # 4-6. AGING, RETIREMENT, NARRATIVE EVENTS, INJURIES
+    # One batched pass: the month's rolls for the whole roster are drawn up front as arrays, from a
+    # generator seeded off `random` so random.seed() still fixes the month. The rules run column-wise
+    # and only the fighters something happened to are written back or get news. Prospects signed to
+    # fill a retirement gap start rolling next month.
+    fighters = list(roster); n = len(fighters)
+    if not n: return events_log
+    cols = RosterColumns(fighters, registry.columns)
+    rng = np.random.default_rng(random.getrandbits(64))
+    rolls = rng.integers(1, [[101], [1001], [501], [301], [101]], size=(5, n))  # regression, scandal, viral, camp switch, injury
+    chin = cols.get("chin", np.float64); injury = cols.get("injury_months")
+    retire = chin < 40
+    reasons = dict.fromkeys(np.flatnonzero(retire).tolist(), "Medical (Chin)")
+
+    if is_january:
+        age = cols.get("age") + 1
+        cols.set("age", np.arange(n), age)
+        old = np.flatnonzero((age >= 38) & (age < 42))
+        aged_out = age >= 42
+        aged_out[old] = [fighters[i].record['losses'] > fighters[i].record['wins'] for i in old.tolist()]
+        for i in np.flatnonzero(aged_out).tolist(): reasons.setdefault(i, "Age" if age[i] >= 42 else "Decline")
+        retire |= aged_out
+        regress = np.flatnonzero((age > 34) & ~aged_out & (rolls[0] <= 35))
+        picks = rng.integers(0, 3, len(regress)); regressed = np.zeros(len(regress), dtype=bool)
+        for pick, stat_hit in enumerate(("chin", "cardio", "striking")):
+            mine = np.flatnonzero(picks == pick); current = cols.get(stat_hit, idx=regress[mine])
+            hit = current > 50; regressed[mine[hit]] = True
+            cols.set(stat_hit, regress[mine[hit]], current[hit] - 3)
+        game_data.add_news_many((f"REGRESSION: {fighters[i].name} (-3 {('Chin', 'Cardio', 'Striking')[pick]}) due to age.", fighters[i], "REGRESSION")
+                                for i, pick in zip(regress[regressed].tolist(), picks[regressed].tolist()))
+
+    active = np.ones(n, dtype=bool)
+    retirees = [i for i in np.flatnonzero(retire).tolist() if not fighters[i].is_champion]
+    active[retirees] = False
+    # Removed in one pass, but the gap check sees each division as if retirees left one at a time:
+    # the ones still to come count as present
+    registry.remove_many([fighters[i] for i in retirees])
+    still_to_go = {}
+    for i in retirees: still_to_go[fighters[i].weight_class] = still_to_go.get(fighters[i].weight_class, 0) + 1
+    news = []
+    for i in retirees:
+        f = fighters[i]
+        still_to_go[f.weight_class] -= 1
+        news.append((f"👋 RETIREMENT: {f.name} has retired ({reasons[i]}).", f, "RETIREMENT"))
+        if registry.division_size(f.weight_class) + still_to_go[f.weight_class] < 10:
+            rookie = generate_rookie(registry)
+            registry.add(rookie)
+            news.append((f"✍️ AUTO-SIGNING: {game_data.promotion} signs prospect {rookie.name} to fill gap.", rookie, "AUTO-SIGNING"))
+    game_data.add_news_many(news)
+
+    # Random narrative events: 0.3% scandal, 1% viral, 1.67% camp switch. Applied a column at a time in
+    # the order they apply to one fighter: scandal, viral, camp switch.
+    scandal = active & (rolls[1] <= 3); viral = active & (rolls[2] <= 5); camp = active & (rolls[3] <= 5)
+    hit = np.flatnonzero(scandal | viral | camp)
+    gains = rng.integers(10, 21, len(hit)); swings = rng.integers(-3, 4, (len(hit), 2))
+    sc = scandal[hit]; vi = viral[hit]; ca = camp[hit]
+    popularity = cols.get("popularity", idx=hit)
+    popularity[sc] = np.maximum(0, popularity[sc] - 10)
+    popularity[vi] = np.minimum(100, popularity[vi] + gains[vi])
+    injury[hit[sc]] = 6
+    cols.set("injury_months", hit[sc], injury[hit[sc]])
+    cols.set("popularity", hit[sc | vi], popularity[sc | vi])
+    for k, stat in enumerate(("striking", "grappling")): cols.set(stat, hit[ca], cols.get(stat, idx=hit[ca]) + swings[ca, k])
+    news = []
+    for i, s, v, c, gain in zip(hit.tolist(), sc.tolist(), vi.tolist(), ca.tolist(), gains.tolist()):
+        f = fighters[i]
+        if s: news.append((f"💊 SCANDAL: {f.name} flagged by USADA! Suspended 6 months.", f, "SCANDAL"))
+        if v: news.append((f"📈 VIRAL: {f.name} blows up on social media! Popularity +{gain}.", f, "VIRAL"))
+        if c: news.append((f"CAMP SWITCH: {f.name} moves to a new gym.", f, "CAMP SWITCH"))
+    game_data.add_news_many(news)
+
+    # Injuries: the injured heal a month, everyone else rolls. Only rolls under the highest chance any
+    # trait allows need the fighter's own chance looked up.
+    healing = np.flatnonzero(active & (injury > 0))
+    cols.set("injury_months", healing, injury[healing] - 1)
+    game_data.add_news_many((f"MEDICAL: {fighters[i].name} cleared to fight.", fighters[i], "MEDICAL") for i in healing[injury[healing] == 1].tolist())
+    candidates = np.flatnonzero(active & (injury == 0) & (rolls[4] <= injury_chance_ceiling(2))).tolist()
+    injured = [i for i in candidates if rolls[4, i] <= (trait_mods(fighters[i]).injury_chance or 2)]
+    severity = rng.integers(1, 11, len(injured)).tolist()
+    lengths = zip(rng.integers(1, 3, len(injured)).tolist(), rng.integers(3, 6, len(injured)).tolist(), rng.integers(6, 13, len(injured)).tolist())
+    durations = []; news = []
+    for i, severity_roll, (minor, moderate, major) in zip(injured, severity, lengths):
+        if severity_roll <= 6: duration = minor; injury_type = "Minor Injury"
+        elif severity_roll <= 9: duration = moderate; injury_type = "Moderate Injury"
+        else: duration = major; injury_type = "Major Injury"
+        f = fighters[i]; durations.append(duration)
+        msg = f"INJURY: {f.name} suffered a {injury_type} ({duration} mo)."
+        news.append((msg, f, "INJURY"))
+        events_log.append(msg)
+    cols.set("injury_months", np.array(injured, dtype=np.int64), np.array(durations, dtype=np.int64))
+    game_data.add_news_many(news)
+    return events_log
+
+class RosterColumns:
+    # The month's roster as arrays, in roster order. Compact fighters (registry.columns, see compact.py)
+    # are read and written a whole column at a time, plain Fighters one attribute at a time.
+    def __init__(self, fighters, columns=None):
+        self.fighters = fighters; self.columns = columns
+        self.rows = columns.rows(fighters) if columns is not None else None
+
+    def get(self, key, dtype=np.int64, idx=None):
+        # key of every fighter, or of fighters[idx[k]]
+        if self.rows is not None: return self.columns.column(key)[self.rows if idx is None else self.rows[idx]].astype(dtype)
+        fighters = self.fighters if idx is None else [self.fighters[i] for i in idx.tolist()]
+        return np.fromiter(map(attrgetter(key), fighters), dtype=dtype, count=len(fighters))
+
+    def set(self, key, idx, values):
+        # values[k] for fighters[idx[k]]
+        if self.rows is not None: self.columns.column(key)[self.rows[idx]] = values; return
+        # Same as setattr() but with one change stamp for the whole batch, see Fighter.__setattr__
+        stamp = next(_changes); put = object.__setattr__
+        for i, v in zip(idx.tolist(), values.tolist()):
+            f = self.fighters[i]; put(f, key, v); put(f, "changed", stamp)
+
+def generate_post_fight_news(winner, loser, method, game_data):
+    chance = trait_mods(winner).hype_chance or 20
+    if random.randint(1, 100) <= chance:
+        target = "the Champion" if not winner.is_champion else "the #1 Contender"
+        msgs = [f"MIC SKILLS: {winner.name} demands a title shot!", f"CALLOUT: {winner.name} says {target} is ducking them!", f"POST-FIGHT: {winner.name} claims they are the GOAT."]
+        game_data.add_news(random.choice(msgs), (winner,))
+    if loser.age >= 36 and loser.record['losses'] >= 10:
+        if random.randint(1,100) <= 30: game_data.add_news(f"RUMOR: {loser.name} hints at retirement.", (loser,))
+    if method == "SPLIT DECISION": game_data.add_news(f"CONTROVERSY: Fans booing the decision in {winner.name} vs {loser.name}.", (winner, loser))
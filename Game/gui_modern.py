@@ -1,375 +1,44 @@
 import customtkinter as ctk
-from tkinter import ttk, messagebox
-import json
+from tkinter import ttk, messagebox, filedialog, TclError
 import os
-import random
+import queue
+import sqlite3
 import time
 import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from game_logic import (WEIGHT_CLASSES, CARD_SLOTS_KEYS, UPDATE_RECORDS, GameData, load_starting_world, save_roster_objects,
+                        update_rankings_logic, generate_rookie, process_monthly_events, reset_roster_store)
+from fight_engine import run_card, replay_play_by_play
+from predictor import predict_matchup, format_prediction
+from matchmaker import TIME_BUDGET, build_card, recently_booked
+from career_stats import LEADERBOARDS
+import metrics
+from registry import RosterRegistry, load_id_counter
+from savegame import save_game, load_game, saves_dir
+from history import history_page, count_against
+from roster_view import RosterTableModel, VirtualTable
+from virtual_list import VirtualList
 
 # --- CONFIGURATION ---
 ctk.set_appearance_mode("Dark")
 ctk.set_default_color_theme("dark-blue")
-UPDATE_RECORDS = True
 TEXT_SPEED = 1.0
-
-# --- CONSTANTS ---
-WEIGHT_CLASSES = ["Heavyweight", "Light Heavyweight", "Middleweight", "Welterweight", 
-                  "Lightweight", "Featherweight", "Bantamweight", "Flyweight"]
-MONTHS = ["JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"]
-CARD_SLOTS_KEYS = ["Main Event", "Co-Main", "Main Card 3", "Main Card 4", "Main Card 5", "Prelim 1", "Prelim 2", "Prelim 3"]
-
-# Name Database (For random regens)
-FIRST_NAMES = ["Mike", "Joe", "Kevin", "Liam", "Thiago", "Magomed", "Khabib", "Conor", "Dustin", "Max", "Israel", "Kamaru", "Jorge", "Nate", "Nick", "Sean", "Justin", "Charles", "Francis", "Stipe", "Ciryl", "Tom", "Paddy", "Ian", "Shavkat", "Islam", "Alex", "Glover", "Jan", "Jiri", "Jamahal", "Aljamain", "Merab", "Cory", "Petr", "Henry", "Deiveson", "Brandon", "Kai", "Amir", "Movsar", "Ilia", "Arman", "Beneil", "Rafael", "Gilbert", "Belal", "Colby", "Robert", "Jared", "Paulo", "Marvin", "Dricus", "Khamzat", "Bo", "Raul"]
-LAST_NAMES = ["Smith", "Silva", "Johnson", "Jones", "Pereira", "Oliveira", "Magomedov", "Nurmagomedov", "McGregor", "Poirier", "Holloway", "Adesanya", "Usman", "Masvidal", "Diaz", "O'Malley", "Gaethje", "Ngannou", "Miocic", "Gane", "Aspinall", "Pimblett", "Garry", "Rakhmonov", "Makhachev", "Teixeira", "Blachowicz", "Prochazka", "Hill", "Sterling", "Dvalishvili", "Sandhagen", "Yan", "Cejudo", "Figueiredo", "Moreno", "Kara-France", "Albazi", "Evloev", "Topuria", "Tsarukyan", "Dariush", "Fiziev", "Burns", "Muhammad", "Covington", "Whittaker", "Cannonier", "Costa", "Vettori", "Du Plessis", "Chimaev", "Nickal", "Rosas"]
-NICKNAMES = ["The Eraser", "The Eagle", "Notorious", "Diamond", "Blessed", "Stylebender", "Nigerian Nightmare", "Gamebred", "Suga", "Highlight", "Predator", "Bon Gamin", "The Baddy", "The Future", "Nomad", "Poatan", "Polish Power", "Samurai", "Sweet Dreams", "Funk Master", "The Machine", "Sandman", "No Mercy", "The Messenger", "God of War", "Assassin Baby", "Don't Blink", "The Prince", "Matador", "Ahalkalakets", "Benny", "Ataman", "Durinho", "Remember the Name", "Chaos", "The Reaper", "Killa Gorilla", "The Italian Dream", "Stillknocks", "Borz"]
-
-# --- COMMENTARY ENGINE ---
-COMMENTARY_DB = {
-    "strike_light": ["lands a jab.", "pops the jab.", "connects with a quick left.", "touches them with a right.", "lands a glancing blow.", "nice 1-2 combo."],
-    "leg_kick": ["CHOPS the leg!", "lands a heavy leg kick.", "invests in a low kick.", "kicks the lead leg.", "that leg kick echoed!"],
-    "body_shot": ["digs to the body!", "lands a knee to the ribs.", "rips a left hook to the liver.", "teep kick to the gut."],
-    "strike_heavy": ["HUGE RIGHT HAND!", "LANDS A BOMB!", "BIG KNEE TO THE HEAD!", "HEAD KICK CONNECTS!", "THEY ARE WOBBLED!", "CRUSHING overhand!", "massive elbow!"],
-    "knockdown": ["OH! HE DROPPED HIM!", "DOWN GOES THE OPPONENT!", "A HUGE KNOCKDOWN!", "HE'S HURT BADLY!"],
-    "takedown": ["shoots and SCORES the double leg.", "trips them to the mat.", "beautiful blast double leg.", "dumps them on their head!", "drags them down."],
-    "takedown_stuff": ["stuffs the takedown.", "shrugs them off.", "nice sprawl.", "defends the shot easily."],
-    "ko": ["OUT COLD!", "FACE PLANT!", "IT IS ALL OVER!", "JUST LIKE THAT!", "SENT TO THE SHADOW REALM!"],
-    "sub": ["HE TAPS! HE TAPS!", "IT IS TIGHT! IT'S OVER!", "GOES TO SLEEP!", "GETS THE SUBMISSION!"]
-}
-
-def get_commentary(category): return random.choice(COMMENTARY_DB[category])
-
-# --- GAME LOGIC CLASSES ---
-class GameData:
-    def __init__(self):
-        self.month_index = 0
-        self.year = 2012
-        self.event_number = 142
-        self.news_feed = [] 
-        self.event_history = []
-        self.free_agents = [] 
-        self.spawned_legends = [] # Track names of prospects already spawned
-        
-    def get_date_str(self): return f"{MONTHS[self.month_index]} {self.year}"
-    def get_event_name(self): return f"UFC {self.event_number}"
-
-    def advance_time(self):
-        self.month_index += 1
-        self.event_number += 1
-        if self.month_index > 11:
-            self.month_index = 0
-            self.year += 1
-            
-    def add_news(self, message):
-        date = self.get_date_str()
-        self.news_feed.insert(0, f"[{date}] {message}") 
-        
-    def archive_event(self, event_name, date_str, results_list, total_buys, event_rating, awards):
-        self.event_history.append({"name": event_name, "date": date_str, "buys": total_buys, "rating": event_rating, "results": results_list, "awards": awards})
-
-class Fighter:
-    def __init__(self, data):
-        self.id = data.get('id', 0)
-        self.name = data['name']
-        self.nickname = data.get('nickname', "")
-        self.weight_class = data['weight_class']
-        self.stats = data['stats']
-        self.striking = self.stats['striking']
-        self.grappling = self.stats['grappling']
-        self.tdd = self.stats['tdd']
-        self.sub_off = self.stats['sub_off']
-        self.sub_def = self.stats['sub_def']
-        self.chin = self.stats['chin']
-        self.cardio = self.stats['cardio']
-        
-        self.traits = data.get('traits', [])
-        self.record = data.get('record', {"wins": 0, "losses": 0, "draws": 0})
-        self.is_champion = data.get('is_champion', False)
-        self.rank = 999 
-        self.total_damage_taken = 0
-        self.injury_months = data.get('injury_months', 0)
-        self.popularity = data.get('popularity', 10)
-        self.age = data.get('age', 25)
-        self.history = data.get('history', []) 
-        
-        self.annual_stats = data.get('annual_stats', {'wins': 0, 'finishes': 0})
-        
-        # Rankings Init (Squashed)
-        raw_score = (self.record['wins'] * 50) - (self.record['losses'] * 10)
-        self.ranking_score = data.get('ranking_score', min(raw_score, 1500))
-        if self.is_champion: self.ranking_score = 2000
-
-    def to_dict(self):
-        return {
-            "id": self.id, "name": self.name, "nickname": self.nickname, "weight_class": self.weight_class,
-            "stats": {"striking": self.striking, "grappling": self.grappling, "tdd": self.tdd, "sub_off": self.sub_off, "sub_def": self.sub_def, "chin": self.chin, "cardio": self.cardio},
-            "traits": self.traits, "record": self.record, "is_champion": self.is_champion,
-            "injury_months": self.injury_months, "popularity": self.popularity, "age": self.age,
-            "history": self.history, "ranking_score": self.ranking_score,
-            "annual_stats": self.annual_stats
-        }
-    
-    def get_scout_grade(self):
-        avg_stat = (self.striking + self.grappling + self.tdd + self.chin + self.cardio) / 5
-        potential_bonus = 0
-        if self.age < 25: potential_bonus = 10
-        elif self.age < 29: potential_bonus = 5
-        elif self.age > 35: potential_bonus = -10
-        score = avg_stat + potential_bonus
-        if score >= 95: return "A+"
-        if score >= 90: return "A"
-        if score >= 85: return "B+"
-        if score >= 80: return "B"
-        if score >= 75: return "C+"
-        if score >= 70: return "C"
-        if score >= 60: return "D"
-        return "F"
-
-def load_roster_objects():
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(script_dir, 'roster.json')
-    try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-            roster = []
-            seen_names = set()
-            for fighter_data in data:
-                if fighter_data['name'] not in seen_names:
-                    roster.append(Fighter(fighter_data))
-                    seen_names.add(fighter_data['name'])
-            update_rankings_logic(roster)
-            return roster
-    except FileNotFoundError: return []
-
-def save_roster_objects(roster):
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(script_dir, 'roster.json')
-    data = [f.to_dict() for f in roster]
-    with open(file_path, 'w') as f: json.dump(data, f, indent=4)
-
-def update_rankings_logic(roster):
-    for div in WEIGHT_CLASSES:
-        div_roster = [f for f in roster if f.weight_class == div]
-        if not div_roster: continue
-        def sort_key(f):
-            if f.is_champion: return 999999
-            return f.ranking_score
-        div_roster.sort(key=sort_key, reverse=True)
-        rank_counter = 1
-        for f in div_roster:
-            if f.is_champion: f.rank = 0
-            else:
-                f.rank = rank_counter
-                rank_counter += 1
-
-def generate_rookie(roster_for_id):
-    max_id = 0
-    for f in roster_for_id:
-        if f.id > max_id: max_id = f.id
-    new_id = max_id + random.randint(1, 1000)
-    
-    f_name = random.choice(FIRST_NAMES); l_name = random.choice(LAST_NAMES)
-    full_name = f"{f_name} {l_name}"
-    nick = random.choice(NICKNAMES) if random.randint(0,1) else ""
-    wc = random.choice(WEIGHT_CLASSES)
-    
-    style = random.choice(["Striker", "Grappler", "Balanced"])
-    stats = {}
-    if style == "Striker":
-        stats = {"striking": random.randint(70, 88), "grappling": random.randint(50, 70), "tdd": random.randint(60, 80),
-                 "sub_off": random.randint(40, 60), "sub_def": random.randint(60, 75), "chin": random.randint(80, 95), "cardio": random.randint(70, 90)}
-        traits = ["Head Hunter"]
-    elif style == "Grappler":
-        stats = {"striking": random.randint(50, 70), "grappling": random.randint(75, 92), "tdd": random.randint(70, 85),
-                 "sub_off": random.randint(70, 90), "sub_def": random.randint(70, 90), "chin": random.randint(80, 95), "cardio": random.randint(75, 90)}
-        traits = ["Submission Magician"]
-    else:
-        stats = {"striking": random.randint(65, 82), "grappling": random.randint(65, 82), "tdd": random.randint(65, 80),
-                 "sub_off": random.randint(60, 80), "sub_def": random.randint(65, 80), "chin": random.randint(85, 95), "cardio": random.randint(75, 90)}
-        traits = ["Well Rounded"]
-        
-    data = {
-        "id": new_id, "name": full_name, "nickname": nick, "weight_class": wc,
-        "stats": stats, "traits": traits, "record": {"wins": 0, "losses": 0, "draws": 0},
-        "is_champion": False, "age": random.randint(19, 25), "popularity": random.randint(5, 15),
-        "injury_months": 0, "history": [], "annual_stats": {'wins': 0, 'finishes': 0}
-    }
-    return Fighter(data)
-
-# --- NEW DATA LOADING FUNCTIONS ---
-def load_free_agents_from_json(existing_roster_ids):
-    # Load Free Agents file
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    fa_path = os.path.join(script_dir, 'data', 'free_agents.json')
-    loaded_agents = []
-    
-    if os.path.exists(fa_path):
-        try:
-            with open(fa_path, 'r') as f:
-                data = json.load(f)
-                max_id = max(existing_roster_ids) if existing_roster_ids else 1000
-                for item in data:
-                    max_id += 1
-                    item['id'] = max_id
-                    loaded_agents.append(Fighter(item))
-        except Exception as e:
-            print(f"Error loading free_agents.json: {e}")
-    return loaded_agents
-
-def get_prospects_database():
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    p_path = os.path.join(script_dir, 'data', 'prospects.json')
-    if os.path.exists(p_path):
-        try:
-            with open(p_path, 'r') as f:
-                return json.load(f)
-        except: return []
-    return []
-
-def process_monthly_events(roster, game_data):
-    events_log = []
-    is_january = (game_data.month_index == 0)
-    is_december = (game_data.month_index == 11)
-    
-    if is_january:
-        game_data.add_news("🎆 HAPPY NEW YEAR! Contracts reviewed.")
-        events_log.append("Happy New Year!")
-
-    # 1. HISTORICAL SPAWNS (REAL FIGHTERS from prospects.json)
-    prospects_db = get_prospects_database()
-    for prospect in prospects_db:
-        if prospect['name'] in game_data.spawned_legends: continue
-        
-        # Check if debut date is passed
-        if game_data.year > prospect['debut_year'] or (game_data.year == prospect['debut_year'] and game_data.month_index >= prospect['debut_month']):
-            
-            # Create the fighter
-            max_id = 0
-            for f in roster + game_data.free_agents:
-                if f.id > max_id: max_id = f.id
-            
-            new_data = prospect.copy()
-            new_data['id'] = max_id + 1
-            new_data['record'] = {"wins": 0, "losses": 0, "draws": 0}
-            new_data['is_champion'] = False
-            new_data['age'] = 22 # Generic debut age
-            new_data['injury_months'] = 0
-            new_data['popularity'] = 20
-            new_data['history'] = []
-            
-            new_fighter = Fighter(new_data)
-            game_data.free_agents.insert(0, new_fighter) 
-            game_data.spawned_legends.append(prospect['name'])
-            game_data.add_news(f"🔥 PROSPECT ALERT: {new_fighter.name} has made their pro debut and is now scountable!")
-
-    # 2. SCOUTING REFRESH (Randoms)
-    if len(game_data.free_agents) < 10:
-        num_new = random.randint(2, 4)
-        for _ in range(num_new):
-            fa = generate_rookie(roster + game_data.free_agents)
-            game_data.free_agents.append(fa)
-    
-    # 3. YEAR-END AWARDS (December)
-    if is_december:
-        best_fighter = None; max_wins = -1
-        best_rookie = None; max_rookie_wins = -1
-        
-        for f in roster:
-            w = f.annual_stats['wins']
-            if w > max_wins:
-                max_wins = w
-                best_fighter = f
-            if f.age <= 25 and w > max_rookie_wins:
-                max_rookie_wins = w
-                best_rookie = f
-            # Reset for next year
-            f.annual_stats = {'wins': 0, 'finishes': 0}
-            
-        msg = "🏆 AWARDS SEASON:\n"
-        if best_fighter: 
-            msg += f"Fighter of the Year: {best_fighter.name} ({max_wins} Wins)\n"
-            best_fighter.popularity += 10
-        if best_rookie: 
-            msg += f"Rookie of the Year: {best_rookie.name}"
-            best_rookie.popularity += 10
-        
-        game_data.add_news(msg)
-
-    # 4. RETIREMENT
-    retirees = []
-    for f in roster:
-        should_retire = False; reason = ""
-        if is_january:
-            f.age += 1
-            if f.age >= 42: should_retire = True; reason = "Age"
-            elif f.age >= 38 and f.record['losses'] > f.record['wins']: should_retire = True; reason = "Decline"
-            if f.age > 34 and not should_retire:
-                if random.randint(1, 100) <= 35:
-                    stat_hit = random.choice(["chin", "cardio", "striking"])
-                    current_val = getattr(f, stat_hit)
-                    if current_val > 50:
-                        setattr(f, stat_hit, current_val - 3)
-                        game_data.add_news(f"REGRESSION: {f.name} (-3 {stat_hit.title()}) due to age.")
-        if f.chin < 40: should_retire = True; reason = "Medical (Chin)"
-        if should_retire and not f.is_champion: retirees.append((f, reason))
-        
-    for f, reason in retirees:
-        roster.remove(f)
-        game_data.add_news(f"👋 RETIREMENT: {f.name} has retired ({reason}).")
-        if len([x for x in roster if x.weight_class == f.weight_class]) < 10:
-            rookie = generate_rookie(roster)
-            roster.append(rookie)
-            game_data.add_news(f"✍️ AUTO-SIGNING: UFC signs prospect {rookie.name} to fill gap.")
-
-    # 5. RANDOM NARRATIVE EVENTS
-    for f in roster:
-        if random.randint(1, 1000) <= 3: 
-            f.injury_months = 6
-            f.popularity = max(0, f.popularity - 10)
-            game_data.add_news(f"💊 SCANDAL: {f.name} flagged by USADA! Suspended 6 months.")
-            
-        if random.randint(1, 500) <= 5: 
-            gain = random.randint(10, 20)
-            f.popularity = min(100, f.popularity + gain)
-            game_data.add_news(f"📈 VIRAL: {f.name} blows up on social media! Popularity +{gain}.")
-
-        if random.randint(1, 300) <= 5:
-            f.striking += random.randint(-3, 3)
-            f.grappling += random.randint(-3, 3)
-            game_data.add_news(f"CAMP SWITCH: {f.name} moves to a new gym.")
-
-    # 6. INJURIES
-    for f in roster:
-        if f.injury_months > 0:
-            f.injury_months -= 1
-            if f.injury_months == 0:
-                msg = f"MEDICAL: {f.name} cleared to fight."
-                game_data.add_news(msg)
-            continue 
-        chance = 2
-        if "Fragile" in f.traits: chance = 5
-        if "Hard to Kill" in f.traits: chance = 1
-        if random.randint(1, 100) <= chance:
-            severity_roll = random.randint(1, 10)
-            if severity_roll <= 6: duration = random.randint(1, 2); injury_type = "Minor Injury"
-            elif severity_roll <= 9: duration = random.randint(3, 5); injury_type = "Moderate Injury"
-            else: duration = random.randint(6, 12); injury_type = "Major Injury"
-            f.injury_months = duration
-            msg = f"INJURY: {f.name} suffered a {injury_type} ({duration} mo)."
-            game_data.add_news(msg)
-            events_log.append(msg)
-    return events_log
-
-def generate_post_fight_news(winner, loser, method, game_data):
-    chance = 20
-    if "Trash Talker" in winner.traits: chance = 70
-    if "Showman" in winner.traits: chance = 50
-    if random.randint(1, 100) <= chance:
-        target = "the Champion" if not winner.is_champion else "the #1 Contender"
-        msgs = [f"MIC SKILLS: {winner.name} demands a title shot!", f"CALLOUT: {winner.name} says {target} is ducking them!", f"POST-FIGHT: {winner.name} claims they are the GOAT."]
-        game_data.add_news(random.choice(msgs))
-    if loser.age >= 36 and loser.record['losses'] >= 10:
-        if random.randint(1,100) <= 30: game_data.add_news(f"RUMOR: {loser.name} hints at retirement.")
-    if method == "SPLIT DECISION": game_data.add_news(f"CONTROVERSY: Fans booing the decision in {winner.name} vs {loser.name}.")
+PLAYBACK_SPEEDS = {"Slow": 2.0, "Normal": 1.0, "Fast": 0.25, "Instant": 0}  # multiplier on PACING
+PACING = {"intro": 1.0, "round": 0.3, "action": 0.1}  # seconds to hold after a line of that kind
+INSTANT_KINDS = {"banner", "intro", "result", "summary", "month"}  # what instant mode still shows
+FRAME_MS = 33  # the live log redraws at most ~30 times a second
+MAX_LINES_PER_FRAME = 200
+CARD_WORKERS = 0  # >1 simulates a card's fights in a process pool. A bout is ~70us and shipping it to a worker costs more, so the pool only pays off with heavier engines
+LOG_PAGE_SIZE = 25  # fight log rows per page
+NEWS_PAGE_SIZE = 50
+PREDICTION_CACHE = 256  # matchup predictions kept, cleared when full
+# name -> (nav label, background, builder, refresh on visit). Only the dashboard is built at startup
+VIEWS = {"dashboard": ("DASHBOARD", "transparent", "build_dashboard_view", None),
+         "scouting": ("SCOUTING", "#1a1a1a", "build_scouting_view", "refresh_scouting_list"),
+         "history": ("EVENT HISTORY", "#1a1a1a", "build_history_view", "refresh_history_list"),
+         "news": ("NEWS & INBOX", "#1a1a1a", "build_news_view", "update_news_display"),
+         "records": ("RECORDS", "#1a1a1a", "build_records_view", "update_records_display")}
 
 # --- GUI CLASS ---
 class UFCGameGUI:
@@ -377,21 +46,27 @@ class UFCGameGUI:
         self.root = root
         self.root.title("UFC Matchmaker Pro 2012 (Legacy Edition)")
         self.root.geometry("1400x900")
-        self.roster = load_roster_objects()
-        self.game_data = GameData()
-        
-        # Load Free Agents (Real Ones First)
-        existing_ids = [f.id for f in self.roster]
-        real_fas = load_free_agents_from_json(existing_ids)
-        self.game_data.free_agents.extend(real_fas)
-        
-        # Fill rest with randoms if needed
-        while len(self.game_data.free_agents) < 5:
-            self.game_data.free_agents.append(generate_rookie(self.roster + self.game_data.free_agents))
+        self.started = time.perf_counter()
+        metrics.begin_event("startup")
+        # The window comes up with an empty roster, the real one loads in the background (start_loading)
+        self.registry = RosterRegistry()
+        self.roster = self.registry.roster
+        self.rankings = update_rankings_logic(self.roster)
+        self.news_slot = 0  # which of two news archive files the running career uses, see load_game_dialog
+        self.game_data = GameData(news_archive=self.news_archive_path(self.news_slot))
+        self.loading = True
+        self.unsaved = True  # the career has changed since it was last saved to (or loaded from) a .sav
         
         self.current_fights = {key: [None, None] for key in CARD_SLOTS_KEYS}
         self.selected_fighter_obj = None 
         self.selected_scout_obj = None
+        self.sim_running = False
+        self.card_pool = ProcessPoolExecutor(max_workers=CARD_WORKERS) if CARD_WORKERS > 1 else None
+        self.predictions = {}  # (id, changed) of both fighters -> predict_matchup() result, see update_prediction_panel
+        self.prediction_key = None
+        self.metrics_overlay = None
+        metrics.set_log(os.path.join(saves_dir(), 'metrics.jsonl'))  # one line per event while metrics are on
+        self.root.bind("<F12>", self.toggle_metrics_overlay)
 
         # HEADER
         self.header = ctk.CTkFrame(root, height=80, corner_radius=0, fg_color="#111")
@@ -400,62 +75,102 @@ class UFCGameGUI:
         self.lbl_event_title.pack(side="left", padx=25, pady=5)
         self.lbl_date = ctk.CTkLabel(self.header, text=self.game_data.get_date_str(), font=("Arial", 20, "bold"), text_color="#eee")
         self.lbl_date.pack(side="right", padx=25, pady=10)
+        ctk.CTkButton(self.header, text="LOAD", width=70, fg_color="#333", command=self.load_game_dialog).pack(side="right", padx=5)
+        ctk.CTkButton(self.header, text="SAVE", width=70, fg_color="#333", command=self.save_game_dialog).pack(side="right", padx=5)
+        self.lbl_loading = ctk.CTkLabel(self.header, text="Loading roster...", font=("Arial", 12), text_color="#aaa")
+        self.lbl_loading.pack(side="left", padx=(20, 5))
+        self.load_progress = ctk.CTkProgressBar(self.header, width=200)
+        self.load_progress.set(0); self.load_progress.pack(side="left")
 
         # NAV BAR
         self.nav_bar = ctk.CTkFrame(root, height=40, corner_radius=0, fg_color="#222")
         self.nav_bar.pack(fill="x", side="top")
-        self.btn_nav_dashboard = ctk.CTkButton(self.nav_bar, text="DASHBOARD", width=150, fg_color="#333", corner_radius=0, command=lambda: self.show_view("dashboard"))
-        self.btn_nav_dashboard.pack(side="left", padx=1)
-        self.btn_nav_scouting = ctk.CTkButton(self.nav_bar, text="SCOUTING", width=150, fg_color="#222", corner_radius=0, command=lambda: self.show_view("scouting"))
-        self.btn_nav_scouting.pack(side="left", padx=1)
-        self.btn_nav_history = ctk.CTkButton(self.nav_bar, text="EVENT HISTORY", width=150, fg_color="#222", corner_radius=0, command=lambda: self.show_view("history"))
-        self.btn_nav_history.pack(side="left", padx=1)
-        self.btn_nav_news = ctk.CTkButton(self.nav_bar, text="NEWS & INBOX", width=150, fg_color="#222", corner_radius=0, command=lambda: self.show_view("news"))
-        self.btn_nav_news.pack(side="left", padx=1)
+        self.nav_buttons = {}
+        for name, (label, _, _, _) in VIEWS.items():
+            self.nav_buttons[name] = ctk.CTkButton(self.nav_bar, text=label, width=150, fg_color="#222", corner_radius=0, command=lambda n=name: self.show_view(n))
+            self.nav_buttons[name].pack(side="left", padx=1)
 
         # CONTENT AREA
         self.content_area = ctk.CTkFrame(root, corner_radius=0, fg_color="transparent")
         self.content_area.pack(fill="both", expand=True)
-
-        self.view_dashboard = ctk.CTkFrame(self.content_area, fg_color="transparent")
-        self.build_dashboard_view(self.view_dashboard)
-        self.view_scouting = ctk.CTkFrame(self.content_area, fg_color="#1a1a1a")
-        self.build_scouting_view(self.view_scouting)
-        self.view_history = ctk.CTkFrame(self.content_area, fg_color="#1a1a1a")
-        self.build_history_view(self.view_history)
-        self.view_news = ctk.CTkFrame(self.content_area, fg_color="#1a1a1a")
-        ctk.CTkLabel(self.view_news, text="NEWS FEED", font=("Impact", 30), text_color="#555").pack(pady=20)
-        self.txt_news = ctk.CTkTextbox(self.view_news, font=("Consolas", 14), width=800, height=500, state="disabled", fg_color="#222")
-        self.txt_news.pack(pady=10)
-
+        self.views = {}
         self.show_view("dashboard")
 
+        self.root.after_idle(lambda: self.root.after(0, lambda: metrics.add_time("startup.first_frame", time.perf_counter() - self.started)))
+        self.start_loading()
+
+    def start_loading(self):
+        # Everything that grows with the save (roster store, rankings, free agents) loads off the Tk thread
+        progress = {"value": 0.1, "text": "Loading roster...", "result": None, "error": None}
+        def load():
+            try:
+                start = time.perf_counter()
+                registry = load_starting_world(next_id=load_id_counter())
+                progress.update(value=0.7, text="Ranking fighters...")
+                rankings = update_rankings_logic(registry.roster)
+                # Real free agents come with the import, random rookies if there aren't enough
+                while len(registry.free_agents) < 5:
+                    registry.add(generate_rookie(registry), free_agent=True)
+                metrics.add_time("startup.load", time.perf_counter() - start)
+                progress.update(value=1.0, result=(registry, rankings))
+            except Exception as e: progress.update(error=str(e))
+
+        def poll():
+            self.load_progress.set(progress["value"]); self.lbl_loading.configure(text=progress["text"])
+            if progress["error"]:
+                if messagebox.askretrycancel("Load Failed", f"{progress['error']}\n\nRetry? Cancel starts with an empty roster, a save can still be loaded."):
+                    self.start_loading(); return
+                registry = RosterRegistry(next_id=load_id_counter())
+                progress["result"] = (registry, update_rankings_logic(registry.roster))
+            if progress["result"] is None: self.root.after(50, poll); return
+            self.registry, self.rankings = progress["result"]
+            self.roster = self.registry.roster
+            self.loading = False
+            self.lbl_loading.pack_forget(); self.load_progress.pack_forget()
+            self.refresh_views()
+            metrics.add_time("startup.ready", time.perf_counter() - self.started)
+            metrics.end_event(); self.update_metrics_overlay()
+
+        threading.Thread(target=load, daemon=True).start()
+        self.root.after(50, poll)
+
+    def still_loading(self):
+        if self.loading: messagebox.showinfo("Loading", "The roster is still loading.")
+        return self.loading
+
+    def event_running(self):
+        # Saving, loading or changing the roster while the event thread is still writing to it
+        if self.sim_running: messagebox.showwarning("Event Running", "Wait for the current event to finish.")
+        return self.sim_running
+
     def show_view(self, view_name):
-        self.view_dashboard.pack_forget(); self.view_scouting.pack_forget(); self.view_history.pack_forget(); self.view_news.pack_forget()
-        self.btn_nav_dashboard.configure(fg_color="#222"); self.btn_nav_scouting.configure(fg_color="#222"); self.btn_nav_history.configure(fg_color="#222"); self.btn_nav_news.configure(fg_color="#222")
-        
-        if view_name == "dashboard":
-            self.view_dashboard.pack(fill="both", expand=True)
-            self.btn_nav_dashboard.configure(fg_color="#444")
-        elif view_name == "scouting":
-            self.view_scouting.pack(fill="both", expand=True)
-            self.btn_nav_scouting.configure(fg_color="#444")
-            self.refresh_scouting_list()
-        elif view_name == "history":
-            self.view_history.pack(fill="both", expand=True)
-            self.btn_nav_history.configure(fg_color="#444")
-            self.refresh_history_list()
-        elif view_name == "news":
-            self.view_news.pack(fill="both", expand=True)
-            self.btn_nav_news.configure(fg_color="#444")
-            self.update_news_display()
+        # Views are built on their first visit
+        for frame in self.views.values(): frame.pack_forget()
+        for name, btn in self.nav_buttons.items(): btn.configure(fg_color="#444" if name == view_name else "#222")
+        _, color, builder, refresh = VIEWS[view_name]
+        if view_name not in self.views:
+            self.views[view_name] = ctk.CTkFrame(self.content_area, fg_color=color)
+            getattr(self, builder)(self.views[view_name])
+        self.views[view_name].pack(fill="both", expand=True)
+        if refresh: getattr(self, refresh)()
+
+    def refresh_views(self):
+        # After the roster or career was swapped out: redraw whatever has been built so far
+        self.refresh_list()
+        for name in self.views:
+            refresh = VIEWS[name][3]
+            if refresh: getattr(self, refresh)()
 
     # --- VIEWS ---
     def build_history_view(self, parent):
         left_panel = ctk.CTkFrame(parent, width=300, corner_radius=0, fg_color="#222")
         left_panel.pack(side="left", fill="y")
         ctk.CTkLabel(left_panel, text="PAST EVENTS", font=("Impact", 20)).pack(pady=20)
-        self.history_listbox = ctk.CTkScrollableFrame(left_panel, width=280, fg_color="transparent")
+        # Newest first, only the visible rows have buttons
+        events = lambda: self.game_data.event_history
+        self.history_listbox = VirtualList(left_panel, count=lambda: len(events()), width=280, fg_color="transparent",
+                                           label=lambda i: f"{events()[-1 - i]['name']} ({events()[-1 - i]['date']})",
+                                           on_click=lambda i: self.show_event_details(events()[-1 - i]))
         self.history_listbox.pack(fill="both", expand=True, padx=10, pady=10)
         self.history_details = ctk.CTkFrame(parent, fg_color="#1a1a1a")
         self.history_details.pack(side="right", fill="both", expand=True, padx=20, pady=20)
@@ -465,38 +180,59 @@ class UFCGameGUI:
         self.hist_textbox.pack(pady=10)
 
     def refresh_history_list(self):
-        for widget in self.history_listbox.winfo_children(): widget.destroy()
-        for i, event in enumerate(reversed(self.game_data.event_history)):
-            btn = ctk.CTkButton(self.history_listbox, text=f"{event['name']} ({event['date']})", 
-                                fg_color="#333", hover_color="#444", 
-                                command=lambda e=event: self.show_event_details(e))
-            btn.pack(fill="x", pady=2)
+        self.history_listbox.refresh()
 
     def show_event_details(self, event):
+        # Only the stored summaries; events from a save load their results on first access. Scorecards and
+        # play-by-play are regenerated from the compact fight record when a fight's ▶ is clicked.
+        box = self.hist_textbox
         self.lbl_hist_title.configure(text=f"{event['name']} RESULTS")
-        self.hist_textbox.configure(state="normal")
-        self.hist_textbox.delete("0.0", "end")
-        self.hist_textbox.insert("end", f"DATE: {event['date']}\n")
-        self.hist_textbox.insert("end", f"PPV BUYS: {event['buys']:,}\n")
-        self.hist_textbox.insert("end", f"RATING: {'★' * event['rating']}\n")
+        box.configure(state="normal")
+        box.delete("0.0", "end")
+        for tag in box.tag_names():
+            if tag.startswith("pbp"): box.tag_delete(tag)
+        box.insert("end", f"DATE: {event['date']}\n")
+        box.insert("end", f"PPV BUYS: {event['buys']:,}\n")
+        box.insert("end", f"RATING: {'★' * event['rating']}\n")
         awards = event.get('awards', {})
         if awards:
-            self.hist_textbox.insert("end", f"FIGHT OF THE NIGHT: {awards.get('fotn', 'N/A')}\n")
-            self.hist_textbox.insert("end", f"PERFORMANCE: {awards.get('potn', 'N/A')}\n")
-        self.hist_textbox.insert("end", "="*50 + "\n\n")
-        for fight in event['results']:
+            box.insert("end", f"FIGHT OF THE NIGHT: {awards.get('fotn', 'N/A')}\n")
+            box.insert("end", f"PERFORMANCE: {awards.get('potn', 'N/A')}\n")
+        box.insert("end", "="*50 + "\n\n")
+        for i, fight in enumerate(event['results']):
             stars = "★" * fight['stars']
-            self.hist_textbox.insert("end", f"{fight['slot'].upper()} | {stars}\n")
-            self.hist_textbox.insert("end", f"{fight['winner']} def. {fight['loser']}\n")
-            self.hist_textbox.insert("end", f"Method: {fight['method']} (R{fight['round']})\n")
-            if fight['method'] in ["DECISION", "SPLIT DECISION"] and 'scores' in fight:
-                s = fight['scores']
-                sc_str = f"Scores: {s[0][0]}-{s[0][1]} | {s[1][0]}-{s[1][1]} | {s[2][0]}-{s[2][1]}"
-                self.hist_textbox.insert("end", f"{sc_str}\n")
-            if fight['new_champ']: self.hist_textbox.insert("end", ">>> AND NEW CHAMPION! <<<\n")
-            elif fight['still_champ']: self.hist_textbox.insert("end", ">>> AND STILL CHAMPION! <<<\n")
-            self.hist_textbox.insert("end", "-"*30 + "\n")
-        self.hist_textbox.configure(state="disabled")
+            box.insert("end", f"{fight['slot'].upper()} | {stars}\n")
+            box.insert("end", f"{fight['winner']} def. {fight['loser']}\n")
+            box.insert("end", f"Method: {fight['method']} (R{fight['round']})\n")
+            s = fight.get('scores')  # only in results archived before scorecards were left to the replay
+            if fight['method'] in ["DECISION", "SPLIT DECISION"] and s:
+                box.insert("end", f"Scores: {s[0][0]}-{s[0][1]} | {s[1][0]}-{s[1][1]} | {s[2][0]}-{s[2][1]}\n")
+            if fight['new_champ']: box.insert("end", ">>> AND NEW CHAMPION! <<<\n")
+            elif fight['still_champ']: box.insert("end", ">>> AND STILL CHAMPION! <<<\n")
+            if fight.get('fight_id'):
+                tag = f"pbp{i}"
+                box.insert("end", "▶ Play-by-play\n", tag)
+                box.tag_config(tag, foreground="#4fc3f7", underline=True)
+                box.tag_bind(tag, "<Button-1>", lambda e, fid=fight['fight_id']: self.open_play_by_play_window(fid))
+            box.insert("end", "-"*30 + "\n")
+        box.configure(state="disabled")
+
+    def regenerate_fight(self, fight_id):
+        record = self.game_data.fight_records.get(fight_id)
+        if not record: return None, []
+        try: return replay_play_by_play(record)
+        except ValueError: return None, []
+
+    def open_play_by_play_window(self, fight_id):
+        replay, lines = self.regenerate_fight(fight_id)
+        if not replay: messagebox.showinfo("Play-by-Play", "No replay data for this fight."); return
+        pbp_win = ctk.CTkToplevel(self.root)
+        pbp_win.title(f"{replay['winner']} vs {replay['loser']}")
+        pbp_win.geometry("700x600")
+        txt_area = ctk.CTkTextbox(pbp_win, font=("Consolas", 12), fg_color="#111", text_color="#0f0")
+        txt_area.pack(fill="both", expand=True, padx=5, pady=5)
+        txt_area.insert("end", "\n".join(lines).strip("\n"))
+        txt_area.configure(state="disabled")
 
     def build_scouting_view(self, parent):
         left = ctk.CTkFrame(parent, width=400, corner_radius=0, fg_color="#222")
@@ -523,16 +259,14 @@ class UFCGameGUI:
 
     def refresh_scouting_list(self):
         for item in self.scout_tree.get_children(): self.scout_tree.delete(item)
-        for fa in self.game_data.free_agents:
+        for fa in self.registry.free_agents:
             grade = fa.get_scout_grade()
-            self.scout_tree.insert("", "end", values=(grade, fa.name, fa.age, fa.weight_class))
+            self.scout_tree.insert("", "end", iid=str(fa.id), values=(grade, fa.name, fa.age, fa.weight_class))
 
     def on_scout_select(self, event):
         sel = self.scout_tree.selection()
         if not sel: return
-        item = self.scout_tree.item(sel[0])
-        name = item['values'][1]
-        fa = next((f for f in self.game_data.free_agents if f.name == name), None)
+        fa = self.registry.get(int(sel[0]))
         if fa:
             self.selected_scout_obj = fa
             self.lbl_scout_name.configure(text=fa.name.upper(), text_color="white")
@@ -544,23 +278,107 @@ class UFCGameGUI:
             self.btn_sign.configure(state="normal")
 
     def sign_fighter(self):
-        if not self.selected_scout_obj: return
-        self.game_data.free_agents.remove(self.selected_scout_obj)
-        self.roster.append(self.selected_scout_obj)
+        if not self.selected_scout_obj or self.event_running(): return
+        self.registry.sign(self.selected_scout_obj)
+        self.rankings.add(self.selected_scout_obj)
         messagebox.showinfo("Signed", f"{self.selected_scout_obj.name} has joined the roster!")
         self.game_data.add_news(f"✍️ SIGNING: You signed free agent {self.selected_scout_obj.name}.")
-        self.selected_scout_obj = None
+        self.selected_scout_obj = None; self.unsaved = True
         self.lbl_scout_name.configure(text="SELECT FIGHTER", text_color="#444")
         self.btn_sign.configure(state="disabled")
         self.refresh_scouting_list()
-        update_rankings_logic(self.roster)
+
+    def news_archive_path(self, slot): return os.path.join(saves_dir(), 'news_archive.jsonl' if slot == 0 else f'news_archive.{slot}.jsonl')
+
+    def build_news_view(self, parent):
+        ctk.CTkLabel(parent, text="NEWS FEED", font=("Impact", 30), text_color="#555").pack(pady=20)
+        bar = ctk.CTkFrame(parent, fg_color="transparent"); bar.pack()
+        self.news_cat_var = ctk.StringVar(value="All")
+        self.news_cat_menu = ctk.CTkOptionMenu(bar, variable=self.news_cat_var, values=["All"], command=lambda _: self.set_news_page(0), fg_color="#333", button_color="#444")
+        self.news_cat_menu.pack(side="left", padx=5)
+        self.news_fighter_entry = ctk.CTkEntry(bar, placeholder_text="Fighter name", width=200)
+        self.news_fighter_entry.pack(side="left", padx=5)
+        self.news_fighter_entry.bind("<Return>", lambda e: self.set_news_page(0))
+        ctk.CTkButton(bar, text="◀ NEWER", width=90, fg_color="#555", command=lambda: self.set_news_page(self.news_page - 1)).pack(side="left", padx=5)
+        self.lbl_news_page = ctk.CTkLabel(bar, text="", font=("Arial", 12)); self.lbl_news_page.pack(side="left", padx=10)
+        ctk.CTkButton(bar, text="OLDER ▶", width=90, fg_color="#555", command=lambda: self.set_news_page(self.news_page + 1)).pack(side="left", padx=5)
+        self.txt_news = ctk.CTkTextbox(parent, font=("Consolas", 14), width=800, height=500, state="disabled", fg_color="#222")
+        self.txt_news.pack(pady=10)
+        self.news_page = 0
+        self.news_view = None      # (category, fighter, page) currently rendered
+        self.news_last_seq = -1    # newest feed item looked at for that view
+        self.news_lines = []       # line count of each rendered item, top to bottom
+
+    def news_filter(self):
+        cat = self.news_cat_var.get()
+        return (None if cat == "All" else cat), (self.news_fighter_entry.get().strip() or None)
+
+    def set_news_page(self, page):
+        cat, fighter = self.news_filter()
+        pages = max(1, (self.game_data.news.total(cat, fighter) + NEWS_PAGE_SIZE - 1) // NEWS_PAGE_SIZE)
+        self.news_page = max(0, min(page, pages - 1))
+        self.update_news_display()
 
     def update_news_display(self):
+        feed = self.game_data.news
+        cat, fighter = self.news_filter()
+        view = (cat, fighter, self.news_page)
+        self.news_cat_menu.configure(values=["All"] + feed.categories())
         self.txt_news.configure(state="normal")
-        self.txt_news.delete("0.0", "end")
-        for item in self.game_data.news_feed:
-            self.txt_news.insert("end", item + "\n\n")
+        if view == self.news_view and self.news_page == 0:
+            # Same view as last time: only put the new items on top and drop what falls off the page
+            for seq in range(self.news_last_seq + 1, feed.count):
+                entry = feed.entry(seq)
+                if not entry or (cat and entry[2] != cat) or (fighter and fighter.lower() not in [n.lower() for n in entry[3]]): continue
+                self.txt_news.insert("1.0", entry[1] + "\n\n"); self.news_lines.insert(0, entry[1].count("\n") + 2)
+            while len(self.news_lines) > NEWS_PAGE_SIZE:
+                self.news_lines.pop()
+                self.txt_news.delete(f"{sum(self.news_lines) + 1}.0", "end")
+        else:
+            self.txt_news.delete("0.0", "end"); self.news_lines = []
+            for seq, text in feed.page(self.news_page, NEWS_PAGE_SIZE, cat, fighter):
+                self.txt_news.insert("end", text + "\n\n"); self.news_lines.append(text.count("\n") + 2)
+            self.txt_news.see("1.0")
         self.txt_news.configure(state="disabled")
+        self.news_view = view; self.news_last_seq = feed.count - 1
+        total = feed.total(cat, fighter)
+        self.lbl_news_page.configure(text=f"Page {self.news_page + 1}/{max(1, (total + NEWS_PAGE_SIZE - 1) // NEWS_PAGE_SIZE)} ({total} items)")
+
+    def build_records_view(self, parent):
+        # Everything here is read from game_data.stats, which is kept current as fights happen
+        board_names = {label: key for key, label in LEADERBOARDS.items()}
+        self.records_board_var = ctk.StringVar(value=LEADERBOARDS["wins"])
+        self.records_div_var = ctk.StringVar(value=WEIGHT_CLASSES[0])
+        panels = {}
+        for i, (name, menu) in enumerate([("LEADERBOARD", (self.records_board_var, list(board_names))), ("FINISH RATE BY DIVISION", None),
+                                           ("PPV BUYS TREND", None), ("TITLE LINEAGE", (self.records_div_var, WEIGHT_CLASSES))]):
+            frame = ctk.CTkFrame(parent, fg_color="#222")
+            frame.grid(row=i // 2, column=i % 2, sticky="nsew", padx=10, pady=10)
+            parent.grid_columnconfigure(i % 2, weight=1); parent.grid_rowconfigure(i // 2, weight=1)
+            ctk.CTkLabel(frame, text=name, font=("Impact", 18)).pack(pady=(10, 5))
+            if menu: ctk.CTkOptionMenu(frame, variable=menu[0], values=menu[1], command=lambda _: self.update_records_display(), fg_color="#333", button_color="#444").pack(pady=5)
+            box = ctk.CTkTextbox(frame, font=("Consolas", 13), state="disabled", fg_color="#1a1a1a")
+            box.pack(fill="both", expand=True, padx=10, pady=10)
+            panels[name] = box
+        self.records_boxes = panels; self.records_board_names = board_names
+
+    def update_records_display(self):
+        stats = self.game_data.stats
+        board = stats.leaderboard(self.records_board_names[self.records_board_var.get()], 15)
+        lines = {"LEADERBOARD": [f"{i:>2}. {name:<28}{value:>5}" for i, (name, value) in enumerate(board, 1)] or ["No fights yet."]}
+        rates = stats.finish_rates()
+        lines["FINISH RATE BY DIVISION"] = [f"{'DIVISION':<20}{'FIGHTS':>7}{'KO':>6}{'SUB':>6}{'DEC':>6}"] + [
+            f"{div:<20}{r['fights']:>7}{r['ko']:>6.0%}{r['sub']:>6.0%}{r['dec']:>6.0%}" for div, r in ((d, rates[d]) for d in WEIGHT_CLASSES if d in rates)]
+        trend = stats.buys_trend(12)
+        ppv = [f"{name:<10}{date:<10}{buys:>10,}  {'★' * rating}" for name, date, buys, rating in reversed(trend["events"])]
+        if trend["best"]: ppv += ["", f"Last 12 avg: {trend['average']:,.0f}   12 before: {trend['previous_average']:,.0f}",
+                                  f"All-time avg: {stats.average_buys():,.0f}", f"Record: {trend['best'][0]} ({trend['best'][2]:,})"]
+        lines["PPV BUYS TREND"] = ppv or ["No events yet."]
+        reigns = stats.lineage(self.records_div_var.get())
+        lines["TITLE LINEAGE"] = [f"{r['name']:<26} {r['won'][0] if r['won'] else 'Earlier':<10} -> {r['lost'][0] if r['lost'] else 'Current':<10} {r['defenses']} def."
+                                  for r in reversed(reigns)] or ["No title fights yet."]
+        for name, box in self.records_boxes.items():
+            box.configure(state="normal"); box.delete("1.0", "end"); box.insert("1.0", "\n".join(lines[name])); box.configure(state="disabled")
 
     def build_dashboard_view(self, parent):
         col_roster = ctk.CTkFrame(parent, width=320, corner_radius=0, fg_color="#222")
@@ -579,12 +397,12 @@ class UFCGameGUI:
         self.tree.column("Name", width=140)
         self.tree.column("Rec", width=70, anchor="center")
         self.tree.column("Pop", width=40, anchor="center")
-        vsb = ttk.Scrollbar(self.tree_frame, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=vsb.set)
+        vsb = ttk.Scrollbar(self.tree_frame, orient="vertical")
         vsb.pack(side="right", fill="y")
         self.tree.pack(fill="both", expand=True)
-        self.tree.bind("<<TreeviewSelect>>", self.on_fighter_select)
         self.tree.tag_configure('injured', foreground='#e74c3c')
+        # Only the rows on screen exist in the Treeview, see roster_view.py
+        self.roster_table = VirtualTable(self.tree, vsb, RosterTableModel(self.rankings), on_select=self.on_fighter_select)
 
         col_details = ctk.CTkFrame(parent, fg_color="#1a1a1a")
         col_details.pack(side="left", fill="both", expand=True, padx=2)
@@ -618,6 +436,10 @@ class UFCGameGUI:
         self.btn_view_log = ctk.CTkButton(col_details, text="VIEW FIGHT LOG", fg_color="#555", command=self.open_fight_log_window)
         self.btn_view_log.pack(pady=10)
 
+        ctk.CTkLabel(col_details, text="MATCHUP PREDICTOR (CTRL+SELECT 2)", font=("Arial", 12, "bold"), text_color="#666").pack(pady=(20, 5))
+        self.lbl_prediction = ctk.CTkLabel(col_details, text="-", font=("Consolas", 13), text_color="#ddd", justify="center")
+        self.lbl_prediction.pack()
+
         self.col_card = ctk.CTkFrame(parent, width=450, corner_radius=0, fg_color="#111")
         self.col_card.pack(side="right", fill="y", padx=(2,0))
         self.col_card.pack_propagate(False)
@@ -631,6 +453,7 @@ class UFCGameGUI:
             self.card_slots[key] = self.create_slot_ui(self.scroll_card, key.upper(), key, h, color)
         self.btn_run = ctk.CTkButton(self.col_card, text="RUN EVENT (0/8 Filled)", fg_color="#555", hover_color="#555", height=60, font=("Impact", 18), state="disabled", command=self.run_event_window)
         self.btn_run.pack(side="bottom", pady=20, padx=30, fill="x")
+        ctk.CTkButton(self.col_card, text="AUTO BOOK CARD", fg_color="#2980b9", height=36, font=("Impact", 14), command=self.auto_book_card).pack(side="bottom", padx=30, fill="x")
         self.refresh_list("All")
 
     def create_slot_ui(self, parent, label_text, slot_key, height, color):
@@ -653,12 +476,37 @@ class UFCGameGUI:
         return {"red": red_lbl, "blue": blue_lbl}
 
     def on_fighter_select(self, event):
-        selected = self.tree.selection()
+        selected = self.roster_table.selection()
         if not selected: return
-        item = self.tree.item(selected[0])
-        name = item['values'][1]
-        f = next((x for x in self.roster if x.name == name), None)
+        f = self.registry.get(selected[0])
         if f: self.selected_fighter_obj = f; self.update_details_panel(f)
+        if len(selected) == 2: self.update_prediction_panel(selected)
+
+    def update_prediction_panel(self, selected):
+        f1 = self.registry.get(selected[0]); f2 = self.registry.get(selected[1])
+        if not f1 or not f2: return
+        # The prediction (~50 ms) runs on a background thread and is cached until either fighter changes,
+        # so clicking through the roster never waits on it. Only the latest selection gets displayed.
+        key = (f1.id, f1.changed, f2.id, f2.changed)
+        self.prediction_key = key
+        if key in self.predictions: self.lbl_prediction.configure(text=format_prediction(self.predictions[key])); return
+        self.lbl_prediction.configure(text="Predicting...")
+        # Champions only defend in the main event, so predict those as 5-round title fights
+        is_main = f1.is_champion or f2.is_champion
+        done = {}
+        def work():
+            try: done["pred"] = predict_matchup(f1, f2, is_main=is_main)
+            except Exception as e: done["error"] = str(e)
+        def poll():
+            if not done: self.root.after(20, poll); return
+            if "error" in done:
+                if self.prediction_key == key: self.lbl_prediction.configure(text=f"Prediction failed: {done['error']}")
+                return
+            if len(self.predictions) >= PREDICTION_CACHE: self.predictions.clear()
+            self.predictions[key] = done["pred"]
+            if self.prediction_key == key: self.lbl_prediction.configure(text=format_prediction(done["pred"]))
+        threading.Thread(target=work, daemon=True).start()
+        self.root.after(20, poll)
 
     def update_details_panel(self, f):
         self.lbl_det_name.configure(text=f.name.upper(), text_color="#e74c3c" if f.injury_months > 0 else "white")
@@ -688,26 +536,38 @@ class UFCGameGUI:
         
         if not f.history:
             ctk.CTkLabel(txt_frame, text="No recorded fights yet.", font=("Arial", 12)).pack()
-        else:
-            for fight in reversed(f.history):
+            return
+
+        # One page of rows at a time, fetched newest first straight from the history store
+        total = len(f.history); pages = (total + LOG_PAGE_SIZE - 1) // LOG_PAGE_SIZE
+        nav = ctk.CTkFrame(log_win, fg_color="transparent"); nav.pack(pady=5)
+        lbl_page = ctk.CTkLabel(nav, text="", font=("Arial", 12))
+        state = {"page": 0}
+
+        def show_page(page):
+            state["page"] = page
+            for widget in txt_frame.winfo_children(): widget.destroy()
+            for fight in history_page(f.history, page * LOG_PAGE_SIZE, LOG_PAGE_SIZE):
                 color = "#2ecc71" if fight['result'] == "Win" else "#e74c3c"
                 row_txt = f"[{fight['result'].upper()}] vs {fight['opponent']}\n{fight['method']} (R{fight['round']}) @ {fight['event']}"
                 f_row = ctk.CTkFrame(txt_frame, fg_color="#333")
                 f_row.pack(fill="x", pady=2)
+                if fight.get('fight_id'):
+                    ctk.CTkButton(f_row, text="▶", width=30, fg_color="#555", command=lambda fid=fight['fight_id']: self.open_play_by_play_window(fid)).pack(side="right", padx=10)
                 ctk.CTkLabel(f_row, text=row_txt, font=("Consolas", 12), text_color=color, anchor="w", justify="left").pack(fill="x", padx=10, pady=5)
+            lbl_page.configure(text=f"Page {page + 1}/{pages} ({total} fights)")
+            txt_frame._parent_canvas.yview_moveto(0)
+
+        ctk.CTkButton(nav, text="◀ NEWER", width=90, fg_color="#555", command=lambda: state["page"] > 0 and show_page(state["page"] - 1)).pack(side="left", padx=5)
+        lbl_page.pack(side="left", padx=10)
+        ctk.CTkButton(nav, text="OLDER ▶", width=90, fg_color="#555", command=lambda: state["page"] < pages - 1 and show_page(state["page"] + 1)).pack(side="left", padx=5)
+        show_page(0)
 
     def refresh_list(self, choice=None):
+        # Rows are diffed against what is on screen, unchanged fighters aren't touched
         if choice is None: choice = self.filter_var.get()
-        for item in self.tree.get_children(): self.tree.delete(item)
-        display_list = self.roster
-        if choice != "All": display_list = [f for f in self.roster if f.weight_class == choice]
-        display_list.sort(key=lambda x: x.rank)
-        for f in display_list:
-            rank_str = "C" if f.is_champion else f"{f.rank}" if f.rank <= 15 else "-"
-            status_str = f"INJ({f.injury_months})" if f.injury_months > 0 else "OK"
-            rec_str = f"{f.record['wins']}-{f.record['losses']}"
-            self.tree.insert("", "end", values=(rank_str, f.name, rec_str, f.popularity), tags=('injured',) if f.injury_months > 0 else ())
-        self.tree.tag_configure('injured', foreground='#e74c3c')
+        self.roster_table.model.rankings = self.rankings
+        self.roster_table.set_filter(choice)
 
     def check_card_complete(self):
         filled_count = 0
@@ -721,106 +581,172 @@ class UFCGameGUI:
             self.btn_run.configure(state="disabled", text=f"RUN EVENT ({filled_count}/{total} Filled)", fg_color="#555")
 
     def book_selected_to_slot(self, slot_name, red_lbl, blue_lbl):
-        selected_items = self.tree.selection()
+        selected_items = self.roster_table.selection()
         if len(selected_items) != 2: messagebox.showwarning("Select Fighters", "Please hold CTRL and select exactly 2 fighters."); return
-        n1 = self.tree.item(selected_items[0])['values'][1]; n2 = self.tree.item(selected_items[1])['values'][1]
-        f1 = next((x for x in self.roster if x.name == n1), None); f2 = next((x for x in self.roster if x.name == n2), None)
+        f1 = self.registry.get(selected_items[0]); f2 = self.registry.get(selected_items[1])
         if f1.injury_months > 0 or f2.injury_months > 0: messagebox.showerror("Injury", "Cannot book injured fighter!"); return
         if f1.weight_class != f2.weight_class:
              if not messagebox.askyesno("Weight Mismatch", f"Book {f1.weight_class} vs {f2.weight_class}?"): return
         
         # RIVALRY CHECK
         rivalry_text = "vs"
-        fights_against = [x for x in f1.history if x['opponent'] == f2.name]
-        if len(fights_against) == 1: rivalry_text = "REMATCH"
-        elif len(fights_against) >= 2: rivalry_text = "TRILOGY"
+        fights_against = count_against(f1.history, f2.name)
+        if fights_against == 1: rivalry_text = "REMATCH"
+        elif fights_against >= 2: rivalry_text = "TRILOGY"
+
+        self.fill_slot(slot_name, f1, f2)
+        self.check_card_complete()
 
+    def fill_slot(self, slot_name, f1, f2):
         self.current_fights[slot_name] = [f1, f2]
         c1 = "👑 " if f1.is_champion else ""; c2 = "👑 " if f2.is_champion else ""
-        red_lbl.configure(text=f"{c1}{f1.name}", text_color="white")
-        blue_lbl.configure(text=f"{c2}{f2.name}", text_color="white")
+        self.card_slots[slot_name]["red"].configure(text=f"{c1}{f1.name}", text_color="white")
+        self.card_slots[slot_name]["blue"].configure(text=f"{c2}{f2.name}", text_color="white")
+
+    def auto_book_card(self):
+        # Replaces the whole card with the matchmaker's best one, see matchmaker.py
+        if self.still_loading() or self.event_running(): return
+        card = build_card(self.roster, self.rankings, recent=recently_booked(self.game_data), time_budget=TIME_BUDGET)
+        if not card: messagebox.showwarning("Auto Book", "Not enough healthy fighters to fill the card."); return
+        for slot, (f1, f2) in card.items(): self.fill_slot(slot, f1, f2)
         self.check_card_complete()
 
     def run_event_window(self):
         for k in CARD_SLOTS_KEYS:
             if not self.current_fights[k][0]: messagebox.showerror("Incomplete Card", "You must fill all 8 slots!"); return
+        if self.sim_running: messagebox.showwarning("Event Running", "The previous event is still being simulated."); return
+        self.sim_running = True
+        card = dict(self.current_fights)
+        self.reset_card_slots()
         sim_win = ctk.CTkToplevel(self.root)
         sim_win.title("Live Simulation")
         sim_win.geometry("700x600")
+        speed_var = ctk.StringVar(value="Normal")
+        ctk.CTkSegmentedButton(sim_win, values=list(PLAYBACK_SPEEDS), variable=speed_var).pack(pady=5)
         txt_area = ctk.CTkTextbox(sim_win, font=("Consolas", 12), state="disabled", fg_color="#111", text_color="#0f0")
         txt_area.pack(fill="both", expand=True, padx=5, pady=5)
-        def log(text): txt_area.configure(state="normal"); txt_area.insert("end", text + "\n"); txt_area.see("end"); txt_area.configure(state="disabled")
-        
-        def run_thread():
-            log("🔥 EVENT STARTING... 🔥\n")
-            reverse_order = list(reversed(CARD_SLOTS_KEYS))
-            event_results = []
-            total_card_stars = 0
-            main_event_pop = 0
-            best_fight_name = "None"; max_stars = 0
-            potn_name = "None"; fastest_win = 999
-            
-            for slot in reverse_order:
-                f1, f2 = self.current_fights[slot]
-                is_main = (slot == "Main Event")
-                if is_main: main_event_pop = (f1.popularity + f2.popularity)
-                
-                fights_against = [x for x in f1.history if x['opponent'] == f2.name]
-                if len(fights_against) > 0:
-                    log(f"⚔️ RIVALRY ALERT: This is fight #{len(fights_against)+1} between them!")
-
-                res = self.simulate_fight_logic(f1, f2, is_main, slot, log)
-                if res['stars'] > max_stars:
-                    max_stars = res['stars']; best_fight_name = f"{res['winner']} vs {res['loser']}"
-                elif res['stars'] == max_stars and is_main: best_fight_name = f"{res['winner']} vs {res['loser']}"
-                if res['method'] in ["KNOCKOUT", "SUBMISSION"]:
-                    if res['round'] < fastest_win: fastest_win = res['round']; potn_name = res['winner']
-                generate_post_fight_news(next(f for f in self.roster if f.name == res['winner']), 
-                                         next(f for f in self.roster if f.name == res['loser']), res['method'], self.game_data)
-                total_card_stars += res['stars']
-                event_results.append(res)
-            
-            if UPDATE_RECORDS:
-                for f in self.roster:
-                    if f.name == potn_name: f.popularity += 5
-                    if best_fight_name and (f.name in best_fight_name): f.popularity += 5
-
-            avg_stars = total_card_stars / 8
-            base_buys = 100000 
-            pop_buys = main_event_pop * 4000
-            quality_bonus = avg_stars * 25000
-            total_buys = int(base_buys + pop_buys + quality_bonus + random.randint(-20000, 20000))
-            event_rating = int(avg_stars)
-            if event_rating < 1: event_rating = 1
-            if event_rating > 5: event_rating = 5
-
-            log("\n" + "="*30)
-            log(f"💰 PPV BUYS: {total_buys:,}")
-            log(f"⭐ EVENT RATING: {event_rating}/5 Stars")
-            log(f"⚔️ FIGHT OF THE NIGHT: {best_fight_name}")
-            log(f"⚡ PERFORMANCE OF THE NIGHT: {potn_name}")
-            log("="*30)
-
-            awards = {"fotn": best_fight_name, "potn": potn_name}
-            self.game_data.archive_event(self.game_data.get_event_name(), self.game_data.get_date_str(), event_results, total_buys, event_rating, awards)
-
-            log("\n🏁 Event Over.")
-            log(f"📅 Advancing Date to Next Month...")
-            self.game_data.advance_time()
-            self.reset_card_slots()
-            injury_logs = process_monthly_events(self.roster, self.game_data)
-            for msg in injury_logs: log(f" > {msg}")
-            if UPDATE_RECORDS: save_roster_objects(self.roster)
-            update_rankings_logic(self.roster)
-            self.refresh_list()
-            self.root.after(0, self.update_header_info)
 
+        # The worker thread owns the roster, rankings and career until the event is done, and every view
+        # and action in the main window reads them. So this window is modal until then, closing it
+        # only switches to instant playback, and the roster table stops redrawing (e.g. on resize).
+        closing = {"asked": False}
+        def close():
+            if not self.sim_running: sim_win.destroy(); return
+            closing["asked"] = True; speed_var.set("Instant")
+        sim_win.protocol("WM_DELETE_WINDOW", close)
+        try: sim_win.wait_visibility(); sim_win.grab_set()  # before the worker starts
+        except TclError: pass  # grab refused, the sim_running guards on save, load, sign and auto-book still hold
+        self.roster_table.frozen = True
+
+        # Producer: the engine runs flat out on a worker thread and only ever touches the queue
+        events = queue.Queue()
+        def run_thread():
+            push = lambda kind, text: events.put((kind, text))
+            try:
+                push("banner", "🔥 EVENT STARTING... 🔥\n")
+                with metrics.span("event.card"):
+                    run_card(card, self.roster, self.game_data, sink=push, rankings=self.rankings, executor=self.card_pool)
+                push("month", "\n🏁 Event Over.")
+                push("month", f"📅 Advancing Date to Next Month...")
+                self.game_data.advance_time()
+                with metrics.span("event.monthly_events"):
+                    for msg in process_monthly_events(self.registry, self.game_data): push("month", f" > {msg}")
+                with metrics.span("event.save_roster"):
+                    if UPDATE_RECORDS: save_roster_objects(self.roster); self.registry.save_counter()
+                with metrics.span("event.rankings_sync"):
+                    self.rankings.sync(self.roster)
+            except Exception as e: push("error", f"{type(e).__name__}: {e}")
+            finally: events.put(("done", None))  # always, or the GUI would wait on this event forever
+
+        # Consumer: the Tk loop drains the queue once per frame and paces commentary by playback speed
+        clock = {"next": 0.0}; errors = []
+        def drain():
+            speed = PLAYBACK_SPEEDS[speed_var.get()] if sim_win.winfo_exists() else 0  # closed window: catch up at once
+            now = time.monotonic(); lines = []; done = False
+            while len(lines) < MAX_LINES_PER_FRAME and (speed == 0 or now >= clock["next"]):
+                try: kind, text = events.get_nowait()
+                except queue.Empty: break
+                if kind == "done": done = True; break
+                if kind == "error": errors.append(text); continue
+                if speed == 0 and kind not in INSTANT_KINDS: continue
+                lines.append(text)
+                delay = PACING.get(kind, 0) * TEXT_SPEED * speed
+                if delay: clock["next"] = max(clock["next"], now) + delay
+            if lines and sim_win.winfo_exists():
+                with metrics.span("gui.commentary"):
+                    txt_area.configure(state="normal"); txt_area.insert("end", "\n".join(lines) + "\n"); txt_area.see("end"); txt_area.configure(state="disabled")
+                metrics.count("gui.commentary_lines", len(lines))
+            metrics.count("gui.frames")
+            if done:
+                self.sim_running = False; self.unsaved = True
+                self.roster_table.frozen = False
+                if sim_win.winfo_exists():
+                    sim_win.grab_release()
+                    if closing["asked"]: sim_win.destroy()
+                with metrics.span("gui.refresh_list"): self.refresh_list()
+                self.update_header_info()
+                metrics.end_event()
+                self.update_metrics_overlay()
+                if errors: messagebox.showerror("Event Failed", f"The event stopped with an error:\n{errors[0]}")
+            else: self.root.after(FRAME_MS, drain)
+
+        metrics.begin_event(self.game_data.get_event_name())
         threading.Thread(target=run_thread, daemon=True).start()
+        self.root.after(FRAME_MS, drain)
+
+    def toggle_metrics_overlay(self, event=None):
+        # F12: per-phase timings of the last event, turns instrumentation on the first time
+        if self.metrics_overlay is not None:
+            self.metrics_overlay.destroy(); self.metrics_overlay = None; return
+        metrics.enable(True)
+        self.metrics_overlay = ctk.CTkLabel(self.root, text="", font=("Consolas", 12), text_color="#0f0", fg_color="#000", justify="left", corner_radius=4)
+        self.metrics_overlay.place(relx=1.0, y=110, x=-10, anchor="ne")
+        self.update_metrics_overlay()
+
+    def update_metrics_overlay(self):
+        if self.metrics_overlay is None: return
+        record = metrics.last_event()
+        self.metrics_overlay.configure(text=metrics.format_event(record) if record else "Metrics on, run an event to see its timings.")
 
     def update_header_info(self):
         self.lbl_event_title.configure(text=self.game_data.get_event_name())
         self.lbl_date.configure(text=self.game_data.get_date_str())
 
+    def save_game_dialog(self):
+        # True once the career is in a .sav
+        if self.still_loading() or self.event_running(): return False
+        os.makedirs(saves_dir(), exist_ok=True)
+        path = filedialog.asksaveasfilename(initialdir=saves_dir(), defaultextension=".sav", filetypes=[("Save Game", "*.sav")])
+        if not path: return False
+        try: save_game(path, self.registry, self.game_data)
+        except (OSError, sqlite3.Error, TypeError, ValueError) as e: messagebox.showerror("Save Failed", str(e)); return False
+        self.unsaved = False
+        messagebox.showinfo("Saved", f"Game saved to {os.path.basename(path)}")
+        return True
+
+    def load_game_dialog(self):
+        if self.still_loading() or self.event_running(): return
+        path = filedialog.askopenfilename(initialdir=saves_dir(), filetypes=[("Save Game", "*.sav")])
+        if not path: return
+        if self.unsaved:
+            # The running career only lives in roster.db, which follows the loaded one from here on
+            answer = messagebox.askyesnocancel("Load Game", "Loading replaces the current career and its autosave. Save it first?")
+            if answer is None or (answer and not self.save_game_dialog()): return
+        # The load writes its news archive to the other file, the running career keeps its own until the load succeeded
+        slot = 1 - self.news_slot
+        try: registry, game_data = load_game(path, news_archive=self.news_archive_path(slot))
+        except (OSError, ValueError, sqlite3.Error) as e: messagebox.showerror("Load Failed", str(e)); return
+        self.registry, self.game_data, self.news_slot = registry, game_data, slot
+        self.roster = self.registry.roster
+        with metrics.span("load.update_rankings_logic"): self.rankings = update_rankings_logic(self.roster)
+        reset_roster_store()
+        self.unsaved = False
+        self.selected_fighter_obj = None; self.selected_scout_obj = None
+        self.news_view = None; self.news_page = 0
+        self.reset_card_slots()
+        self.refresh_views()
+        self.update_header_info()
+
     def reset_card_slots(self):
         self.current_fights = {key: [None, None] for key in CARD_SLOTS_KEYS}
         for slot in self.card_slots:
@@ -828,154 +754,6 @@ class UFCGameGUI:
             self.card_slots[slot]["blue"].configure(text="Empty", text_color="#777")
         self.check_card_complete()
 
-    def simulate_fight_logic(self, f1, f2, is_main, slot_name, log_func):
-        is_title = is_main and (f1.is_champion or f2.is_champion)
-        if f2.is_champion and not f1.is_champion: f1, f2 = f2, f1
-        rounds = 5 if is_title or is_main else 3
-        log_func(f"\n>> {f1.name} vs {f2.name} <<"); time.sleep(1.0)
-        
-        fighters = {
-            f1.name: {"obj": f1, "stamina": 100, "damage_head": 0, "damage_legs": 0, "damage_body": 0, "is_gassed": False, "total_damage_dealt": 0},
-            f2.name: {"obj": f2, "stamina": 100, "damage_head": 0, "damage_legs": 0, "damage_body": 0, "is_gassed": False, "total_damage_dealt": 0}
-        }
-        
-        judge_scores = [[0,0] for _ in range(3)]
-        winner = None; method = "Decision"; finish_round = 0; fight_stars = 2; damage_exchanged = 0
-        
-        for r in range(1, rounds+1):
-            log_func(f"🔔 R{r}..."); time.sleep(TEXT_SPEED * 0.3)
-            r_stats = {f1.name: 0, f2.name: 0}; knockdown_scored = {f1.name: False, f2.name: False}
-            for fname, state in fighters.items():
-                rec = 10 + (state["obj"].cardio * 0.1)
-                state["stamina"] = min(100, state["stamina"] + rec)
-                if state["stamina"] < 40: 
-                    state["is_gassed"] = True
-                    log_func(f"⚠️ {fname} looks EXHAUSTED!")
-            
-            for _ in range(5):
-                att_name = f1.name if random.choice([True, False]) else f2.name
-                def_name = f2.name if att_name == f1.name else f1.name
-                att = fighters[att_name]; defe = fighters[def_name]
-                att_skill_pen = 0.6 if att["is_gassed"] else 1.0; def_skill_pen = 0.6 if defe["is_gassed"] else 1.0
-                att["stamina"] -= 8
-                
-                if att["obj"].grappling > att["obj"].striking:
-                    off = att["obj"].grappling * att_skill_pen; defn = defe["obj"].tdd * def_skill_pen
-                    if defe["damage_legs"] > 30: defn -= 15
-                    if off + random.randint(-20, 20) > defn:
-                        log_func(f"  > {att_name} {get_commentary('takedown')}")
-                        r_stats[att_name] += 10; att["stamina"] -= 5; att["total_damage_dealt"] += 5
-                        if att["obj"].sub_off + random.randint(0,20) > defe["obj"].sub_def + 30: 
-                            winner = att["obj"]; method = "SUBMISSION"; finish_round = r
-                            log_func(f"  > {get_commentary('sub')}"); break 
-                    else: 
-                        log_func(f"  > {att_name} shoots... {get_commentary('takedown_stuff')}")
-                        att["stamina"] -= 12
-                else:
-                    off = att["obj"].striking * att_skill_pen; defn = defe["obj"].striking * def_skill_pen
-                    if off + random.randint(-20, 20) > defn:
-                        roll = random.randint(1, 10)
-                        damage_val = 0
-                        if roll <= 2: 
-                            log_func(f"  > {att_name} {get_commentary('leg_kick')}")
-                            defe["damage_legs"] += 15; r_stats[att_name] += 5; damage_val = 5
-                        elif roll <= 4:
-                            log_func(f"  > {att_name} {get_commentary('body_shot')}")
-                            defe["damage_body"] += 15; defe["stamina"] -= 15; r_stats[att_name] += 8; damage_val = 8
-                        elif roll <= 8:
-                            log_func(f"  > {att_name} {get_commentary('strike_light')}")
-                            defe["damage_head"] += 8; r_stats[att_name] += 5; damage_val = 5
-                        else:
-                            log_func(f"  > {att_name} {get_commentary('strike_heavy')}")
-                            defe["damage_head"] += 20; r_stats[att_name] += 15; damage_val = 20
-                            damage_exchanged += 20
-                            chin_stat = defe["obj"].chin - (defe["damage_head"] * 0.5)
-                            if random.randint(0, 100) > chin_stat:
-                                winner = att["obj"]; method = "KNOCKOUT"; finish_round = r
-                                log_func(f"  > {get_commentary('ko')}"); break
-                            if random.randint(0, 100) > (chin_stat + 15):
-                                log_func(f"  > {get_commentary('knockdown')}")
-                                r_stats[att_name] += 20; knockdown_scored[att_name] = True
-                        att["total_damage_dealt"] += damage_val
-                time.sleep(TEXT_SPEED * 0.1)
-            if winner: break
-            
-            s1 = r_stats[f1.name]; s2 = r_stats[f2.name]
-            for j in range(3):
-                 variance = random.randint(-2, 2)
-                 j_s1 = s1 + variance; j_s2 = s2
-                 if j_s1 > j_s2: p1 = 10; p2 = 8 if knockdown_scored[f1.name] or (j_s1 - j_s2 > 25) else 9
-                 elif j_s2 > j_s1: p2 = 10; p1 = 8 if knockdown_scored[f2.name] or (j_s2 - j_s1 > 25) else 9
-                 else: p1 = 10; p2 = 10
-                 judge_scores[j][0] += p1; judge_scores[j][1] += p2
-
-        if not winner:
-            finish_round = rounds
-            votes_f1 = 0; votes_f2 = 0
-            for s in judge_scores:
-                if s[0] > s[1]: votes_f1 += 1
-                elif s[1] > s[0]: votes_f2 += 1
-            if votes_f1 > votes_f2: winner = f1; method = "DECISION" if votes_f2 == 0 else "SPLIT DECISION"
-            elif votes_f2 > votes_f1: winner = f2; method = "DECISION" if votes_f1 == 0 else "SPLIT DECISION"
-            else:
-                if fighters[f1.name]["total_damage_dealt"] > fighters[f2.name]["total_damage_dealt"]: winner = f1; method = "SPLIT DECISION"
-                else: winner = f2; method = "SPLIT DECISION"
-            log_func(f"\n📝 OFFICIAL SCORECARDS:")
-            for i, s in enumerate(judge_scores):
-                j_res = f1.name if s[0] > s[1] else (f2.name if s[1] > s[0] else "Draw")
-                log_func(f"   Judge {i+1}: {s[0]} - {s[1]} ({j_res})")
-
-        loser = f2 if winner == f1 else f1
-        log_func(f"🏆 {winner.name} via {method}")
-        
-        if method == "KNOCKOUT": fight_stars += 2
-        elif method == "SUBMISSION": fight_stars += 1
-        if finish_round == 1: fight_stars += 1
-        if damage_exchanged > 100: fight_stars += 1
-        if damage_exchanged < 30 and "DECISION" in method: fight_stars -= 1 
-        if is_title: fight_stars += 1
-        fight_stars = max(1, min(5, fight_stars))
-
-        new_champ = False; still_champ = False
-        if is_title:
-            if winner.is_champion: log_func("👑 AND STILL!"); still_champ = True
-            else: log_func("👑 AND NEW!"); new_champ = True; winner.is_champion = True; loser.is_champion = False 
-        
-        if UPDATE_RECORDS:
-            winner.record['wins'] += 1; loser.record['losses'] += 1
-            winner.annual_stats['wins'] += 1
-            if method in ["KNOCKOUT", "SUBMISSION"]: winner.annual_stats['finishes'] += 1
-            
-            points_gained = 150 
-            if winner.ranking_score < loser.ranking_score:
-                diff = loser.ranking_score - winner.ranking_score
-                upset_bonus = int(diff * 0.40) 
-                points_gained += upset_bonus
-                log_func(f"🚀 RANKINGS: Upset! {winner.name} takes {upset_bonus} bonus points!")
-            
-            if method in ["KNOCKOUT", "SUBMISSION"]: points_gained += 50
-            winner.ranking_score += points_gained
-            loss_penalty = 50
-            if loser.ranking_score > 1000: loss_penalty = 150
-            if loser.ranking_score > 2000: loss_penalty = 300 
-            loser.ranking_score = max(0, loser.ranking_score - loss_penalty)
-            
-            if winner.popularity < 90: winner.popularity += random.randint(1, 3)
-            if winner.age < 28 and random.randint(1,100) < 50:
-                stat = random.choice(["striking", "grappling", "tdd"])
-                curr = getattr(winner, stat)
-                if curr < 95: setattr(winner, stat, curr + 1); log_func(f"📈 DEVELOPMENT: {winner.name} improved {stat} (+1)!")
-            if method == "KNOCKOUT":
-                loser.chin -= 1
-                log_func(f"📉 DAMAGE: {loser.name}'s chin degraded (-1).")
-            
-            ev_name = self.game_data.get_event_name()
-            hist_scores = judge_scores if "DECISION" in method else []
-            winner.history.append({"result": "Win", "opponent": loser.name, "method": method, "round": finish_round, "event": ev_name, "scores": hist_scores})
-            loser.history.append({"result": "Loss", "opponent": winner.name, "method": method, "round": finish_round, "event": ev_name, "scores": hist_scores})
-            
-        return {"slot": slot_name, "winner": winner.name, "loser": loser.name, "method": method, "round": finish_round, "title_fight": is_title, "new_champ": new_champ, "still_champ": still_champ, "stars": fight_stars, "scores": judge_scores}
-
 if __name__ == "__main__":
     app = ctk.CTk()
     gui = UFCGameGUI(app)
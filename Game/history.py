@@ -0,0 +1,59 @@
+# --- FIGHT HISTORY ---
+# Per-fighter career log backed by a store (RosterStore/SaveGame history table, keyed by fighter id).
+# Only the entry count is known up front. New fights are appended to a pending tail without reading
+# anything, the stored part is fetched in pages for the fight log window, and the whole list is
+# loaded only when something iterates it (e.g. the rivalry check for a booked fight).
+class FightHistory:
+    __slots__ = ("source", "fighter_id", "stored", "pending", "_entries")
+
+    def __init__(self, source, fighter_id, stored=0):
+        self.source = source; self.fighter_id = fighter_id
+        self.stored = stored   # entries already in the store
+        self.pending = []      # appended since the last save, oldest first
+        self._entries = None   # full list once loaded
+
+    def entries(self):
+        if self._entries is None:
+            self._entries = (self.source.load_history(self.fighter_id) if self.stored else []) + self.pending
+        return self._entries
+
+    def loaded(self): return self._entries is not None
+
+    def append(self, entry):
+        self.pending.append(entry)
+        if self._entries is not None: self._entries.append(entry)
+
+    def mark_written(self):
+        self.stored += len(self.pending); self.pending = []
+
+    def page(self, start, count):
+        # Newest first: entries start .. start+count-1 counting back from the latest fight
+        if self._entries is not None: return history_page(self._entries, start, count)
+        newest = self.pending[::-1]
+        rows = newest[start:start + count]
+        if len(rows) < count and start + len(rows) >= len(newest):
+            offset = max(0, start - len(newest))
+            rows += self.source.load_history_page(self.fighter_id, offset, count - len(rows))
+        return rows
+
+    def count_against(self, opponent):
+        if self._entries is not None: return count_against(self._entries, opponent)
+        stored = self.source.count_history_against(self.fighter_id, opponent) if self.stored else 0
+        return stored + count_against(self.pending, opponent)
+
+    def __len__(self): return self.stored + len(self.pending)
+    def __bool__(self): return len(self) > 0
+    def __iter__(self): return iter(self.entries())
+    def __reversed__(self): return reversed(self.entries())
+    def __getitem__(self, i): return self.entries()[i]
+
+def count_against(history, opponent):
+    # Previous fights against this opponent (rivalry / rematch checks)
+    if isinstance(history, FightHistory): return history.count_against(opponent)
+    return sum(1 for x in history if x['opponent'] == opponent)
+
+def history_page(history, start, count):
+    # Same paging for plain lists (fresh rosters, compact fighters) and FightHistory
+    if isinstance(history, FightHistory): return history.page(start, count)
+    end = len(history) - start
+    return history[max(0, end - count):max(0, end)][::-1]
@@ -0,0 +1,165 @@
+import json
+import os
+from numbers import Number
+
+import metrics
+
+# --- ROSTER IMPORT ---
+# Loads the starting world from JSON in one pass over every source, in priority order: roster.json
+# (the working roster), rosterReal.json (the real-life reference roster) and data/free_agents.json.
+# Files are read in chunks and each array element is decoded, validated and turned into a fighter
+# on its own, so a generated universe of hundreds of MB never sits in memory as raw JSON and
+# objects at the same time. Bad records are skipped and reported, never silently dropped.
+SOURCES = [("roster.json", "roster"), ("rosterReal.json", "roster"), (os.path.join('data', 'free_agents.json'), "free_agent")]
+CHUNK_SIZE = 1 << 20
+STAT_KEYS = ["striking", "grappling", "tdd", "sub_off", "sub_def", "chin", "cardio"]
+
+# A name that is already loaded, by (kind already loaded, incoming kind):
+#   fill     keep the first record, copy over only the optional fields it left out
+#   skip     keep the first record, drop the new one
+#   replace  drop the first record, load the new one
+CONFLICT_RULES = {
+    ("roster", "roster"): "fill",
+    ("roster", "free_agent"): "skip",      # a signed fighter is never also a free agent
+    ("free_agent", "free_agent"): "skip",
+    ("free_agent", "roster"): "replace",   # the contract wins, only if a custom order loads free agents first
+}
+# Optional fields and the defaults Fighter() falls back on, the ones "fill" can copy over
+FILLABLE = {"nickname": "", "traits": [], "injury_months": 0, "popularity": 10, "age": 25}
+
+class ImportReport:
+    def __init__(self):
+        self.loaded = {}      # source -> records loaded from it
+        self.skipped = []     # (source, index, name, reason)
+        self.conflicts = []   # (rule, name, source, detail)
+        self.missing = []     # sources that don't exist
+
+    def summary(self):
+        parts = [f"{src}: {n}" for src, n in self.loaded.items()]
+        rules = {}
+        for rule, *_ in self.conflicts: rules[rule] = rules.get(rule, 0) + 1
+        parts += [f"{n} name conflicts ({rule})" for rule, n in rules.items()]
+        if self.skipped: parts.append(f"{len(self.skipped)} invalid records skipped")
+        if self.missing: parts.append(f"missing: {', '.join(self.missing)}")
+        return ", ".join(parts)
+
+    def notable(self):
+        # Invalid records, or name clashes that dropped or changed a fighter. Duplicates that only
+        # confirm the first record (roster.json vs rosterReal.json) are expected every start.
+        return bool(self.skipped) or any(rule != "fill" or detail != "kept first" for rule, _, _, detail in self.conflicts)
+
+    def log(self, log=print):
+        # Counts always go to the metrics log; the console only hears about a notable import, with a
+        # line per invalid record so nothing bad is dropped quietly
+        metrics.count("import.records", sum(self.loaded.values())); metrics.count("import.skipped", len(self.skipped))
+        if not self.notable(): return
+        log(f"Roster import: {self.summary()}")
+        for src, index, name, reason in self.skipped: log(f"  skipped {src}[{index}] {name or '?'}: {reason}")
+
+def iter_json_array(path, chunk_size=CHUNK_SIZE):
+    # Yields the elements of a top-level JSON array one at a time, reading the file in chunks
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buf = ""; pos = 0; eof = False; started = False
+        expect = "first"  # "first" (an item or ]), "item" (after a comma) or "comma" (a comma or ])
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n": pos += 1
+            if pos >= len(buf) or (not eof and len(buf) - pos < 64):
+                if eof:
+                    if pos >= len(buf): raise ValueError(f"{path}: unexpected end of file")
+                else:
+                    chunk = f.read(chunk_size); eof = not chunk
+                    buf = buf[pos:] + chunk; pos = 0
+                    continue
+            if not started:
+                if buf[pos] != "[": raise ValueError(f"{path}: expected a JSON array")
+                started = True; pos += 1; continue
+            c = buf[pos]
+            if expect == "comma":
+                if c == "]": return
+                if c != ",": raise ValueError(f"{path}: expected ',' or ']' after an array item, found {c!r}")
+                expect = "item"; pos += 1; continue
+            if c == "]":
+                if expect == "first": return
+                raise ValueError(f"{path}: trailing comma before ']'")
+            if c == ",": raise ValueError(f"{path}: expected an array item, found ','")
+            try: item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError as e:
+                if eof: raise ValueError(f"{path}: {e}") from None
+                chunk = f.read(chunk_size); eof = not chunk
+                buf = buf[pos:] + chunk; pos = 0
+                continue
+            yield item
+            pos = end; expect = "comma"
+
+def validate(data):
+    # Problems that would make Fighter(data) fail or the engine misbehave, [] if the record is usable
+    from game_logic import WEIGHT_CLASSES
+    if not isinstance(data, dict): return ["not an object"]
+    problems = []
+    if not isinstance(data.get('name'), str) or not data['name'].strip(): problems.append("missing name")
+    if data.get('weight_class') not in WEIGHT_CLASSES: problems.append(f"unknown weight class {data.get('weight_class')!r}")
+    stats = data.get('stats')
+    if not isinstance(stats, dict): problems.append("missing stats")
+    else:
+        for k in STAT_KEYS:
+            v = stats.get(k)
+            if not isinstance(v, Number) or isinstance(v, bool) or not 0 <= v <= 100: problems.append(f"stat {k} = {v!r}")
+    record = data.get('record')
+    if record is not None and (not isinstance(record, dict) or any(not isinstance(record.get(k), int) or record[k] < 0 for k in ("wins", "losses", "draws"))):
+        problems.append("bad record")
+    if 'traits' in data and (not isinstance(data['traits'], list) or not all(isinstance(t, str) for t in data['traits'])): problems.append("bad traits")
+    if 'is_champion' in data and not isinstance(data['is_champion'], bool): problems.append("bad is_champion")
+    for k in ("age", "popularity", "injury_months"):
+        if k in data and (not isinstance(data[k], Number) or isinstance(data[k], bool) or data[k] < 0): problems.append(f"bad {k}")
+    if 'history' in data and not isinstance(data['history'], list): problems.append("bad history")
+    return problems
+
+def import_world(registry, sources=SOURCES, make=None, base_dir=None):
+    # Adds every valid record of every source to registry, returns an ImportReport. Ids from roster
+    # files are kept when they are free; free agents, and records with a missing or taken id, get new
+    # ids once the pass is over so they can't collide with ids further down the files.
+    if make is None:
+        from game_logic import Fighter
+        make = Fighter
+    if base_dir is None: base_dir = os.path.dirname(os.path.abspath(__file__))
+    report = ImportReport()
+    seen = {}       # name -> [fighter, kind, fields it fell back to defaults for] imported this pass
+    deferred = {}   # name -> (fighter, kind) still waiting for an id
+
+    for rel_path, kind in sources:
+        path = os.path.join(base_dir, rel_path)
+        if not os.path.exists(path): report.missing.append(rel_path); continue
+        report.loaded[rel_path] = 0
+        for index, data in enumerate(iter_json_array(path)):
+            problems = validate(data)
+            if problems:
+                report.skipped.append((rel_path, index, data.get('name') if isinstance(data, dict) else None, "; ".join(problems))); continue
+            name = data['name']
+            if name not in seen and registry.find(name):
+                # Already registered before this import (find() prefers the signed fighter)
+                f = registry.find(name); seen[name] = [f, "roster" if registry.is_signed(f) else "free_agent", set()]
+            if name in seen:
+                f, old_kind, defaulted = seen[name]
+                rule = CONFLICT_RULES[(old_kind, kind)]
+                if rule == "fill":
+                    filled = [k for k in defaulted if k in data]
+                    for k in filled: setattr(f, k, data[k]); defaulted.discard(k)
+                    report.conflicts.append((rule, name, rel_path, f"filled {', '.join(filled)}" if filled else "kept first"))
+                    continue
+                if rule == "skip":
+                    report.conflicts.append((rule, name, rel_path, f"already a {old_kind.replace('_', ' ')}")); continue
+                report.conflicts.append((rule, name, rel_path, f"replaces {old_kind.replace('_', ' ')}"))
+                if deferred.pop(name, None) is None: registry.remove(f)
+
+            f = make(data)
+            seen[name] = [f, kind, {k for k in FILLABLE if k not in data}]
+            report.loaded[rel_path] += 1
+            fid = data.get('id')
+            if kind == "free_agent" or not isinstance(fid, int) or fid <= 0 or fid in registry.by_id: deferred[name] = (f, kind)
+            else: registry.add(f)
+
+    for f, kind in deferred.values():
+        f.id = registry.allocate_id()
+        registry.add(f, free_agent=(kind == "free_agent"))
+    return report
@@ -0,0 +1,159 @@
+import time
+
+import numpy as np
+
+from game_logic import WEIGHT_CLASSES, CARD_SLOTS_KEYS
+from history import count_against
+from predictor import predict_matchup
+from rankings import rank_key
+from traits import trait_mods
+
+# --- MATCHMAKER ---
+# Builds a full card to maximise what run_card pays out on: main event popularity and the card's
+# average stars, plus rivalry value on top. Every pair of healthy, rested, near-ranked fighters in a
+# division is a candidate. A closed-form version of the engine's finish odds scores all of them at
+# once, the best few are re-scored with the Monte Carlo predictor, and a branch-and-bound search
+# picks the set of non-overlapping bouts worth the most. Both are budgeted in work done (predictor
+# calls, search nodes), so the same roster and seed always give the same card; the GUI can add a
+# wall-clock cap on top.
+RANK_WINDOW = 3          # fighters are only matched with the next 3 healthy fighters below them
+REST_EVENTS = 2          # fighters from the last 2 cards sit this one out
+MAX_PER_DIVISION = 3
+MAIN_OPTIONS = 4         # main events the search tries a full undercard for
+POOL_SIZE = 40           # undercard bouts the search picks from
+REFINE_SIMS = 400
+REFINE_BUDGET = 24       # predictor calls per card, about 0.2 s
+NODE_BUDGET = 20000      # branch-and-bound nodes per card, a normal search needs a few dozen
+TIME_BUDGET = 0.5        # optional wall-clock cap for interactive use
+POP_BUYS = 4000; STAR_BUYS = 25000 / len(CARD_SLOTS_KEYS)   # run_card: main_event_pop * 4000 + avg_stars * 25000
+RIVALRY_BUYS = 8000      # per previous meeting, up to a trilogy
+
+STAT_KEYS = ["striking", "grappling", "tdd", "sub_off", "sub_def", "chin", "popularity"]
+MOD_KEYS = ["chin", "volume", "power", "accuracy", "takedown", "submission", "finish"]
+
+def fighter_table(fighters):
+    # Column arrays over the candidate fighters, compiled trait numbers under "m_<name>"
+    rows = [[getattr(f, k) for k in STAT_KEYS] + [getattr(m, k) for k in MOD_KEYS]
+            for f, m in ((f, trait_mods(f)) for f in fighters)]
+    cols = np.array(rows, dtype=np.float64).reshape(len(rows), len(STAT_KEYS) + len(MOD_KEYS)).T
+    return dict(zip(STAT_KEYS + ["m_" + k for k in MOD_KEYS], cols))
+
+def quick_stars(t, a, b, rounds=3):
+    # Expected stars of a vs b for index arrays a and b, from per-exchange finish rates of the
+    # fight engine's rules (gassing and damage build-up left out). Tracks predict_matchup closely
+    # enough to rank thousands of pairs, the ones that matter get the real predictor afterwards.
+    exchanges = 5 * rounds
+    share = t["m_volume"][a] / (t["m_volume"][a] + t["m_volume"][b])
+    ko_rate = 0.0; sub_rate = 0.0; heavy = 0.0
+    for x, y, s in ((a, b, share), (b, a, 1 - share)):
+        grap = t["grappling"][x] > t["striking"][x]
+        hit = np.clip((t["striking"][x] + t["m_accuracy"][x] - t["striking"][y] + 20.5) / 41, 0, 1)
+        td = np.clip((t["grappling"][x] + t["m_takedown"][x] - t["tdd"][y] + 20.5) / 41, 0, 1)
+        sub = np.clip((t["sub_off"][x] + t["m_submission"][x] - t["sub_def"][y] - 9.5) / 21, 0, 1)
+        chin = t["chin"][y] * t["m_chin"][y] - t["m_power"][x] - 10   # about 20 head damage taken by the time it matters
+        ko = np.clip((100 - chin) / 101, 0, 1); kd = np.clip((85 - chin) / 101, 0, 1)
+        heavy_x = s * ~grap * hit * 0.2
+        ko_rate = ko_rate + heavy_x * (ko + (1 - ko) * kd * t["m_finish"][x])
+        sub_rate = sub_rate + s * grap * td * sub
+        heavy = heavy + heavy_x
+    hazard = np.minimum(ko_rate + sub_rate, 1.0)
+    p_finish = 1 - (1 - hazard) ** exchanges
+    ko_share = np.divide(ko_rate, hazard, out=np.zeros_like(hazard), where=hazard > 0)
+    p_ko = p_finish * ko_share; p_sub = p_finish - p_ko
+    p_r1 = 1 - (1 - hazard) ** 5
+    damage = 20 * heavy * exchanges * (1 - p_finish / 2)   # finished fights stop about halfway
+    p_action = np.clip((damage - 60) / 80, 0, 1)
+    p_quiet = np.clip((40 - damage) / 30, 0, 1) * (1 - p_finish)
+    return np.clip(2 + 2 * p_ko + p_sub + p_r1 + p_action - p_quiet, 1, 5)
+
+def recently_booked(game_data, events=REST_EVENTS):
+    return {name for event in game_data.event_history[-events:] for res in event['results'] for name in (res['winner'], res['loser'])}
+
+def build_card(roster, rankings=None, recent=(), refine_budget=REFINE_BUDGET, node_budget=NODE_BUDGET, time_budget=None):
+    # Returns {slot: [red, blue]} for every slot in CARD_SLOTS_KEYS, or None if the roster can't fill it.
+    # With a time_budget the card can also depend on machine speed, leave it out for seeded runs.
+    deadline = time.perf_counter() + time_budget if time_budget is not None else float("inf")
+    recent = set(recent)
+    if rankings is not None: ordered = rankings.order
+    else:
+        ordered = {}
+        for f in roster: ordered.setdefault(f.weight_class, []).append(f)
+        for fighters in ordered.values(): fighters.sort(key=rank_key)
+
+    # Candidates: each fighter against the next RANK_WINDOW available fighters in their division
+    fighters = []; red = []; blue = []; div_of = []
+    for d, div in enumerate(WEIGHT_CLASSES):
+        start = len(fighters)
+        fighters.extend(f for f in ordered.get(div, ()) if f.injury_months == 0 and f.name not in recent)
+        n = len(fighters) - start
+        div_of.extend([d] * n)
+        for k in range(1, min(RANK_WINDOW, n - 1) + 1):
+            idx = np.arange(start, start + n - k); red.append(idx); blue.append(idx + k)
+    if not red: return None
+    red = np.concatenate(red); blue = np.concatenate(blue); div_of = np.array(div_of)
+    t = fighter_table(fighters)
+    stars = quick_stars(t, red, blue)
+
+    # Main event: a title fight if any champion can defend, otherwise the most popular pairing
+    champ = np.array([f.is_champion for f in fighters], dtype=bool)
+    title = champ[red] | champ[blue]
+    main_idx = np.flatnonzero(title) if title.any() else np.arange(len(red))
+    main_stars = quick_stars(t, red[main_idx], blue[main_idx], rounds=5) + title[main_idx]
+    main_value = POP_BUYS * (t["popularity"][red[main_idx]] + t["popularity"][blue[main_idx]]) + STAR_BUYS * main_stars
+    keep = np.argsort(-main_value, kind="stable")[:MAIN_OPTIONS]
+    mains = [[main_value[k], main_idx[k]] for k in keep]
+    # Each main event knocks out at most 4 * RANK_WINDOW undercard candidates
+    top = np.argsort(-stars, kind="stable")[:POOL_SIZE + 4 * RANK_WINDOW]
+    pool = [[STAR_BUYS * stars[c], c] for c in top]
+
+    # Re-score the front runners with the predictor, within half the time cap if there is one
+    refine_until = deadline - time_budget / 2 if time_budget is not None else deadline
+    for option, is_main in ([(o, True) for o in mains] + [(p, False) for p in pool])[:refine_budget]:
+        if time.perf_counter() > refine_until: break
+        c = option[1]; f1 = fighters[red[c]]; f2 = fighters[blue[c]]
+        pred = predict_matchup(f1, f2, is_main=is_main, n_sims=REFINE_SIMS, seed=0)
+        meetings = min(count_against(f1.history, f2.name), 2)
+        option[0] = STAR_BUYS * pred["expected_stars"] + RIVALRY_BUYS * meetings + (POP_BUYS * (f1.popularity + f2.popularity) if is_main else 0)
+    mains.sort(key=lambda o: -o[0]); pool.sort(key=lambda o: -o[0])
+
+    best = (-1.0, None, None)
+    nodes = [node_budget]  # shared by every main event's search
+    for value, m in mains:
+        used = {red[m], blue[m]}
+        bouts = [(v, red[c], blue[c], div_of[red[c]]) for v, c in pool if red[c] not in used and blue[c] not in used][:POOL_SIZE]
+        div_count = [0] * len(WEIGHT_CLASSES); div_count[div_of[red[m]]] += 1
+        total, picks = _best_undercard(bouts, len(CARD_SLOTS_KEYS) - 1, used, div_count, nodes, deadline)
+        if picks is not None and value + total > best[0]: best = (value + total, m, [bouts[k] for k in picks])
+        if nodes[0] <= 0 or time.perf_counter() > deadline: break
+    if best[1] is None: return None
+
+    _, m, undercard = best
+    card = {"Main Event": [fighters[red[m]], fighters[blue[m]]]}
+    for slot, (_, i, j, _) in zip(CARD_SLOTS_KEYS[1:], undercard): card[slot] = [fighters[i], fighters[j]]
+    return card
+
+def _best_undercard(bouts, slots, used, div_count, nodes, deadline):
+    # Depth-first over bouts sorted by value, so the first card found is the greedy one. Branches
+    # are cut when even the next best bouts can't beat the best card so far, or once a card is found
+    # and the node budget (nodes[0], counted down) or the time runs out.
+    prefix = [0.0]
+    for b in bouts: prefix.append(prefix[-1] + b[0])
+    best = [-1.0, None]; chosen = []
+
+    def search(start, total):
+        if len(chosen) == slots:
+            if total > best[0]: best[0] = total; best[1] = list(chosen)
+            return
+        need = slots - len(chosen)
+        for k in range(start, len(bouts) - need + 1):
+            if total + prefix[k + need] - prefix[k] <= best[0]: return
+            if best[1] is not None and (nodes[0] <= 0 or time.perf_counter() > deadline): return
+            value, i, j, d = bouts[k]
+            if i in used or j in used or div_count[d] >= MAX_PER_DIVISION: continue
+            nodes[0] -= 1
+            used.add(i); used.add(j); div_count[d] += 1; chosen.append(k)
+            search(k + 1, total + value)
+            chosen.pop(); used.discard(i); used.discard(j); div_count[d] -= 1
+
+    search(0, 0.0)
+    return best[0], best[1]
@@ -0,0 +1,110 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+
+# --- INSTRUMENTATION ---
+# Named spans and counters around the phases of an event run, summed per event and appended to a
+# rolling JSON-lines log. Off unless MMA_METRICS=1 is set or enable() is called (the GUI's F12
+# overlay does that). While off, span() hands back one shared do-nothing context manager and
+# count() returns straight away, so call sites can stay in the hot paths.
+#   with metrics.span("card.simulate"): ...
+#   metrics.count("card.fights")
+ENABLED = os.environ.get("MMA_METRICS", "") not in ("", "0")
+LOG_LINES = 200  # records kept in the log file and in memory
+
+class _NullSpan:
+    __slots__ = ()
+    def __enter__(self): return self
+    def __exit__(self, *exc): return False
+
+_NULL = _NullSpan()
+
+class _Span:
+    __slots__ = ("name", "start")
+    def __init__(self, name): self.name = name
+    def __enter__(self):
+        self.start = time.perf_counter(); return self
+    def __exit__(self, *exc):
+        _recorder.add_time(self.name, time.perf_counter() - self.start); return False
+
+class Recorder:
+    # Spans and counters can come from the event worker thread and the Tk thread at the same time
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.history = deque(maxlen=LOG_LINES)
+        self.log_path = None; self.log_lines = 0
+        self.begin_event(None)
+
+    def begin_event(self, label):
+        with self.lock:
+            self.label = label; self.started = time.perf_counter()
+            self.spans = {}; self.counters = {}
+
+    def add_time(self, name, seconds):
+        with self.lock:
+            entry = self.spans.get(name)
+            if entry is None: self.spans[name] = [seconds, 1]
+            else: entry[0] += seconds; entry[1] += 1
+
+    def add_count(self, name, n):
+        with self.lock: self.counters[name] = self.counters.get(name, 0) + n
+
+    def end_event(self):
+        with self.lock:
+            record = {"event": self.label, "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                      "wall_ms": round((time.perf_counter() - self.started) * 1000, 3),
+                      "spans": {name: {"ms": round(s * 1000, 3), "calls": calls} for name, (s, calls) in sorted(self.spans.items())},
+                      "counters": dict(sorted(self.counters.items()))}
+        self.history.append(record)
+        if self.log_path: self._append(record)
+        return record
+
+    def set_log(self, path):
+        self.log_path = path; self.log_lines = 0
+        if path and os.path.exists(path):
+            with open(path, 'r') as f: self.log_lines = sum(1 for _ in f)
+
+    def _append(self, record):
+        os.makedirs(os.path.dirname(os.path.abspath(self.log_path)), exist_ok=True)
+        with open(self.log_path, 'a') as f: f.write(json.dumps(record) + "\n")
+        self.log_lines += 1
+        if self.log_lines > 2 * LOG_LINES:
+            # Trim back to the newest LOG_LINES records, amortised over LOG_LINES appends
+            with open(self.log_path, 'r') as f: keep = deque(f, maxlen=LOG_LINES)
+            with open(self.log_path, 'w') as f: f.writelines(keep)
+            self.log_lines = len(keep)
+
+_recorder = Recorder()
+
+def enable(on=True):
+    global ENABLED
+    ENABLED = on
+
+def span(name): return _Span(name) if ENABLED else _NULL
+
+def count(name, n=1):
+    if ENABLED: _recorder.add_count(name, n)
+
+def add_time(name, seconds):
+    # For phases that don't fit a with-block, e.g. startup time measured across callbacks
+    if ENABLED: _recorder.add_time(name, seconds)
+
+def set_log(path): _recorder.set_log(path)
+
+def begin_event(label):
+    if ENABLED: _recorder.begin_event(label)
+
+def end_event():
+    return _recorder.end_event() if ENABLED else None
+
+def last_event(): return _recorder.history[-1] if _recorder.history else None
+
+def format_event(record):
+    # Text breakdown for the debug overlay, slowest phase first
+    lines = [f"{record['event']}  wall {record['wall_ms']:.0f} ms"]
+    for name, s in sorted(record["spans"].items(), key=lambda kv: -kv[1]["ms"]):
+        lines.append(f"{name:<22}{s['ms']:>9.1f} ms {s['calls']:>6}x")
+    for name, n in record["counters"].items(): lines.append(f"{name:<22}{n:>9}")
+    return "\n".join(lines)
@@ -0,0 +1,105 @@
+import json
+import os
+import re
+from collections import deque
+
+# --- NEWS FEED ---
+# Bounded ring buffer of news items (oldest evicted first) with an optional JSON-lines archive on
+# disk for what falls out of memory. Every item gets a sequence number, and two small indexes map
+# category ("INJURY", "RETIREMENT", "PROSPECT ALERT", ...) and fighter name to sequence numbers,
+# so filtered pages are slices instead of scans. The GUI only ever asks for one page or for the
+# items added since it last rendered.
+NEWS_CAPACITY = 500
+_CATEGORY_RE = re.compile(r"^\W*([A-Z][A-Z' -]*[A-Z])\s*[:!]")
+
+def news_category(message):
+    match = _CATEGORY_RE.match(message)
+    return match.group(1) if match else "GENERAL"
+
+class NewsFeed:
+    def __init__(self, capacity=NEWS_CAPACITY, archive_path=None):
+        self.capacity = capacity
+        self.items = deque()  # (seq, text, category, fighter names) oldest first, at most capacity of them
+        self.count = 0        # items ever added, also the next sequence number
+        self.by_category = {}
+        self.by_fighter = {}  # lower-cased name -> seqs
+        self.archive_path = archive_path
+        self.offsets = {}     # seq -> byte offset of the archived line
+        self._archive = None
+        if archive_path:
+            os.makedirs(os.path.dirname(os.path.abspath(archive_path)), exist_ok=True)
+            open(archive_path, 'w').close()  # one archive per session
+
+    def add(self, text, fighters=(), category=None):
+        seq = self.count; self.count += 1
+        category = category or news_category(text)
+        names = tuple(fighters)
+        self.items.append((seq, text, category, names))
+        self.by_category.setdefault(category, []).append(seq)
+        for name in names: self.by_fighter.setdefault(name.lower(), []).append(seq)
+        while len(self.items) > self.capacity: self._evict()
+        return seq
+
+    def add_many(self, entries):
+        # add() for a batch of (text, fighter names, category), evicting once at the end. Returns how many were added
+        by_category = self.by_category; by_fighter = self.by_fighter; items = self.items; first = self.count
+        for text, fighters, category in entries:
+            seq = self.count; self.count += 1
+            category = category or news_category(text)
+            names = tuple(fighters)
+            items.append((seq, text, category, names))
+            by_category.setdefault(category, []).append(seq)
+            for name in names: by_fighter.setdefault(name.lower(), []).append(seq)
+        while len(items) > self.capacity: self._evict()
+        return self.count - first
+
+    def _evict(self):
+        entry = self.items.popleft()
+        if not self.archive_path: return
+        if self._archive is None: self._archive = open(self.archive_path, 'a', encoding='utf-8')
+        self.offsets[entry[0]] = self._archive.tell()
+        self._archive.write(json.dumps(entry) + "\n")
+
+    def first_in_memory(self):
+        return self.items[0][0] if self.items else self.count
+
+    def entry(self, seq):
+        first = self.first_in_memory()
+        if seq >= first: return self.items[seq - first]
+        if seq not in self.offsets: return None  # evicted without an archive
+        self._archive.flush()
+        with open(self.archive_path, 'r', encoding='utf-8') as f:
+            f.seek(self.offsets[seq]); seq, text, category, names = json.loads(f.readline())
+        return (seq, text, category, tuple(names))
+
+    def get(self, seq):
+        entry = self.entry(seq)
+        return entry[1] if entry else None
+
+    def seqs(self, category=None, fighter=None):
+        if category and fighter:
+            named = set(self.by_fighter.get(fighter.lower(), []))
+            return [s for s in self.by_category.get(category, []) if s in named]
+        if category: return self.by_category.get(category, [])
+        if fighter: return self.by_fighter.get(fighter.lower(), [])
+        return range(self.count)
+
+    def page(self, page, size, category=None, fighter=None):
+        # Newest first; returns [(seq, text)] skipping items that are gone (no archive)
+        seqs = self.seqs(category, fighter)
+        end = len(seqs) - page * size
+        picked = seqs[max(0, end - size):max(0, end)]
+        rows = [(s, self.get(s)) for s in reversed(picked)]
+        return [(s, text) for s, text in rows if text is not None]
+
+    def total(self, category=None, fighter=None): return len(self.seqs(category, fighter))
+
+    def since(self, seq):
+        # Items added after seq, oldest first (for incremental rendering)
+        return [(s, self.get(s)) for s in range(max(seq + 1, 0), self.count)]
+
+    def latest(self, n=10): return [e[1] for e in list(self.items)[-n:][::-1]]
+
+    def categories(self): return sorted(self.by_category)
+
+    def __len__(self): return self.count
@@ -0,0 +1,134 @@
+import numpy as np
+from traits import trait_mods
+
+# --- MONTE CARLO MATCHUP PREDICTOR ---
+# Runs the same rules as fight_engine.simulate_fight, but for thousands of fights at once:
+# every per-fight variable is an array with one entry per simulated fight and each
+# exchange is a handful of masked array updates. No commentary, no record updates.
+STAT_KEYS = ["striking", "grappling", "tdd", "sub_off", "sub_def", "chin", "cardio"]
+DEFAULT_SIMS = 10000
+
+def predict_matchup(f1, f2, is_main=False, n_sims=DEFAULT_SIMS, seed=None):
+    rng = np.random.default_rng(seed)
+    is_title = is_main and (f1.is_champion or f2.is_champion)
+    swapped = f2.is_champion and not f1.is_champion
+    a_obj, b_obj = (f2, f1) if swapped else (f1, f2)
+    rounds = 5 if is_title or is_main else 3
+
+    # Per-fighter stats as length-2 arrays (index 0 = red corner, 1 = blue corner)
+    st = {k: np.array([getattr(a_obj, k), getattr(b_obj, k)], dtype=np.float64) for k in STAT_KEYS}
+    prefers_grappling = st["grappling"] > st["striking"]
+    mods = [trait_mods(a_obj), trait_mods(b_obj)]
+    tm = {k: np.array([getattr(m, k) for m in mods], dtype=np.float64) for k in ["damage", "chin", "recovery", "power", "accuracy", "takedown", "submission", "finish"]}
+    round_scale = np.array([m.round_scale for m in mods], dtype=np.float64)
+    p_red = mods[0].volume / (mods[0].volume + mods[1].volume)
+
+    n = n_sims
+    # Per-fight state is stored as (2, n): row 0 = red corner, row 1 = blue corner
+    stamina = np.full((2, n), 100.0)
+    dmg_head = np.zeros((2, n)); dmg_legs = np.zeros((2, n))
+    gassed = np.zeros((2, n), dtype=bool)
+    dealt = np.zeros((2, n))
+    judge = np.zeros((2, 3, n), dtype=np.int32)
+    damage_exchanged = np.zeros(n)
+    finished = np.zeros(n, dtype=bool)
+    winner = np.full(n, -1, dtype=np.int8)
+    method = np.zeros(n, dtype=np.int8)  # 1 = KO, 2 = SUB, 3 = DECISION, 4 = SPLIT DECISION
+    finish_round = np.full(n, rounds, dtype=np.int8)
+    recovery = (10 + st["cardio"] * 0.1) * tm["recovery"]
+
+    # Masked arithmetic instead of np.where: the masks are random, so branchy selects mispredict badly
+    def pick(arr, side):
+        if arr.dtype == bool: return (arr[1] & side) | (arr[0] & ~side)
+        return arr[0] + (arr[1] - arr[0]) * side
+    def add(arr, side, val): arr[1] += val * side; arr[0] += val * ~side
+
+    for r in range(1, rounds + 1):
+        live = ~finished
+        for c in (0, 1):
+            np.minimum(100, stamina[c] + recovery[c], out=stamina[c], where=live)
+            gassed[c] |= (stamina[c] < 40) & live
+        r_stats = np.zeros((2, n)); knockdown = np.zeros((2, n), dtype=bool)
+
+        # All random draws for the round in one go, one row per exchange
+        att_rolls = rng.random((5, n)) >= p_red
+        noise_rolls = rng.integers(-20, 21, (5, n))
+        sub_rolls = rng.integers(0, 21, (5, n))
+        hit_rolls = rng.integers(1, 11, (5, n))
+        ko_rolls = rng.integers(0, 101, (5, n)); kd_rolls = rng.integers(0, 101, (5, n))
+        finish_rolls = rng.random((5, n))
+        scale = round_scale[:, r - 1]
+
+        for x in range(5):
+            live = ~finished
+            att = att_rolls[x]; dfn = ~att
+            noise = noise_rolls[x]
+            att_pen = (1.0 - 0.4 * pick(gassed, att)) * pick(scale, att); def_pen = (1.0 - 0.4 * pick(gassed, dfn)) * pick(scale, dfn)
+            dmg = pick(tm["damage"], att)
+            add(stamina, att, -8.0 * live)
+
+            # Grappling exchanges
+            grap = live & pick(prefers_grappling, att)
+            defn = pick(st["tdd"], dfn) * def_pen - 15 * (pick(dmg_legs, dfn) > 30)
+            td = grap & (pick(st["grappling"], att) * att_pen + pick(tm["takedown"], att) + noise > defn)
+            add(r_stats, att, 10.0 * td); add(stamina, att, -(5.0 * td + 12.0 * (grap & ~td))); add(dealt, att, 5.0 * td)
+            sub = td & (pick(st["sub_off"], att) + pick(tm["submission"], att) + sub_rolls[x] > pick(st["sub_def"], dfn) + 30)
+
+            # Striking exchanges
+            strike = live & ~grap
+            hit = strike & (pick(st["striking"], att) * att_pen + pick(tm["accuracy"], att) + noise > pick(st["striking"], dfn) * def_pen)
+            roll = hit_rolls[x]
+            leg = hit & (roll <= 2); body = hit & (roll > 2) & (roll <= 4)
+            light = hit & (roll > 4) & (roll <= 8); heavy = hit & (roll > 8)
+            add(dmg_legs, dfn, 15.0 * dmg * leg)
+            add(stamina, dfn, -15.0 * dmg * body)
+            add(dmg_head, dfn, (8.0 * light + 20.0 * heavy) * dmg)
+            damage_exchanged += 20 * heavy
+            chin_stat = pick(st["chin"], dfn) * pick(tm["chin"], dfn) - pick(dmg_head, dfn) * 0.5 - pick(tm["power"], att)
+            ko = heavy & (ko_rolls[x] > chin_stat)
+            kd = heavy & ~ko & (kd_rolls[x] > chin_stat + 15)
+            ko |= kd & (finish_rolls[x] < pick(tm["finish"], att))
+            add(r_stats, att, 5.0 * leg + 8.0 * body + 5.0 * light + 15.0 * heavy + 20.0 * kd)
+            knockdown[1] |= kd & att; knockdown[0] |= kd & dfn
+            add(dealt, att, (5.0 * leg + 8.0 * body + 5.0 * light + 20.0 * heavy) * ~ko)
+
+            done = ko | sub
+            winner += done * (1 + att); method += ko + 2 * sub
+            finish_round -= done * (rounds - r); finished |= done
+
+        # Judges score the round for fights still going
+        live = ~finished
+        variance = rng.integers(-2, 3, (3, n))
+        j1 = r_stats[0] + variance; j2 = r_stats[1]
+        big1 = knockdown[0] | (j1 - j2 > 25); big2 = knockdown[1] | (j2 - j1 > 25)
+        p1 = np.where(j1 > j2, 10, np.where(j2 > j1, np.where(big2, 8, 9), 10))
+        p2 = np.where(j2 > j1, 10, np.where(j1 > j2, np.where(big1, 8, 9), 10))
+        judge[0] += p1 * live; judge[1] += p2 * live
+
+    # Decisions
+    dec = ~finished
+    votes1 = (judge[0] > judge[1]).sum(axis=0); votes2 = (judge[1] > judge[0]).sum(axis=0)
+    dec_winner = np.where(votes1 > votes2, 0, np.where(votes2 > votes1, 1, np.where(dealt[0] > dealt[1], 0, 1)))
+    unanimous = ((votes1 > votes2) & (votes2 == 0)) | ((votes2 > votes1) & (votes1 == 0))
+    winner[dec] = dec_winner[dec]
+    method[dec] = np.where(unanimous, 3, 4)[dec]
+
+    stars = np.full(n, 2)
+    stars += 2 * (method == 1) + (method == 2) + (finish_round == 1) + (damage_exchanged > 100)
+    stars -= (damage_exchanged < 30) & (method >= 3)
+    if is_title: stars += 1
+    stars = np.clip(stars, 1, 5)
+
+    p_red = float((winner == 0).mean())
+    p1_win = 1.0 - p_red if swapped else p_red
+    return {
+        "f1": f1.name, "f2": f2.name, "sims": n,
+        "f1_win": p1_win, "f2_win": 1.0 - p1_win,
+        "ko": float((method == 1).mean()), "sub": float((method == 2).mean()), "dec": float((method >= 3).mean()),
+        "expected_stars": float(stars.mean()), "title_fight": is_title, "rounds": rounds
+    }
+
+def format_prediction(p):
+    return (f"{p['f1']}: {p['f1_win']:.0%}  |  {p['f2']}: {p['f2_win']:.0%}\n"
+            f"KO {p['ko']:.0%} / SUB {p['sub']:.0%} / DEC {p['dec']:.0%}\n"
+            f"Expected: {'★' * int(round(p['expected_stars']))} ({p['expected_stars']:.1f})")
@@ -0,0 +1,202 @@
+import argparse
+import json
+import multiprocessing as mp
+import queue
+import random
+import time
+
+from game_logic import WEIGHT_CLASSES, GameData, Fighter, update_rankings_logic, generate_rookie, process_monthly_events
+from fight_engine import run_card
+from importer import import_world
+from matchmaker import build_card, recently_booked
+from registry import RosterRegistry
+
+# --- MULTI-PROMOTION WORLD ---
+# Several promotions side by side, each with its own roster, rankings and event calendar, all
+# signing from one free-agent market. Every promotion runs its monthly cycle (card, monthly events)
+# in its own worker process; the parent process only runs the market.
+# Once a month each promotion sends the market its bids and the free agents its scouting turned up.
+# The market settles a month once every promotion's message for it is in. Bids on a fighter no one
+# else wants simply go through; a contested fighter goes to the best offer. Signings land
+# MARKET_LAG months after the bids, so a promotion only ever waits on the others if it gets that
+# far ahead. Who signs whom depends only on the bids, never on which process reports first.
+MARKET_LAG = 2         # months between bidding and the fighter joining the roster
+MARKET_MONTHS = 6      # unsigned free agents leave the market after this long
+ROSTER_TARGET = 12     # promotions bid for divisions with fewer fighters than this
+MIN_DIVISION = 8       # starting divisions are topped up with rookies to this size
+BIDS_PER_MONTH = 3
+OFFER_SHARE = 0.01     # a promotion offers this share of its recent average buys per signing, plus a base
+BASE_OFFER = 1000
+BOOKING_REFINES = 6    # predictor calls per card
+
+# --- PROMOTION WORKER ---
+def run_promotion(index, name, seed, months, roster_data, listing, inbox, outbox):
+    random.seed(seed)
+    registry = RosterRegistry(Fighter(d) for d in roster_data)
+    for div in WEIGHT_CLASSES:
+        while registry.division_size(div) < MIN_DIVISION:
+            rookie = generate_rookie(registry); rookie.weight_class = div; registry.add(rookie)
+    roster = registry.roster
+    rankings = update_rankings_logic(roster)
+    game_data = GameData(promotion=name)
+    summary = {"name": name, "events": 0, "bids": 0, "signings": 0, "retirements": 0, "roster_size": [len(roster)]}
+
+    for month in range(months):
+        if month >= MARKET_LAG:
+            reply = inbox.get()
+            for data in reply["signed"]:
+                data['id'] = registry.allocate_id()
+                registry.add(Fighter(data))
+            summary["signings"] += len(reply["signed"])
+            listing = reply["listing"]
+            rankings.sync(roster)
+
+        card = build_card(roster, rankings, recent=recently_booked(game_data), refine_budget=BOOKING_REFINES)
+        if card:
+            run_card(card, roster, game_data, rankings=rankings)
+            summary["events"] += 1
+        game_data.advance_time()
+        before = len(roster); first_new_id = registry.next_id
+        process_monthly_events(registry, game_data)
+        summary["retirements"] += before - sum(f.id < first_new_id for f in roster)
+
+        # Prospects and scouted rookies go to the shared market rather than a private pool
+        scouted = list(registry.free_agents)
+        registry.remove_many(scouted)
+        rankings.sync(roster)
+        bids = choose_bids(registry, listing, game_data)
+        summary["bids"] += len(bids)
+        outbox.put(("month", index, month, bids, [(f.to_dict(), f.scout_score()) for f in scouted]))
+        if game_data.month_index == 0: summary["roster_size"].append(len(roster))
+
+    summary["average_buys"] = round(game_data.stats.average_buys())
+    summary["champions"] = {div: len(game_data.stats.lineage(div)) for div in WEIGHT_CLASSES}
+    outbox.put(("done", index, summary))
+
+def choose_bids(registry, listing, game_data):
+    # Best listed fighter for each short-handed division, the most short-handed first
+    offer = BASE_OFFER + OFFER_SHARE * game_data.stats.average_buys(last=6)
+    short = sorted(((registry.division_size(div) - ROSTER_TARGET, div) for div in WEIGHT_CLASSES))
+    best = {}
+    for key, _, div, score, _ in listing:
+        if div not in best or score > best[div][1]: best[div] = (key, score)
+    return [(best[div][0], offer) for gap, div in short if gap < 0 and div in best][:BIDS_PER_MONTH]
+
+# --- MARKET ---
+class Market:
+    def __init__(self, seed, free_agents=()):
+        self.rng = random.Random(seed)
+        self.entries = {}   # key -> {"data", "score", "listed"}
+        self.seen = set()   # (name, stats) of everyone ever listed, the same prospect debuts in every promotion
+        self.next_key = 1
+        self.contested = 0; self.signed = 0; self.expired = 0
+        for data, score in free_agents: self.list(data, score, 0)
+
+    def list(self, data, score, month):
+        identity = (data['name'], tuple(sorted(data['stats'].items())))
+        if identity in self.seen: return
+        self.seen.add(identity)
+        data.pop('id', None)
+        self.entries[self.next_key] = {"data": data, "score": score, "listed": month}
+        self.next_key += 1
+
+    def listing(self):
+        return [(key, e["data"]["name"], e["data"]["weight_class"], e["score"], e["data"].get("age", 25)) for key, e in self.entries.items()]
+
+    def settle(self, month, messages):
+        # messages[p] = (bids, scouted) from promotion p for this month. Returns the fighters each
+        # promotion signed.
+        offers = {}
+        for p, (bids, _) in enumerate(messages):
+            for key, offer in bids:
+                if key in self.entries: offers.setdefault(key, []).append((offer, p))
+        signed = [[] for _ in messages]
+        for key, bidders in sorted(offers.items()):
+            if len(bidders) == 1: winner = bidders[0][1]
+            else:
+                self.contested += 1
+                top = max(offer for offer, _ in bidders)
+                winner = self.rng.choice([p for offer, p in bidders if offer == top])
+            signed[winner].append(self.entries.pop(key)["data"])
+            self.signed += 1
+        for key in [key for key, e in self.entries.items() if month - e["listed"] >= MARKET_MONTHS]:
+            del self.entries[key]; self.expired += 1
+        for _, scouted in messages:
+            for data, score in scouted: self.list(data, score, month)
+        return signed
+
+# --- RUNNER ---
+def starting_rosters(n_promotions):
+    # The imported world dealt out by rank within each division, so every promotion starts about as
+    # strong, with its best fighter in each division as champion
+    registry = RosterRegistry()
+    report = import_world(registry)
+    report.log()
+    rankings = update_rankings_logic(registry.roster)
+    rosters = [[] for _ in range(n_promotions)]
+    for div in WEIGHT_CLASSES:
+        for rank, f in enumerate(rankings.division(div)):
+            data = f.to_dict()
+            data['is_champion'] = rank < n_promotions
+            data.pop('ranking_score', None)
+            rosters[rank % n_promotions].append(data)
+    free_agents = [(f.to_dict(), f.scout_score()) for f in registry.free_agents]
+    return rosters, free_agents
+
+def run_world(n_promotions, years, seed=0, names=None):
+    names = names or [f"Promotion {chr(65 + i)}" if i < 26 else f"Promotion {i + 1}" for i in range(n_promotions)]
+    months = years * 12
+    rosters, free_agents = starting_rosters(n_promotions)
+    market = Market(seed, free_agents)
+    outbox = mp.Queue(); inboxes = [mp.Queue() for _ in range(n_promotions)]
+    workers = [mp.Process(target=run_promotion, args=(i, names[i], seed * 1000 + i, months, rosters[i], market.listing(), inboxes[i], outbox), daemon=True)
+               for i in range(n_promotions)]
+    for w in workers: w.start()
+
+    pending = {}  # month -> {promotion: (bids, scouted)}
+    summaries = [None] * n_promotions
+    settled = 0
+    try:
+        while any(s is None for s in summaries):
+            try: msg = outbox.get(timeout=1)
+            except queue.Empty:
+                dead = [names[p] for p, w in enumerate(workers) if summaries[p] is None and not w.is_alive()]
+                if dead: raise RuntimeError(f"Promotion worker stopped: {', '.join(dead)}")
+                continue
+            if msg[0] == "done": summaries[msg[1]] = msg[2]; continue
+            _, p, month, bids, scouted = msg
+            pending.setdefault(month, {})[p] = (bids, scouted)
+            # Months are settled in order, each as soon as every promotion has reported it
+            while len(pending.get(settled, ())) == n_promotions:
+                messages = [pending[settled][p] for p in range(n_promotions)]
+                del pending[settled]
+                signed = market.settle(settled, messages)
+                if settled + MARKET_LAG < months:
+                    listing = market.listing()
+                    for p in range(n_promotions): inboxes[p].put({"signed": signed[p], "listing": listing})
+                settled += 1
+    finally:
+        for w in workers: w.join(timeout=5)
+    return {"promotions": summaries, "market": {"signed": market.signed, "contested": market.contested,
+                                                "expired": market.expired, "listed": len(market.entries)}}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run several promotions side by side, sharing one free-agent market.")
+    parser.add_argument("--promotions", type=int, default=4)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None, help="Write the summary to this JSON file")
+    args = parser.parse_args()
+
+    start = time.time()
+    world = run_world(args.promotions, args.years, args.seed)
+    elapsed = time.time() - start
+    for s in world["promotions"]:
+        print(f"{s['name']}: {s['events']} events, avg buys {s['average_buys']}, {s['signings']}/{s['bids']} bids signed, "
+              f"{s['retirements']} retired, roster {s['roster_size'][0]} -> {s['roster_size'][-1]}")
+    m = world["market"]
+    print(f"Market: {m['signed']} signed ({m['contested']} contested), {m['expired']} expired, {m['listed']} still listed")
+    print(f"{args.promotions} promotions x {args.years} years in {elapsed:.1f}s "
+          f"({args.promotions * args.years * 12 / elapsed:.1f} promotion-months/s)")
+    if args.out:
+        with open(args.out, 'w') as f: json.dump(world, f, indent=4)
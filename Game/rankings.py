@@ -0,0 +1,97 @@
+from bisect import bisect_left
+
+# --- RANKING INDEX ---
+# One sorted list per division, kept in rank order. Champions are pinned to the top, everyone
+# else is ordered by ranking_score (ties broken by id). A score change only moves one entry and
+# only re-numbers the fighters it jumped over, rank lookups are a bisect.
+def rank_key(f):
+    return (0 if f.is_champion else 1, -f.ranking_score, f.id)
+
+class RankingIndex:
+    def __init__(self, roster=()):
+        self.keys = {}      # division -> sorted list of rank_key tuples
+        self.order = {}     # division -> fighters, parallel to keys
+        self.entries = {}   # fighter id -> (division, key it is currently filed under)
+        self.champ_counts = {}
+        self.rebuild(roster)
+
+    def rebuild(self, roster):
+        self.keys = {}; self.order = {}; self.entries = {}; self.champ_counts = {}
+        by_div = {}
+        for f in roster: by_div.setdefault(f.weight_class, []).append(f)
+        for div, fighters in by_div.items():
+            fighters.sort(key=rank_key)
+            self.order[div] = fighters
+            self.keys[div] = [rank_key(f) for f in fighters]
+            for f, key in zip(fighters, self.keys[div]): self.entries[f.id] = (div, key)
+            self.champ_counts[div] = sum(1 for f in fighters if f.is_champion)
+            self._renumber(div, 0, len(fighters))
+
+    def _renumber(self, div, lo, hi):
+        fighters = self.order[div]; keys = self.keys[div]; champs = self.champ_counts[div]
+        for i in range(lo, hi):
+            fighters[i].rank = 0 if keys[i][0] == 0 else i - champs + 1
+
+    def add(self, f):
+        if f.id in self.entries: return self.update(f)
+        div = f.weight_class; key = rank_key(f)
+        keys = self.keys.setdefault(div, []); fighters = self.order.setdefault(div, [])
+        pos = bisect_left(keys, key)
+        keys.insert(pos, key); fighters.insert(pos, f)
+        self.entries[f.id] = (div, key)
+        if f.is_champion:
+            self.champ_counts[div] = self.champ_counts.get(div, 0) + 1; self._renumber(div, 0, len(fighters))
+        else:
+            self.champ_counts.setdefault(div, 0); self._renumber(div, pos, len(fighters))
+
+    def remove(self, f): self.remove_id(f.id)
+
+    def remove_id(self, fid):
+        entry = self.entries.pop(fid, None)
+        if not entry: return
+        div, key = entry
+        pos = bisect_left(self.keys[div], key)
+        del self.keys[div][pos]; del self.order[div][pos]
+        if key[0] == 0: self.champ_counts[div] -= 1; pos = 0
+        self._renumber(div, pos, len(self.order[div]))
+
+    def update(self, f):
+        # Call after a fighter's ranking_score or champion status changed
+        entry = self.entries.get(f.id)
+        if not entry or entry[0] != f.weight_class:
+            self.remove(f); self.add(f); return
+        div, old_key = entry
+        new_key = rank_key(f)
+        if new_key == old_key: return
+        keys = self.keys[div]; fighters = self.order[div]
+        old_pos = bisect_left(keys, old_key)
+        del keys[old_pos]; del fighters[old_pos]
+        new_pos = bisect_left(keys, new_key)
+        keys.insert(new_pos, new_key); fighters.insert(new_pos, f)
+        self.entries[f.id] = (div, new_key)
+        if (old_key[0] == 0) != (new_key[0] == 0):
+            # A title changing hands shifts the numbering of the whole division (rare, once per title fight)
+            self.champ_counts[div] += 1 if new_key[0] == 0 else -1
+            self._renumber(div, 0, len(fighters)); return
+        self._renumber(div, min(old_pos, new_pos), max(old_pos, new_pos) + 1)
+
+    def sync(self, roster):
+        # Picks up fighters that joined or left the roster (signings, retirements) without re-sorting
+        current = {f.id: f for f in roster}
+        for fid in [fid for fid in self.entries if fid not in current]: self.remove_id(fid)
+        for fid, f in current.items():
+            if fid not in self.entries: self.add(f)
+
+    def rank_of(self, f):
+        div, key = self.entries[f.id]
+        pos = bisect_left(self.keys[div], key)
+        return 0 if key[0] == 0 else pos - self.champ_counts[div] + 1
+
+    def division(self, div):
+        return list(self.order.get(div, []))
+
+    def top(self, div, k):
+        return self.order.get(div, [])[:k]
+
+    def __len__(self):
+        return len(self.entries)
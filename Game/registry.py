@@ -0,0 +1,87 @@
+import json
+import os
+
+# --- ROSTER REGISTRY ---
+# Owns the signed roster and the free agent pool. Keeps dicts by id and name plus per-division
+# buckets in step with the lists, and hands out fighter ids from a counter that only goes up
+# (persisted in data/registry.json so ids are never reused across sessions). Ids are unique, names
+# are not (rookies can draw a name already in use): by_name keeps everyone with a name in the order
+# they joined, and find() picks the signed one before a free agent, the longest-registered first.
+def _counter_path():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(script_dir, 'data', 'registry.json')
+
+def load_id_counter():
+    try:
+        with open(_counter_path(), 'r') as f: return json.load(f).get('next_id', 1)
+    except (FileNotFoundError, ValueError): return 1
+
+class RosterRegistry:
+    def __init__(self, roster=(), free_agents=(), next_id=1, columns=None):
+        self.columns = columns  # compact.FighterColumns every fighter lives in, None for plain Fighter objects
+        self.roster = []
+        self.free_agents = []
+        self.by_id = {}
+        self.by_name = {}   # name -> fighters with that name, in the order they were added
+        self.by_class = {}  # division -> {id: fighter}, signed roster only
+        self.next_id = next_id
+        for f in roster: self.add(f)
+        for f in free_agents: self.add(f, free_agent=True)
+
+    def allocate_id(self):
+        new_id = self.next_id
+        self.next_id += 1
+        return new_id
+
+    def add(self, f, free_agent=False, front=False):
+        if f.id in self.by_id: raise ValueError(f"Duplicate fighter id {f.id} ({f.name})")
+        target = self.free_agents if free_agent else self.roster
+        if front: target.insert(0, f)
+        else: target.append(f)
+        self.by_id[f.id] = f
+        self.by_name.setdefault(f.name, []).append(f)
+        if not free_agent: self.by_class.setdefault(f.weight_class, {})[f.id] = f
+        self.next_id = max(self.next_id, f.id + 1)
+
+    def sign(self, f):
+        # Free agent -> roster
+        self.free_agents.remove(f)
+        self.roster.append(f)
+        self.by_class.setdefault(f.weight_class, {})[f.id] = f
+
+    def remove(self, f):
+        if f.id in self.by_class.get(f.weight_class, {}):
+            self.roster.remove(f); del self.by_class[f.weight_class][f.id]
+        else:
+            self.free_agents.remove(f)
+        del self.by_id[f.id]
+        self._forget_name(f)
+
+    def remove_many(self, fighters):
+        # One pass over the lists however many go, for the monthly retirements
+        gone = {f.id for f in fighters}
+        self.roster[:] = [f for f in self.roster if f.id not in gone]
+        self.free_agents[:] = [f for f in self.free_agents if f.id not in gone]
+        for f in fighters:
+            self.by_class.get(f.weight_class, {}).pop(f.id, None)
+            del self.by_id[f.id]
+            self._forget_name(f)
+
+    def _forget_name(self, f):
+        named = self.by_name.get(f.name, [])
+        if f in named: named.remove(f)
+        if not named: self.by_name.pop(f.name, None)
+
+    def get(self, fighter_id): return self.by_id.get(fighter_id)
+    def find(self, name):
+        named = self.by_name.get(name, ())
+        return next((f for f in named if self.is_signed(f)), named[0] if named else None)
+    def find_all(self, name): return list(self.by_name.get(name, ()))
+    def is_signed(self, f): return f.id in self.by_class.get(f.weight_class, {})
+    def division(self, div): return list(self.by_class.get(div, {}).values())
+    def division_size(self, div): return len(self.by_class.get(div, {}))
+
+    def save_counter(self):
+        path = _counter_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f: json.dump({"next_id": self.next_id}, f)
@@ -0,0 +1,137 @@
+from bisect import bisect_right
+
+from game_logic import WEIGHT_CLASSES
+
+# --- ROSTER TABLE MODEL ---
+# Sorted view of the roster for the dashboard filter, read straight out of the RankingIndex so
+# nothing is re-sorted or copied on refresh. A division filter is that division's rank order,
+# "All" is every division interleaved by rank (champions first, then all #1s, all #2s, ...).
+# window(start, count) only builds the rows that are on screen.
+def row_values(f):
+    rank_str = "C" if f.is_champion else f"{f.rank}" if f.rank <= 15 else "-"
+    return (rank_str, f.name, f"{f.record['wins']}-{f.record['losses']}", f.popularity), ('injured',) if f.injury_months > 0 else ()
+
+class RosterTableModel:
+    def __init__(self, rankings, choice="All"):
+        self.rankings = rankings
+        self.choice = choice
+
+    def _divisions(self):
+        order = self.rankings.order
+        extra = sorted(d for d in order if d not in WEIGHT_CLASSES)
+        return [(self.rankings.champ_counts.get(d, 0), order[d]) for d in WEIGHT_CLASSES + extra if order.get(d)]
+
+    def contains(self, fighter_id): return fighter_id in self.rankings.entries
+
+    def size(self):
+        if self.choice != "All": return len(self.rankings.order.get(self.choice, []))
+        return len(self.rankings)
+
+    def window(self, start, count):
+        if self.choice != "All": return self.rankings.order.get(self.choice, [])[start:start + count]
+        divs = self._divisions()
+        rows = []
+        # Champions first
+        champs = [f for c, fighters in divs for f in fighters[:c]]
+        rows.extend(champs[start:start + count])
+        if len(rows) == count: return rows
+        s = max(0, start - len(champs))
+
+        # Then rank r of every division that has one. before(r) = non-champion rows ranked above r
+        sizes = sorted(len(fighters) - c for c, fighters in divs)
+        suffix = [0] * (len(sizes) + 1)
+        for i in range(len(sizes) - 1, -1, -1): suffix[i] = suffix[i + 1] + sizes[i]
+        def before(r):
+            i = bisect_right(sizes, r - 1)
+            return (suffix[0] - suffix[i]) + (r - 1) * (len(sizes) - i)
+        lo, hi = 1, (sizes[-1] if sizes else 0) + 1
+        while lo < hi:  # largest r with before(r) <= s
+            mid = (lo + hi + 1) // 2
+            if before(mid) <= s: lo = mid
+            else: hi = mid - 1
+        r, skip = lo, s - before(lo)
+        while len(rows) < count and sizes and r <= sizes[-1]:
+            for c, fighters in divs:
+                if len(fighters) - c >= r:
+                    if skip: skip -= 1; continue
+                    rows.append(fighters[c + r - 1])
+                    if len(rows) == count: break
+            r += 1
+        return rows
+
+# --- VIRTUAL TABLE WIDGET ---
+# Treeview that only holds the rows currently on screen. Scrolling moves a window over the model,
+# and each refresh diffs the new window against what is displayed: rows that left are deleted, new
+# ones inserted, the rest moved/updated only if their position or values changed. Selection is kept
+# by fighter id so it survives rows scrolling out of view.
+class VirtualTable:
+    def __init__(self, tree, scrollbar, model, on_select=None):
+        self.tree = tree; self.scrollbar = scrollbar; self.model = model; self.on_select = on_select
+        self.start = 0
+        self.visible = 20
+        self.shown = []       # ids in display order
+        self.values = {}      # id -> (values, tags) last written
+        self.selected = []    # fighter ids, in the order they were picked
+        self.extend = False   # ctrl/shift held on the last click
+        self.frozen = False   # keep what is on screen and ignore clicks, while another thread changes the roster
+        scrollbar.configure(command=self.on_scrollbar)
+        tree.bind("<<TreeviewSelect>>", self.on_tree_select)
+        tree.bind("<ButtonPress-1>", lambda e: setattr(self, 'extend', bool(e.state & 0x5)), add="+")
+        tree.bind("<Configure>", self.on_resize)
+        tree.bind("<MouseWheel>", lambda e: self.scroll_by(-1 if e.delta > 0 else 1, "units"))
+        tree.bind("<Button-4>", lambda e: self.scroll_by(-1, "units"))
+        tree.bind("<Button-5>", lambda e: self.scroll_by(1, "units"))
+
+    def set_filter(self, choice):
+        if choice != self.model.choice: self.model.choice = choice; self.start = 0
+        self.refresh()
+
+    def selection(self): return list(self.selected)
+
+    def refresh(self):
+        if self.frozen: return
+        self.selected = [fid for fid in self.selected if self.model.contains(fid)]  # retired/released
+        size = self.model.size()
+        self.start = max(0, min(self.start, size - self.visible))
+        rows = self.model.window(self.start, self.visible)
+        ids = [f.id for f in rows]
+        keep = set(ids)
+        for fid in self.shown:
+            if fid not in keep: self.tree.delete(str(fid)); self.values.pop(fid, None)
+        shown = set(self.shown) & keep
+        for pos, f in enumerate(rows):
+            iid = str(f.id); vals = row_values(f)
+            if f.id not in shown:
+                self.tree.insert("", pos, iid=iid, values=vals[0], tags=vals[1])
+            else:
+                if self.tree.index(iid) != pos: self.tree.move(iid, "", pos)
+                if self.values.get(f.id) != vals: self.tree.item(iid, values=vals[0], tags=vals[1])
+            self.values[f.id] = vals
+        self.shown = ids
+        want = tuple(str(fid) for fid in self.selected if fid in keep)
+        if set(self.tree.selection()) != set(want): self.tree.selection_set(want)
+        self.scrollbar.set(*((self.start / size, (self.start + len(rows)) / size) if size else (0, 1)))
+
+    def on_tree_select(self, event):
+        if self.frozen: return
+        on_screen = [int(i) for i in self.tree.selection()]
+        if set(on_screen) == {fid for fid in self.selected if fid in set(self.shown)}: return  # our own selection_set
+        kept = [fid for fid in self.selected if fid in on_screen or (self.extend and fid not in self.shown)]
+        self.selected = kept + [fid for fid in on_screen if fid not in kept]
+        if self.on_select: self.on_select(event)
+
+    def on_resize(self, event):
+        row_height = 20
+        try: row_height = int(self.tree.tk.call("ttk::style", "lookup", "Treeview", "-rowheight") or 20)
+        except Exception: pass
+        visible = max(1, (event.height - 25) // row_height)  # minus the heading
+        if visible != self.visible: self.visible = visible; self.refresh()
+
+    def scroll_by(self, amount, what):
+        step = self.visible if what == "pages" else 3
+        self.start = max(0, self.start + amount * step)
+        self.refresh()
+
+    def on_scrollbar(self, action, *args):
+        if action == "moveto": self.start = int(float(args[0]) * self.model.size()); self.refresh()
+        elif action == "scroll": self.scroll_by(int(args[0]), args[1])
@@ -0,0 +1,169 @@
+import json
+import os
+
+from career_stats import CareerStats
+from game_logic import GameData, Fighter
+from history import FightHistory
+from registry import RosterRegistry
+from storage import RosterStore
+
+# --- SAVE GAMES ---
+# A save is a RosterStore file with the rest of the career alongside the fighters: free agents,
+# news, the event archive and the compact fight records. Saving again to the same file only writes
+# what changed. Loading reads the small stuff up front and leaves fighter histories, event results
+# and fight records in the file until something asks for them.
+SAVE_VERSION = 2
+SAVE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS free_agents (pos INTEGER PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS events (idx INTEGER PRIMARY KEY, summary TEXT NOT NULL, results TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS fight_records (id INTEGER PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS news (seq INTEGER PRIMARY KEY, item TEXT NOT NULL, category TEXT NOT NULL, fighters TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS career_stats (fighter_id INTEGER PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS division_stats (name TEXT PRIMARY KEY, data TEXT NOT NULL);
+"""
+
+def saves_dir():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(script_dir, 'saves')
+
+class LazyEvent(dict):
+    # Archived event whose 'results' list stays in the save file until first read
+    def __init__(self, summary, idx, store):
+        super().__init__(summary); self.idx = idx; self.store = store
+    def __missing__(self, key):
+        if key != 'results': raise KeyError(key)
+        self['results'] = self.store.load_event_results(self.idx)
+        return self['results']
+
+class LazyFightRecords(dict):
+    # fight_id -> record, falling back to the save file for fights not touched this session
+    def __init__(self, store): super().__init__(); self.store = store
+    def __missing__(self, fight_id):
+        record = self.store.load_fight_record(fight_id)
+        if record is None: raise KeyError(fight_id)
+        self[fight_id] = record
+        return record
+    def get(self, fight_id, default=None):
+        try: return self[fight_id]
+        except KeyError: return default
+    def __contains__(self, fight_id): return self.get(fight_id) is not None
+
+class SaveGame(RosterStore):
+    # Rollback journal instead of WAL: every committed save is complete in the .sav file itself, so it
+    # can be copied or backed up while the game is running
+    JOURNAL_MODE = "DELETE"
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.conn.executescript(SAVE_SCHEMA)
+        self.synced = None  # GameData this file was last loaded from or saved from
+        self.events_written = 0; self.news_written = 0; self.last_fight_written = 0
+        self.stats_written = None  # position in game_data.stats.touched written so far, None = write all stats
+
+    def load_event_results(self, idx):
+        row = self.conn.execute("SELECT results FROM events WHERE idx = ?", (idx,)).fetchone()
+        return json.loads(row[0]) if row else []
+
+    def load_fight_record(self, fight_id):
+        row = self.conn.execute("SELECT data FROM fight_records WHERE id = ?", (fight_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_world(self, registry, game_data):
+        with self.conn:
+            if self.synced is not game_data:
+                # A different career (or a file from an earlier session) gets overwritten, not appended
+                # to. Cleared in the same transaction as the rewrite, so a failed save leaves the old one.
+                self.detach(registry, game_data)
+                self.clear(); self.events_written = 0; self.news_written = 0; self.last_fight_written = 0; self.stats_written = None
+            _, written = self.write_fighters(registry.roster)
+            self.conn.execute("DELETE FROM free_agents")
+            self.conn.executemany("INSERT INTO free_agents (pos, data) VALUES (?, ?)",
+                                  [(i, json.dumps(f.to_dict())) for i, f in enumerate(registry.free_agents)])
+
+            # Events, news and fight records only ever grow, so just append the tail
+            new_events = game_data.event_history[self.events_written:]
+            self.conn.executemany("INSERT OR REPLACE INTO events (idx, summary, results) VALUES (?, ?, ?)",
+                                  [(self.events_written + i, json.dumps({k: v for k, v in ev.items() if k != 'results'}), json.dumps(ev['results']))
+                                   for i, ev in enumerate(new_events)])
+            entries = [game_data.news.entry(seq) for seq in range(self.news_written, game_data.news.count)]
+            self.conn.executemany("INSERT INTO news (item, category, fighters) VALUES (?, ?, ?)",
+                                  [(e[1], e[2], json.dumps(list(e[3]))) for e in entries if e])  # None = evicted with no archive
+            # .get() reads records this session never touched from the save they were loaded from
+            new_records = [(fid, game_data.fight_records.get(fid)) for fid in range(self.last_fight_written + 1, game_data.next_fight_id)]
+            self.conn.executemany("INSERT OR REPLACE INTO fight_records (id, data) VALUES (?, ?)",
+                                  [(fid, json.dumps(record)) for fid, record in new_records if record is not None])
+
+            meta = {"version": SAVE_VERSION, "month_index": game_data.month_index, "year": game_data.year, "event_number": game_data.event_number,
+                    "spawned_legends": game_data.spawned_legends, "next_fight_id": game_data.next_fight_id, "next_id": registry.next_id}
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('game', ?)", (json.dumps(meta),))
+            # Only the career and division rows touched since the last save
+            stats = game_data.stats
+            fids, divs = stats.changes(self.stats_written)
+            self.conn.executemany("INSERT OR REPLACE INTO career_stats (fighter_id, data) VALUES (?, ?)", [(fid, json.dumps(stats.fighters[fid])) for fid in fids])
+            self.conn.executemany("INSERT OR REPLACE INTO division_stats (name, data) VALUES (?, ?)", [(div, json.dumps(stats.division_data(div))) for div in divs])
+            if self.stats_written is None: self.conn.execute("DELETE FROM meta WHERE key = 'stats'")
+        self.mark_written(written)
+        self.stats_written = len(stats.touched)
+        self.events_written = len(game_data.event_history)
+        self.news_written = game_data.news.count
+        self.last_fight_written = game_data.next_fight_id - 1
+        self.synced = game_data
+
+    def detach(self, registry, game_data):
+        # Loads whatever of this career still reads lazily from this file, before its tables are cleared.
+        # The rewrite then writes those histories, results and fight records back in full.
+        for f in registry.roster + registry.free_agents:
+            if isinstance(f.history, FightHistory) and f.history.source is self: f.history.entries()
+        for ev in game_data.event_history:
+            if isinstance(ev, LazyEvent) and ev.store is self: ev['results']
+        if isinstance(game_data.fight_records, LazyFightRecords) and game_data.fight_records.store is self:
+            for fid in range(1, game_data.next_fight_id): game_data.fight_records.get(fid)
+
+    def load_world(self, news_archive=None):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'game'").fetchone()
+        if not row: raise ValueError(f"{self.path} is not a save game")
+        meta = json.loads(row[0])
+        if meta.get("version") != SAVE_VERSION: raise ValueError(f"Unsupported save version {meta.get('version')}")
+
+        roster = []
+        for record in self.load_records():
+            f = Fighter(record)
+            f.ranking_score = record['ranking_score']  # Fighter() resets champions to 2000
+            roster.append(f)
+        free_agents = [Fighter(json.loads(data)) for (data,) in self.conn.execute("SELECT data FROM free_agents ORDER BY pos")]
+        registry = RosterRegistry(roster, free_agents, next_id=meta["next_id"])
+
+        game_data = GameData(news_archive)
+        game_data.month_index = meta["month_index"]; game_data.year = meta["year"]; game_data.event_number = meta["event_number"]
+        game_data.spawned_legends = meta["spawned_legends"]; game_data.next_fight_id = meta["next_fight_id"]
+        for item, category, fighters in self.conn.execute("SELECT item, category, fighters FROM news ORDER BY seq"):
+            game_data.news.add(item, json.loads(fighters), category)
+        game_data.event_history = [LazyEvent(json.loads(summary), idx, self) for idx, summary in self.conn.execute("SELECT idx, summary FROM events ORDER BY idx")]
+        game_data.fight_records = LazyFightRecords(self)
+        game_data.stats = CareerStats.from_rows(((fid, json.loads(data)) for fid, data in self.conn.execute("SELECT fighter_id, data FROM career_stats")),
+                                                ((div, json.loads(data)) for div, data in self.conn.execute("SELECT name, data FROM division_stats")),
+                                                game_data.event_history)
+        self.stats_written = 0
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'stats'").fetchone()
+        if row:
+            # Stats from before they were saved row by row, moved to the tables by the next save
+            game_data.stats = CareerStats.from_dict(json.loads(row[0])); self.stats_written = None
+        self.events_written = len(game_data.event_history); self.news_written = game_data.news.count
+        self.last_fight_written = game_data.next_fight_id - 1
+        self.synced = game_data
+        return registry, game_data
+
+_open_saves = {}
+
+def _open(path):
+    path = os.path.abspath(path)
+    if path not in _open_saves: _open_saves[path] = SaveGame(path)
+    return _open_saves[path]
+
+def save_game(path, registry, game_data):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    _open(path).save_world(registry, game_data)
+
+def load_game(path, news_archive=None):
+    if not os.path.exists(path): raise FileNotFoundError(path)
+    return _open(path).load_world(news_archive)
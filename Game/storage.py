@@ -0,0 +1,144 @@
+import json
+import os
+import sqlite3
+
+from history import FightHistory
+
+# --- ROSTER STORAGE BACKEND ---
+# SQLite file next to roster.json. Fighters are stored one row each (without history) and fight
+# history is append-only, one row per fight. save() only serializes fighters changed since the
+# last save (see Fighter.changed), only rewrites those whose core JSON actually differs and only
+# appends history entries that are new, all inside one transaction so a crash mid-save leaves the
+# previous month intact.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS fighters (id INTEGER PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS history (fighter_id INTEGER NOT NULL, seq INTEGER NOT NULL, entry TEXT NOT NULL, PRIMARY KEY (fighter_id, seq));
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+COMPACT_EVERY = 24  # saves between VACUUMs
+
+class RosterStore:
+    JOURNAL_MODE = "WAL"
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)  # the GUI saves from its event thread
+        self.conn.execute(f"PRAGMA journal_mode={self.JOURNAL_MODE}")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.core_hashes = {}   # fighter id -> hash of the core JSON last written
+        self.history_lens = {}  # fighter id -> number of history rows already written
+        self.stamps = {}        # fighter id -> Fighter.changed when it was last written
+        self.saves = 0
+
+    def is_empty(self):
+        return self.conn.execute("SELECT 1 FROM fighters LIMIT 1").fetchone() is None
+
+    def load_records(self, lazy_history=True):
+        # Histories stay in the table behind a FightHistory unless lazy_history is off
+        if lazy_history:
+            self.history_lens = dict(self.conn.execute("SELECT fighter_id, COUNT(*) FROM history GROUP BY fighter_id"))
+        else:
+            histories = {}
+            for fid, entry in self.conn.execute("SELECT fighter_id, entry FROM history ORDER BY fighter_id, seq"):
+                histories.setdefault(fid, []).append(json.loads(entry))
+            self.history_lens = {fid: len(h) for fid, h in histories.items()}
+        records = []
+        for fid, data in self.conn.execute("SELECT id, data FROM fighters ORDER BY id"):
+            record = json.loads(data)
+            if lazy_history: record['history'] = FightHistory(self, fid, self.history_lens.get(fid, 0))
+            else: record['history'] = histories.get(fid, [])
+            self.core_hashes[fid] = hash(data)
+            records.append(record)
+        return records
+
+    def load_history(self, fighter_id):
+        rows = self.conn.execute("SELECT entry FROM history WHERE fighter_id = ? ORDER BY seq", (fighter_id,))
+        return [json.loads(entry) for (entry,) in rows]
+
+    def load_history_page(self, fighter_id, offset, count):
+        # Newest first, served straight from the (fighter_id, seq) primary key
+        rows = self.conn.execute("SELECT entry FROM history WHERE fighter_id = ? ORDER BY seq DESC LIMIT ? OFFSET ?", (fighter_id, count, offset))
+        return [json.loads(entry) for (entry,) in rows]
+
+    def count_history_against(self, fighter_id, opponent):
+        return self.conn.execute("SELECT COUNT(*) FROM history WHERE fighter_id = ? AND json_extract(entry, '$.opponent') = ?", (fighter_id, opponent)).fetchone()[0]
+
+    def save(self, roster):
+        with self.conn:  # one transaction: commit on success, rollback on any error
+            counts, written = self.write_fighters(roster)
+        self.mark_written(written)
+        self.saves += 1
+        if self.saves % COMPACT_EVERY == 0: self.compact()
+        return counts
+
+    def write_fighters(self, roster):
+        # No transaction handling here, callers wrap it together with anything else they write. Returns
+        # the counts and what was written; hand the latter to mark_written() once the transaction has
+        # committed, so a rolled-back save is written again in full next time.
+        changed = 0; appended = 0
+        written = {"hashes": {}, "stamps": {}, "history_lens": {}, "histories": [], "gone": []}
+        live_ids = set()
+        for f in roster:
+            live_ids.add(f.id)
+            # Untouched since the last write: skip serializing. Fighters without a change stamp
+            # (CompactFighter) are always serialized and compared by hash.
+            stamp = getattr(f, "changed", None)
+            if stamp is None or self.stamps.get(f.id) != stamp:
+                data = json.dumps(f.to_dict(include_history=False), sort_keys=True)
+                h = hash(data)
+                if self.core_hashes.get(f.id) != h:
+                    self.conn.execute("INSERT INTO fighters (id, data) VALUES (?, ?) ON CONFLICT(id) DO UPDATE SET data = excluded.data", (f.id, data))
+                    written["hashes"][f.id] = h; changed += 1
+                written["stamps"][f.id] = stamp
+            history = f.history
+            done = self.history_lens.get(f.id, 0)
+            own = isinstance(history, FightHistory) and history.source is self
+            if own and history.stored == done:
+                # Our own lazy history: just the pending tail, without loading the rest
+                new_entries = history.pending
+            else:
+                # Anything else, or our own history after the table was cleared (loaded before clearing)
+                new_entries = history[done:] if len(history) > done else []
+            if own: written["histories"].append(history)
+            if new_entries:
+                self.conn.executemany("INSERT OR REPLACE INTO history (fighter_id, seq, entry) VALUES (?, ?, ?)",
+                                      [(f.id, done + i, json.dumps(entry)) for i, entry in enumerate(new_entries)])
+                appended += len(new_entries)
+                written["history_lens"][f.id] = done + len(new_entries)
+        written["gone"] = [fid for fid in self.core_hashes if fid not in live_ids]
+        for fid in written["gone"]:
+            self.conn.execute("DELETE FROM fighters WHERE id = ?", (fid,))
+            self.conn.execute("DELETE FROM history WHERE fighter_id = ?", (fid,))
+        return (changed, appended, len(written["gone"])), written
+
+    def mark_written(self, written):
+        self.core_hashes.update(written["hashes"]); self.stamps.update(written["stamps"]); self.history_lens.update(written["history_lens"])
+        for fid in written["gone"]: self.core_hashes.pop(fid, None); self.stamps.pop(fid, None); self.history_lens.pop(fid, None)
+        for history in written["histories"]: history.mark_written()
+
+    def reset(self):
+        # Drop everything, e.g. when a different career is loaded and this store has to follow it
+        with self.conn: self.clear()
+
+    def clear(self):
+        # reset() without its own transaction, for callers that rewrite the file in the same one
+        for table in self.tables(): self.conn.execute(f"DELETE FROM {table}")
+        self.core_hashes = {}; self.stamps = {}; self.history_lens = {}
+
+    def tables(self):
+        return [name for (name,) in self.conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+
+    def compact(self):
+        self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self.conn.execute("VACUUM")
+
+    def close(self):
+        self.conn.close()
+
+_stores = {}
+
+def get_store(path):
+    path = os.path.abspath(path)
+    if path not in _stores: _stores[path] = RosterStore(path)
+    return _stores[path]
@@ -0,0 +1,54 @@
+import random
+
+from benchmark import synthetic_roster
+from career_stats import CareerStats
+from fight_engine import run_card
+from game_logic import Fighter, GameData, update_rankings_logic
+from matchmaker import build_card, recently_booked
+
+# --- CAREER & PROMOTION STATS ---
+def result(slot="Prelim", method="DECISION", title=False, new_champ=False, still_champ=False):
+    return {"slot": slot, "method": method, "title_fight": title, "new_champ": new_champ, "still_champ": still_champ}
+
+def test_fight_totals_and_lineage():
+    a, b, c = [Fighter(dict(d, weight_class="Welterweight")) for d in synthetic_roster(3, seed=15)]
+    stats = CareerStats()
+    stats.record_fight(result(method="KNOCKOUT", slot="Main Event"), a, b, "E1", "Jan 2012")
+    stats.record_fight(result(method="SUBMISSION", title=True, new_champ=True), a, c, "E2", "Feb 2012")
+    stats.record_fight(result(title=True, still_champ=True), a, b, "E3", "Mar 2012")
+    stats.record_fight(result(method="KNOCKOUT", title=True, new_champ=True), b, a, "E4", "Apr 2012")
+    ca = stats.career(a.id)
+    assert (ca["fights"], ca["wins"], ca["losses"], ca["finishes"], ca["best_streak"], ca["streak"]) == (4, 3, 1, 2, 3, 0)
+    assert (ca["title_wins"], ca["title_defenses"], ca["main_events"], ca["ko_losses"]) == (1, 1, 1, 1)
+    assert ca["finish_rate"] == 2 / 3 and ca["positions"]["wins"] == 1
+    assert stats.leaderboard("wins") == [(a.name, 3), (b.name, 1)]
+    div = a.weight_class
+    assert [(r["name"], r["won"], r["lost"], r["defenses"]) for r in stats.lineage(div)] == [
+        (a.name, ("E2", "Feb 2012"), ("E4", "Apr 2012"), 1), (b.name, ("E4", "Apr 2012"), None, 0)]
+    rates = stats.finish_rates()[div]
+    assert (rates["fights"], rates["ko"], rates["sub"], rates["dec"], rates["title_fights"]) == (4, 0.5, 0.25, 0.25, 3)
+    assert stats.career(-1) is None
+
+def test_buys_trend():
+    stats = CareerStats()
+    for i, buys in enumerate([100, 300, 200, 600, 500]):
+        stats.record_event({"name": f"E{i}", "date": "", "buys": buys, "rating": 3})
+    assert stats.average_buys() == 340 and stats.average_buys(2) == 550
+    trend = stats.buys_trend(last=2)
+    assert [e[2] for e in trend["events"]] == [600, 500] and trend["average"] == 550 and trend["previous_average"] == 250
+    assert trend["best"][0] == "E3"
+
+def test_matches_the_event_archive():
+    # Kept up to date by run_card, so it must agree with counting the archived results
+    random.seed(3)
+    roster = [Fighter(d) for d in synthetic_roster(150, seed=16)]
+    rankings = update_rankings_logic(roster); game_data = GameData()
+    for _ in range(6):
+        run_card(build_card(roster, rankings, recent=recently_booked(game_data), refine_budget=0), roster, game_data, rankings=rankings)
+    wins = {}
+    for event in game_data.event_history:
+        for res in event["results"]: wins[res["winner"]] = wins.get(res["winner"], 0) + 1
+    by_name = {f.name: f for f in roster}
+    assert all(game_data.stats.career(by_name[name].id)["wins"] == n for name, n in wins.items())
+    assert game_data.stats.leaderboard("wins", n=1)[0][1] == max(wins.values())
+    assert game_data.stats.average_buys() == sum(e["buys"] for e in game_data.event_history) / 6
@@ -0,0 +1,52 @@
+import random
+
+from benchmark import synthetic_roster
+from compact import CompactFighter, FighterColumns
+from game_logic import Fighter, GameData, generate_rookie, process_monthly_events
+from registry import RosterRegistry
+
+# --- COMPACT FIGHTERS ---
+def test_compact_fighter_matches_fighter():
+    columns = FighterColumns(capacity=2)  # grows while adding
+    for data in synthetic_roster(20, seed=1):
+        assert columns.add(data).to_dict() == Fighter(data).to_dict()
+
+def test_record_writes_go_to_the_columns():
+    columns = FighterColumns()
+    f = columns.add(synthetic_roster(1)[0])
+    wins = f.record['wins']
+    f.record['wins'] += 1; f.annual_stats['finishes'] += 2; f.chin -= 5
+    assert columns.column("wins")[columns.rows([f])[0]] == wins + 1
+    assert f.to_dict()["annual_stats"]["finishes"] == 2
+    assert f.to_dict()["stats"]["chin"] == f.chin
+
+def test_released_rows_are_reused():
+    columns = FighterColumns()
+    first, second = [columns.add(d) for d in synthetic_roster(2)]
+    columns.release(first)
+    third = columns.add(synthetic_roster(3)[2])
+    assert columns.rows([third]) == columns.rows([first])
+
+# --- MONTHLY UPDATE ON COLUMNS ---
+def run_months(compact, months=30):
+    random.seed(4)
+    columns = FighterColumns() if compact else None
+    make = columns.add if compact else Fighter
+    registry = RosterRegistry((make(d) for d in synthetic_roster(1500, seed=2)), columns=columns)
+    game_data = GameData()
+    for _ in range(months):
+        process_monthly_events(registry, game_data); game_data.advance_time()
+    return registry, game_data
+
+def test_monthly_events_same_on_columns():
+    plain, plain_data = run_months(False)
+    compact, compact_data = run_months(True)
+    assert [f.to_dict() for f in compact.roster + compact.free_agents] == [f.to_dict() for f in plain.roster + plain.free_agents]
+    assert [compact_data.news.get(s) for s in range(compact_data.news.count)] == [plain_data.news.get(s) for s in range(plain_data.news.count)]
+
+def test_rookies_join_the_columns():
+    columns = FighterColumns()
+    registry = RosterRegistry(columns=columns)
+    rookie = generate_rookie(registry)
+    assert isinstance(rookie, CompactFighter)
+    assert columns.column("age")[columns.rows([rookie])[0]] == rookie.age
@@ -0,0 +1,52 @@
+import random
+
+from benchmark import synthetic_roster
+from fight_engine import simulate_fight
+from game_logic import Fighter
+
+# --- HEADLESS ENGINE ---
+KINDS = {"intro", "round", "status", "action", "scorecard", "result", "note"}
+
+def pair(seed=21, champion=False):
+    a, b = [Fighter(dict(d, is_champion=False)) for d in synthetic_roster(2, seed)]
+    if champion: a.is_champion = True
+    return a, b
+
+def fight(a, b, seed, **kwargs):
+    lines = []
+    res = simulate_fight(a, b, sink=lambda kind, text: lines.append((kind, text)), rng=random.Random(seed), **kwargs)
+    return res, lines
+
+def test_same_seed_same_fight():
+    runs = [fight(*pair(), seed=5, update_records=False) for _ in range(2)]
+    assert runs[0] == runs[1]
+    assert {kind for _, lines in runs for kind, _ in lines} <= KINDS
+    outcomes = {(res["winner"], res["method"], res["round"]) for res, _ in (fight(*pair(), seed=s, update_records=False) for s in range(30))}
+    assert len(outcomes) > 1
+
+def test_without_sink_or_records():
+    a, b = pair()
+    before = (a.to_dict(), b.to_dict())
+    res = simulate_fight(a, b, rng=random.Random(1), update_records=False)
+    assert {res["winner"], res["loser"]} == {a.name, b.name} and 1 <= res["stars"] <= 5
+    assert (a.to_dict(), b.to_dict()) == before
+
+def test_records_updated():
+    a, b = pair()
+    before = {f.name: (f.record["wins"], f.record["losses"]) for f in (a, b)}
+    res, _ = fight(a, b, seed=2, update_records=True, event_name="Test Night", fight_id=7)
+    winner, loser = (a, b) if res["winner"] == a.name else (b, a)
+    assert winner.record["wins"] == before[winner.name][0] + 1 and loser.record["losses"] == before[loser.name][1] + 1
+    assert winner.history[-1] == {"result": "Win", "opponent": loser.name, "method": res["method"], "round": res["round"], "event": "Test Night", "fight_id": 7}
+    assert loser.history[-1]["result"] == "Loss"
+
+def test_title_fights():
+    for seed in range(10):
+        champ, challenger = pair(champion=True)
+        res, lines = fight(challenger, champ, seed, is_main=True)
+        assert res["title_fight"]
+        if res["winner"] == champ.name: assert res["still_champ"] and champ.is_champion
+        else: assert res["new_champ"] and challenger.is_champion and not champ.is_champion
+        assert any(kind == "result" and "👑" in text for kind, text in lines)
+    res, _ = fight(*pair(champion=True), seed=0, is_main=False)
+    assert not res["title_fight"]
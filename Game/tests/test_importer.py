@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from benchmark import synthetic_roster
+from importer import import_world, iter_json_array, validate
+from registry import RosterRegistry
+
+# --- STREAMING ---
+def write(tmp_path, name, text):
+    path = tmp_path / name; path.write_text(text)
+    return str(path)
+
+def test_iter_json_array_across_chunks(tmp_path):
+    records = synthetic_roster(30, seed=1)
+    path = write(tmp_path, "r.json", json.dumps(records, indent=2))
+    assert list(iter_json_array(path, chunk_size=7)) == records
+    assert list(iter_json_array(write(tmp_path, "e.json", " [ ] "))) == []
+
+@pytest.mark.parametrize("text", ['[{"a": 1}{"a": 2}]', '[1 2]', '[1,]', '[,1]', '[1,,2]', '[1, 2', '{"a": 1}', ''])
+def test_iter_json_array_rejects_malformed(tmp_path, text):
+    with pytest.raises(ValueError):
+        list(iter_json_array(write(tmp_path, "bad.json", text), chunk_size=3))
+
+# --- VALIDATION ---
+def test_validate():
+    good = synthetic_roster(1)[0]
+    assert validate(good) == []
+    assert validate([good]) == ["not an object"]
+    assert validate(dict(good, name=" ")) == ["missing name"]
+    assert validate(dict(good, weight_class="Cruiserweight")) == ["unknown weight class 'Cruiserweight'"]
+    assert validate(dict(good, stats=dict(good["stats"], chin=101))) == ["stat chin = 101"]
+    assert validate(dict(good, record={"wins": -1, "losses": 0, "draws": 0}, is_champion=1)) == ["bad record", "bad is_champion"]
+
+# --- MERGING SOURCES ---
+def test_conflict_rules(tmp_path):
+    a, b, c, bad = synthetic_roster(4, seed=2)
+    partial = {k: v for k, v in a.items() if k != "nickname"}
+    write(tmp_path, "one.json", json.dumps([partial, b, dict(bad, stats=None)]))
+    write(tmp_path, "two.json", json.dumps([dict(a, nickname="The Second"), dict(b, popularity=1)]))
+    write(tmp_path, "free.json", json.dumps([dict(a, id=0), c]))
+    registry = RosterRegistry()
+    sources = [("one.json", "roster"), ("two.json", "roster"), ("free.json", "free_agent"), ("gone.json", "roster")]
+    report = import_world(registry, sources=sources, base_dir=str(tmp_path))
+    assert report.loaded == {"one.json": 2, "two.json": 0, "free.json": 1} and report.missing == ["gone.json"]
+    assert [(src, i, reason) for src, i, _, reason in report.skipped] == [("one.json", 2, "missing stats")]
+    assert [(rule, name, detail) for rule, name, _, detail in report.conflicts] == [
+        ("fill", a["name"], "filled nickname"), ("fill", b["name"], "kept first"), ("skip", a["name"], "already a roster")]
+    first = registry.find(a["name"])
+    assert first.nickname == "The Second" and registry.find(b["name"]).popularity == b["popularity"]
+    assert [f.name for f in registry.free_agents] == [c["name"]] and registry.free_agents[0].id > max(a["id"], b["id"])
+
+def test_contract_replaces_free_agent(tmp_path):
+    a = synthetic_roster(1, seed=3)[0]
+    write(tmp_path, "free.json", json.dumps([dict(a, popularity=1)]))
+    write(tmp_path, "roster.json", json.dumps([a]))
+    registry = RosterRegistry()
+    report = import_world(registry, sources=[("free.json", "free_agent"), ("roster.json", "roster")], base_dir=str(tmp_path))
+    assert report.conflicts[0][0] == "replace"
+    assert not registry.free_agents and [f.popularity for f in registry.roster] == [a["popularity"]]
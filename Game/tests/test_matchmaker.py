@@ -0,0 +1,57 @@
+import random
+
+import numpy as np
+
+from benchmark import synthetic_roster
+from game_logic import CARD_SLOTS_KEYS, Fighter, GameData, update_rankings_logic
+from fight_engine import run_card
+from matchmaker import MAX_PER_DIVISION, RANK_WINDOW, build_card, fighter_table, quick_stars, recently_booked
+from predictor import predict_matchup
+
+# --- CARD BUILDER ---
+def world(size=200, seed=13):
+    roster = [Fighter(d) for d in synthetic_roster(size, seed)]
+    return roster, update_rankings_logic(roster)
+
+def test_card_is_valid():
+    roster, rankings = world()
+    roster[0].injury_months = 3
+    card = build_card(roster, rankings, recent={roster[1].name})
+    assert list(card) == CARD_SLOTS_KEYS
+    booked = [f for pair in card.values() for f in pair]
+    assert len({f.id for f in booked}) == len(booked) == 2 * len(CARD_SLOTS_KEYS)
+    assert roster[0] not in booked and roster[1] not in booked
+    for a, b in card.values():
+        assert a.weight_class == b.weight_class and abs(rankings.rank_of(a) - rankings.rank_of(b)) <= RANK_WINDOW + 1
+    undercard = [card[slot][0].weight_class for slot in CARD_SLOTS_KEYS[1:]]
+    assert max(undercard.count(d) for d in undercard) <= MAX_PER_DIVISION
+
+def test_main_event_defends_a_title_and_card_is_seeded():
+    roster, rankings = world()
+    main = build_card(roster, rankings)["Main Event"]
+    assert main[0].is_champion or main[1].is_champion
+    assert build_card(roster, rankings) == build_card(roster, rankings)
+    assert build_card(roster, rankings, refine_budget=0) == build_card(roster, rankings, refine_budget=0)
+
+def test_too_small_roster():
+    roster, rankings = world(size=6)
+    assert build_card(roster, rankings) is None
+
+def test_recent_fighters_rest():
+    roster, rankings = world()
+    game_data = GameData()
+    random.seed(1)
+    event = run_card(build_card(roster, rankings), roster, game_data, rng=random.Random(2), rankings=rankings)
+    rested = recently_booked(game_data)
+    assert rested == {name for res in event["results"] for name in (res["winner"], res["loser"])}
+    assert not rested & {f.name for pair in build_card(roster, rankings, recent=rested).values() for f in pair}
+
+def test_quick_stars_tracks_predictor():
+    # The closed form only has to rank pairs the way the predictor would
+    roster, _ = world(size=40, seed=14)
+    rng = random.Random(3)
+    pairs = [rng.sample(range(len(roster)), 2) for _ in range(25)]
+    a = np.array([p[0] for p in pairs]); b = np.array([p[1] for p in pairs])
+    quick = quick_stars(fighter_table(roster), a, b)
+    predicted = [predict_matchup(roster[i], roster[j], n_sims=2000, seed=0)["expected_stars"] for i, j in pairs]
+    assert np.corrcoef(quick, predicted)[0, 1] > 0.9
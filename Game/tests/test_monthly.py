@@ -0,0 +1,46 @@
+import random
+
+from benchmark import synthetic_roster
+from game_logic import Fighter, GameData, process_monthly_events
+from news import NewsFeed, news_category
+from registry import RosterRegistry
+
+# --- MONTHLY UPDATE ---
+def run_months(months, seed=4):
+    random.seed(seed)
+    registry = RosterRegistry(Fighter(d) for d in synthetic_roster(2000, seed=2))
+    game_data = GameData()
+    for _ in range(months):
+        process_monthly_events(registry, game_data); game_data.advance_time()
+    return registry, game_data
+
+def snapshot(registry, game_data):
+    return [f.to_dict() for f in registry.roster + registry.free_agents], [game_data.news.entry(s) for s in range(game_data.news.count)]
+
+def test_same_seed_same_months():
+    assert snapshot(*run_months(14)) == snapshot(*run_months(14))
+    assert snapshot(*run_months(14)) != snapshot(*run_months(14, seed=5))
+
+def test_batched_news_keeps_categories_and_fighters():
+    registry, game_data = run_months(14)
+    news = game_data.news
+    assert {"INJURY", "MEDICAL", "RETIREMENT", "REGRESSION"} <= set(news.categories())
+    for seq in range(news.first_in_memory(), news.count):
+        _, text, category, names = news.entry(seq)
+        assert category == news_category(text.split("] ", 1)[1])
+        if category == "INJURY": assert names and names[0] in text
+
+def test_monthly_writes_mark_fighters_changed():
+    registry, game_data = run_months(1)
+    before = {f.id: f.changed for f in registry.roster}
+    game_data.month_index = 0  # January: everyone ages
+    process_monthly_events(registry, game_data)
+    assert all(f.changed > before[f.id] for f in registry.roster if f.id in before)
+
+def test_add_many_matches_add():
+    one = NewsFeed(capacity=5); many = NewsFeed(capacity=5)
+    entries = [(f"INJURY: Fighter {i} hurt.", (f"Fighter {i}",), None) for i in range(8)]
+    for text, names, category in entries: one.add(text, names, category)
+    assert many.add_many(iter(entries)) == 8
+    assert list(one.items) == list(many.items)
+    assert one.seqs("INJURY") == many.seqs("INJURY") and one.seqs(fighter="fighter 7") == many.seqs(fighter="fighter 7")
@@ -0,0 +1,39 @@
+from news import NewsFeed, news_category
+
+# --- NEWS FEED ---
+def feed(n, capacity=10, archive_path=None):
+    news = NewsFeed(capacity=capacity, archive_path=archive_path)
+    for i in range(n):
+        kind = ("INJURY", "VIRAL", "RETIREMENT")[i % 3]
+        news.add(f"🩹 {kind}: Fighter {i % 4} news {i}", [f"Fighter {i % 4}"])
+    return news
+
+def test_category_from_message():
+    assert news_category("💊 SCANDAL: X flagged!") == "SCANDAL"
+    assert news_category("✍️ AUTO-SIGNING: X signs") == "AUTO-SIGNING"
+    assert news_category("🎆 HAPPY NEW YEAR! Contracts reviewed.") == "HAPPY NEW YEAR"
+    assert news_category("Nothing to see here") == "GENERAL"
+
+def test_bounded_without_archive():
+    news = feed(25)
+    assert len(news) == 25 and len(news.items) == 10 and news.first_in_memory() == 15
+    assert news.get(3) is None and news.get(20) == "🩹 RETIREMENT: Fighter 0 news 20"
+    # Evicted items are gone from pages, the indexes still count them
+    assert [s for s, _ in news.page(0, 50, category="INJURY")] == [24, 21, 18, 15]
+    assert news.total(category="INJURY") == 9
+
+def test_archive_keeps_everything(tmp_path):
+    news = feed(25, archive_path=str(tmp_path / "archive.jsonl"))
+    assert [news.get(s) for s in range(25)] == [f"🩹 {('INJURY', 'VIRAL', 'RETIREMENT')[i % 3]}: Fighter {i % 4} news {i}" for i in range(25)]
+    assert news.entry(1) == (1, news.get(1), "VIRAL", ("Fighter 1",))
+
+def test_pages_and_filters(tmp_path):
+    news = feed(30, archive_path=str(tmp_path / "archive.jsonl"))
+    assert news.page(0, 3) == [(29, news.get(29)), (28, news.get(28)), (27, news.get(27))]
+    assert [s for s, _ in news.page(1, 3)] == [26, 25, 24]
+    fighter_1 = news.seqs(fighter="FIGHTER 1")
+    assert fighter_1 == list(range(1, 30, 4))
+    assert news.seqs(category="VIRAL", fighter="fighter 1") == [s for s in fighter_1 if s % 3 == 1]
+    assert [s for s, _ in news.since(26)] == [27, 28, 29] and news.since(29) == []
+    assert news.latest(2) == [news.get(29), news.get(28)]
+    assert news.categories() == ["INJURY", "RETIREMENT", "VIRAL"]
@@ -0,0 +1,45 @@
+import random
+
+from benchmark import synthetic_roster
+from fight_engine import simulate_fight
+from game_logic import Fighter
+from predictor import format_prediction, predict_matchup
+
+# --- ENGINE VS PREDICTOR ---
+# predictor.py re-implements simulate_fight's rules with arrays, so the two drift apart silently
+# whenever one of them changes. Seeded throughout, the numbers are the same on every run.
+FIGHTS = 2000
+TOLERANCE = 0.05   # ~4.5 standard errors of the engine's rates at FIGHTS
+
+def engine_rates(a, b, is_main):
+    # Every fight on fresh copies, so records and damage don't carry over
+    da, db = a.to_dict(), b.to_dict()
+    wins = ko = sub = 0
+    for seed in range(FIGHTS):
+        res = simulate_fight(Fighter(da), Fighter(db), is_main, rng=random.Random(seed), update_records=False)
+        wins += res["winner"] == a.name; ko += res["method"] == "KNOCKOUT"; sub += res["method"] == "SUBMISSION"
+    return wins / FIGHTS, ko / FIGHTS, sub / FIGHTS
+
+def test_predictor_agrees_with_engine():
+    roster = [Fighter(d) for d in synthetic_roster(40, seed=3)]
+    rng = random.Random(5)
+    for i in range(8):
+        a, b = rng.sample(roster, 2)
+        is_main = i % 3 == 0
+        win, ko, sub = engine_rates(a, b, is_main)
+        p = predict_matchup(a, b, is_main, n_sims=20000, seed=1)
+        assert abs(p["f1_win"] - win) < TOLERANCE, (a.name, b.name)
+        assert abs(p["ko"] - ko) < TOLERANCE, (a.name, b.name)
+        assert abs(p["sub"] - sub) < TOLERANCE, (a.name, b.name)
+
+def test_predictor_is_seeded():
+    a, b = [Fighter(d) for d in synthetic_roster(2, seed=1)]
+    assert predict_matchup(a, b, seed=4, n_sims=500) == predict_matchup(a, b, seed=4, n_sims=500)
+
+def test_prediction_is_a_distribution():
+    a, b = [Fighter(d) for d in synthetic_roster(2, seed=2)]
+    p = predict_matchup(a, b, n_sims=2000, seed=0)
+    assert (p["f1"], p["f2"], p["sims"], p["rounds"]) == (a.name, b.name, 2000, 3)
+    assert abs(p["f1_win"] + p["f2_win"] - 1) < 1e-9 and abs(p["ko"] + p["sub"] + p["dec"] - 1) < 1e-9
+    assert 1 <= p["expected_stars"] <= 5
+    assert format_prediction(p).startswith(f"{a.name}: ")
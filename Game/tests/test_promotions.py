@@ -0,0 +1,49 @@
+from benchmark import synthetic_roster
+from game_logic import Fighter, GameData
+from promotions import BIDS_PER_MONTH, MARKET_MONTHS, ROSTER_TARGET, Market, choose_bids, run_world
+from registry import RosterRegistry
+
+# --- MARKET ---
+def agents(n, seed=17):
+    return [(d, 50 + i) for i, d in enumerate(synthetic_roster(n, seed))]
+
+def test_listing_skips_repeats():
+    free = agents(3)
+    market = Market(0, [(dict(d), s) for d, s in free])
+    market.list(dict(free[0][0]), 99, 1)  # the same prospect, scouted again by another promotion
+    assert [name for _, name, *_ in market.listing()] == [d["name"] for d, _ in free]
+    assert all("id" not in e["data"] for e in market.entries.values())
+
+def test_settle_by_best_offer():
+    market = Market(0, agents(4))
+    names = {key: name for key, name, *_ in market.listing()}; keys = list(names)
+    signed = market.settle(0, [([(keys[0], 500), (keys[1], 900)], []), ([(keys[1], 800)], []), ([(keys[0], 700), (keys[2], 100)], [])])
+    assert [[d["name"] for d in s] for s in signed] == [[names[keys[1]]], [], [names[keys[0]], names[keys[2]]]]
+    assert (market.contested, market.signed) == (2, 3) and [key for key, *_ in market.listing()] == [keys[3]]
+
+def test_ties_are_seeded_and_listings_expire():
+    def settle(seed):
+        market = Market(seed, agents(1))
+        (key, *_), = market.listing()
+        return [len(s) for s in market.settle(0, [([(key, 500)], []), ([(key, 500)], [])])]
+    assert settle(1) == settle(1) and sorted(settle(1)) == [0, 1]
+    market = Market(0, agents(2))
+    market.settle(MARKET_MONTHS - 1, [([], agents(1, seed=18))])
+    market.settle(MARKET_MONTHS, [([], [])])
+    assert market.expired == 2 and len(market.listing()) == 1
+
+def test_bids_go_to_short_divisions():
+    registry = RosterRegistry(Fighter(dict(d, weight_class="Lightweight")) for d in synthetic_roster(ROSTER_TARGET, seed=19))
+    market = Market(0, [(dict(d, weight_class=div), 10 + i) for i, (d, div) in
+                        enumerate(zip(synthetic_roster(3, seed=20), ["Lightweight", "Welterweight", "Welterweight"]))])
+    bids = choose_bids(registry, market.listing(), GameData())
+    welter_best = max(market.listing(), key=lambda e: e[3] if e[2] == "Welterweight" else -1)[0]
+    assert welter_best in [key for key, _ in bids] and len(bids) <= BIDS_PER_MONTH
+    assert all(market.entries[key]["data"]["weight_class"] != "Lightweight" for key, _ in bids)
+
+# --- RUNNER ---
+def test_world_is_seeded():
+    first = run_world(2, 1, seed=3)
+    assert first == run_world(2, 1, seed=3)
+    assert [p["name"] for p in first["promotions"]] == ["Promotion A", "Promotion B"]
+    assert all(p["events"] == 12 for p in first["promotions"])
@@ -0,0 +1,45 @@
+import json
+import os
+import random
+
+import game_logic
+from benchmark import synthetic_roster
+from game_logic import Fighter, GameData, ProspectIndex, process_monthly_events
+from registry import RosterRegistry
+
+# --- PROSPECT INDEX ---
+def write_prospects(path, debuts, mtime):
+    records = [dict(d, name=f"Prospect {i}", debut_year=year, debut_month=month)
+               for i, (d, (year, month)) in enumerate(zip(synthetic_roster(len(debuts), seed=8), debuts))]
+    path.write_text(json.dumps(records)); os.utime(path, ns=(mtime, mtime))
+    return records
+
+def test_sorted_by_debut_and_reloaded_on_change(tmp_path):
+    path = tmp_path / "prospects.json"
+    write_prospects(path, [(2013, 5), (2012, 0), (2012, 7)], mtime=1_000_000_000)
+    index = ProspectIndex(str(path)); index.refresh()
+    assert index.keys == [(2012, 0), (2012, 7), (2013, 5)] and index.generation == 1
+    assert [index.due(2011, 11), index.due(2012, 7), index.due(2020, 0)] == [0, 2, 3]
+    index.refresh()
+    assert index.generation == 1  # unchanged file, not parsed again
+    write_prospects(path, [(2012, 3)], mtime=2_000_000_000); index.refresh()
+    assert index.generation == 2 and index.keys == [(2012, 3)]
+    path.unlink(); index.refresh()
+    assert index.prospects == [] and index.due(2030, 0) == 0
+
+def test_prospects_debut_once(tmp_path, monkeypatch):
+    random.seed(2)
+    game_data = GameData()
+    year = game_data.year
+    path = tmp_path / "prospects.json"
+    records = write_prospects(path, [(year, 0), (year, 2), (year + 5, 0)], mtime=1_000_000_000)
+    index = ProspectIndex(str(path))
+    def get_index(): index.refresh(); return index
+    monkeypatch.setattr(game_logic, "get_prospect_index", get_index)
+    registry = RosterRegistry(Fighter(d) for d in synthetic_roster(200, seed=9))
+    for _ in range(4):
+        process_monthly_events(registry, game_data); game_data.advance_time()
+    debuted = [registry.find(r["name"]) for r in records]
+    assert debuted[0] and debuted[1] and debuted[2] is None
+    assert all(not registry.is_signed(f) and f.age == 22 for f in debuted[:2])
+    assert len(registry.find_all(records[0]["name"])) == 1 and game_data.is_spawned(records[1]["name"])
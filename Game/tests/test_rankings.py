@@ -0,0 +1,40 @@
+import random
+
+from benchmark import synthetic_roster
+from game_logic import Fighter
+from rankings import RankingIndex, rank_key
+
+# --- RANKING INDEX ---
+# Every incremental change has to leave the index exactly where a full rebuild would put it.
+def snapshot(index):
+    return {div: [(f.id, f.rank) for f in fighters] for div, fighters in index.order.items() if fighters}
+
+def test_updates_match_a_rebuild():
+    rng = random.Random(7)
+    roster = [Fighter(d) for d in synthetic_roster(300, seed=4)]
+    index = RankingIndex(roster)
+    spare = [Fighter(dict(d, id=1000 + i)) for i, d in enumerate(synthetic_roster(20, seed=5))]
+    for step in range(400):
+        f = rng.choice(roster)
+        if step % 50 == 0:
+            # A title changes hands
+            old = next((c for c in roster if c.is_champion and c.weight_class == f.weight_class), None)
+            if old: old.is_champion = False; old.ranking_score = 1500; index.update(old)
+            f.is_champion = True; f.ranking_score = 2000
+        else: f.ranking_score += rng.randint(-60, 60)
+        index.update(f)
+        if step % 40 == 0 and spare:
+            joined = spare.pop(); roster.append(joined); index.sync(roster)
+        if step % 45 == 0:
+            roster.pop(rng.randrange(len(roster))); index.sync(roster)
+    assert snapshot(index) == snapshot(RankingIndex(roster))
+    assert len(index) == len(roster)
+    for f in roster: assert index.rank_of(f) == f.rank
+
+def test_champion_is_rank_zero_and_others_count_from_one():
+    roster = [Fighter(dict(d, weight_class="Lightweight", is_champion=False)) for d in synthetic_roster(5, seed=6)]
+    roster[3].is_champion = True; roster[3].ranking_score = 2000
+    index = RankingIndex(roster)
+    ranked = index.division("Lightweight")
+    assert ranked[0] is roster[3] and [f.rank for f in ranked] == [0, 1, 2, 3, 4]
+    assert ranked == sorted(roster, key=rank_key) and index.top("Lightweight", 2) == ranked[:2]
@@ -0,0 +1,55 @@
+import json
+
+from benchmark import synthetic_roster
+from game_logic import Fighter
+from importer import import_world
+from registry import RosterRegistry
+
+# --- ROSTER REGISTRY ---
+def fighters(n, name=None):
+    out = [Fighter(d) for d in synthetic_roster(n, seed=3)]
+    if name:
+        for f in out: f.name = name
+    return out
+
+def test_lookups_follow_add_sign_remove():
+    registry = RosterRegistry()
+    a, b = fighters(2)
+    registry.add(a); registry.add(b, free_agent=True)
+    assert registry.get(a.id) is a and registry.find(b.name) is b
+    assert not registry.is_signed(b) and b not in registry.division(b.weight_class)
+    registry.sign(b)
+    assert registry.is_signed(b) and b in registry.division(b.weight_class)
+    registry.remove_many([a, b])
+    assert registry.get(a.id) is None and registry.find(b.name) is None and not registry.by_name
+
+def test_duplicate_names_prefer_signed_then_oldest():
+    registry = RosterRegistry()
+    free, first, second = fighters(3, name="Same Name")
+    registry.add(free, free_agent=True); registry.add(first); registry.add(second)
+    assert registry.find("Same Name") is first
+    assert registry.find_all("Same Name") == [free, first, second]
+    registry.remove(first)
+    assert registry.find("Same Name") is second
+    registry.remove(second)
+    assert registry.find("Same Name") is free
+
+def test_ids_are_unique_and_keep_counting():
+    registry = RosterRegistry(next_id=5)
+    a, b = fighters(2)
+    a.id = 40; registry.add(a)
+    assert registry.allocate_id() == 41
+    b.id = 40
+    try: registry.add(b)
+    except ValueError: pass
+    else: raise AssertionError("duplicate id accepted")
+
+def test_import_checks_registered_names(tmp_path):
+    registry = RosterRegistry()
+    (signed,) = fighters(1); signed.popularity = 10; registry.add(signed)
+    incoming = dict(signed.to_dict(), id=999, popularity=99)
+    (tmp_path / "roster.json").write_text(json.dumps([incoming]))
+    (tmp_path / "free.json").write_text(json.dumps([dict(incoming, id=0)]))
+    report = import_world(registry, sources=[("roster.json", "roster"), ("free.json", "free_agent")], base_dir=str(tmp_path))
+    assert [c[0] for c in report.conflicts] == ["fill", "skip"]
+    assert registry.roster == [signed] and not registry.free_agents and signed.popularity == 10
@@ -0,0 +1,36 @@
+import random
+
+from benchmark import synthetic_roster
+from fight_engine import replay_fight, replay_play_by_play, run_card
+from game_logic import Fighter, GameData, update_rankings_logic
+from matchmaker import build_card
+from registry import RosterRegistry
+
+# --- REPLAY ---
+# Event results keep only the summary of each fight, the rest comes back from the fight record.
+def run_event(seed=1):
+    random.seed(seed)
+    registry = RosterRegistry(Fighter(d) for d in synthetic_roster(100, seed))
+    game_data = GameData()
+    rankings = update_rankings_logic(registry.roster)
+    lines = []
+    event = run_card(build_card(registry.roster, rankings), registry.roster, game_data, rng=random.Random(3), rankings=rankings,
+                     fight_sink=lambda kind, text: lines.append(text))
+    return event, game_data, lines
+
+def test_replay_reproduces_card():
+    event, game_data, lines = run_event()
+    replayed = []
+    for res in event["results"]:
+        assert "scores" not in res
+        result, pbp = replay_play_by_play(game_data.fight_records[res["fight_id"]])
+        assert (result["winner"], result["method"], result["round"]) == (res["winner"], res["method"], res["round"])
+        replayed.extend(pbp)
+    assert replayed == lines
+
+def test_replay_refuses_other_engine_versions():
+    event, game_data, _ = run_event()
+    record = dict(game_data.fight_records[event["results"][0]["fight_id"]], engine_version=-1)
+    try: replay_fight(record)
+    except ValueError: pass
+    else: raise AssertionError("replayed a record from another engine version")
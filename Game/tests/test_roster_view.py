@@ -0,0 +1,40 @@
+from benchmark import synthetic_roster
+from game_logic import WEIGHT_CLASSES, Fighter, update_rankings_logic
+from roster_view import RosterTableModel, row_values
+
+# --- ROSTER TABLE MODEL ---
+def full_order(rankings):
+    # "All" built the slow way: champions, then every division's #1, every #2, ...
+    divs = [(rankings.champ_counts.get(d, 0), fighters) for d, fighters in rankings.order.items() if fighters]
+    divs.sort(key=lambda cf: WEIGHT_CLASSES.index(cf[1][0].weight_class))
+    rows = [f for c, fighters in divs for f in fighters[:c]]
+    for r in range(max(len(fighters) for _, fighters in divs)):
+        rows.extend(fighters[c + r] for c, fighters in divs if c + r < len(fighters))
+    return rows
+
+def test_window_matches_full_order():
+    roster = [Fighter(d) for d in synthetic_roster(157, seed=11)]
+    rankings = update_rankings_logic(roster)
+    model = RosterTableModel(rankings)
+    expected = full_order(rankings)
+    assert model.size() == len(expected) == len(roster)
+    for start in range(0, len(expected) + 5, 7):
+        for count in (1, 13, 40):
+            assert model.window(start, count) == expected[start:start + count], (start, count)
+
+def test_division_filter():
+    roster = [Fighter(d) for d in synthetic_roster(80, seed=12)]
+    rankings = update_rankings_logic(roster)
+    div = roster[0].weight_class
+    model = RosterTableModel(rankings, choice=div)
+    assert model.size() == len(rankings.division(div))
+    assert model.window(2, 5) == rankings.division(div)[2:7]
+    assert model.contains(roster[0].id) and not model.contains(-1)
+
+def test_row_values():
+    f = Fighter(synthetic_roster(1)[0])
+    f.is_champion = False; f.rank = 3; f.injury_months = 2
+    values, tags = row_values(f)
+    assert values == ("3", f.name, f"{f.record['wins']}-{f.record['losses']}", f.popularity) and tags == ('injured',)
+    f.rank = 16; f.injury_months = 0
+    assert row_values(f) == (("-",) + values[1:], ())
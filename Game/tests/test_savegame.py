@@ -0,0 +1,129 @@
+import random
+import sqlite3
+
+import pytest
+
+from benchmark import synthetic_roster
+from fight_engine import run_card
+from game_logic import Fighter, GameData, update_rankings_logic
+from matchmaker import build_card
+from registry import RosterRegistry
+from savegame import save_game, load_game
+
+def played_world(size=120, seed=1, months=3):
+    registry = RosterRegistry(Fighter(d) for d in synthetic_roster(size, seed))
+    game_data = GameData()
+    rankings = update_rankings_logic(registry.roster)
+    rng = random.Random(seed)
+    for _ in range(months):
+        run_card(build_card(registry.roster, rankings), registry.roster, game_data, rng=rng, rankings=rankings)
+        game_data.advance_time()
+    return registry, game_data
+
+def fighters(registry):
+    return sorted((f.to_dict() for f in registry.roster), key=lambda d: d["id"])
+
+# --- ROUND TRIP ---
+def test_save_load_round_trip(tmp_path):
+    registry, game_data = played_world()
+    path = str(tmp_path / "career.sav")
+    save_game(path, registry, game_data)
+    registry2, game_data2 = load_game(path)
+
+    assert fighters(registry2) == fighters(registry)
+    assert registry2.next_id == registry.next_id
+    assert (game_data2.year, game_data2.month_index, game_data2.event_number, game_data2.next_fight_id) == \
+           (game_data.year, game_data.month_index, game_data.event_number, game_data.next_fight_id)
+    assert [ev["results"] for ev in game_data2.event_history] == [ev["results"] for ev in game_data.event_history]
+    for fid in range(1, game_data.next_fight_id):
+        assert game_data2.fight_records[fid] == game_data.fight_records[fid]
+
+def test_incremental_save(tmp_path):
+    # The second save only writes what changed, a fresh load must still see all of it
+    registry, game_data = played_world(months=1)
+    path = str(tmp_path / "career.sav")
+    save_game(path, registry, game_data)
+    rankings = update_rankings_logic(registry.roster)
+    run_card(build_card(registry.roster, rankings), registry.roster, game_data, rng=random.Random(9), rankings=rankings)
+    registry.roster[0].popularity = 77
+    save_game(path, registry, game_data)
+
+    db = sqlite3.connect(path)
+    assert db.execute("SELECT COUNT(*) FROM fight_records").fetchone()[0] == game_data.next_fight_id - 1
+    db.close()
+    registry2, game_data2 = load_game(path)
+    assert fighters(registry2) == fighters(registry)
+    assert len(game_data2.event_history) == 2
+
+def test_save_loaded_game_to_new_file(tmp_path):
+    # A loaded career saved under another name carries over every fight record, and the file
+    # stands on its own without -wal/-shm companions
+    registry, game_data = played_world()
+    first = str(tmp_path / "a.sav"); second = str(tmp_path / "b.sav")
+    save_game(first, registry, game_data)
+    save_game(second, *load_game(first))
+
+    db = sqlite3.connect(second)
+    assert db.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    assert db.execute("SELECT COUNT(*) FROM fight_records").fetchone()[0] == game_data.next_fight_id - 1
+    db.close()
+
+def test_failed_save_keeps_old_save(tmp_path):
+    registry, game_data = played_world(months=1)
+    path = str(tmp_path / "career.sav")
+    save_game(path, registry, game_data)
+
+    other, other_data = played_world(seed=2, months=1)
+    other_data.event_history.append({"name": "Broken", "date": "", "buys": 0, "rating": 0, "results": [object()]})
+    with pytest.raises(TypeError): save_game(path, other, other_data)
+
+    registry2, _ = load_game(path)
+    assert fighters(registry2) == fighters(registry)
+
+def histories(registry):
+    return {f.id: list(f.history) for f in registry.roster}
+
+def test_overwrite_keeps_histories_read_from_the_same_file(tmp_path):
+    # A career loaded from this file, saved back after the file was loaded again: the rewrite clears
+    # the tables its lazy histories, results and fight records still read from
+    path = str(tmp_path / "career.sav")
+    save_game(path, *played_world())
+    registry, game_data = load_game(path)
+    expected = histories(registry)
+    results = [ev["results"] for ev in game_data.event_history]
+    load_game(path)
+    save_game(path, registry, game_data)
+
+    registry2, game_data2 = load_game(path)
+    assert histories(registry2) == expected
+    assert [ev["results"] for ev in game_data2.event_history] == results
+    assert all(fid in game_data2.fight_records for fid in range(1, game_data.next_fight_id))
+
+# --- CAREER STATS ---
+def test_stats_round_trip(tmp_path):
+    registry, game_data = played_world()
+    path = str(tmp_path / "career.sav")
+    save_game(path, registry, game_data)
+    stats = load_game(path)[1].stats
+    for key in ("wins", "finishes", "title_defenses"):
+        assert stats.leaderboard(key) == game_data.stats.leaderboard(key)
+    assert stats.finish_rates() == game_data.stats.finish_rates()
+    assert stats.buys_trend() == game_data.stats.buys_trend()
+
+def test_stats_saved_incrementally(tmp_path):
+    # The second save only rewrites the careers of the fighters who fought since the first
+    registry, game_data = played_world(months=1)
+    path = str(tmp_path / "career.sav")
+    save_game(path, registry, game_data)
+    db = sqlite3.connect(path)
+    before = dict(db.execute("SELECT fighter_id, data FROM career_stats"))
+    rankings = update_rankings_logic(registry.roster)
+    card = build_card(registry.roster, rankings)
+    run_card(card, registry.roster, game_data, rng=random.Random(5), rankings=rankings)
+    save_game(path, registry, game_data)
+
+    after = dict(db.execute("SELECT fighter_id, data FROM career_stats"))
+    fought = {f.id for pair in card.values() for f in pair}
+    assert {fid for fid in after if after[fid] != before.get(fid)} == fought
+    db.close()
+    assert load_game(path)[1].stats.leaderboard("wins") == game_data.stats.leaderboard("wins")
@@ -0,0 +1,41 @@
+import json
+
+import pytest
+
+from traits import compile_traits, injury_chance_ceiling, load_trait_definitions
+
+# --- TRAIT ENGINE ---
+@pytest.fixture(autouse=True)
+def shipped_definitions():
+    load_trait_definitions()
+    yield
+    load_trait_definitions()
+
+def test_overrides_follow_definition_order():
+    # Later definitions win whatever order the fighter lists them in
+    assert compile_traits(["Fragile", "Hard to Kill"]).injury_chance == 1
+    assert compile_traits(["Hard to Kill", "Fragile"]).injury_chance == 1
+    assert compile_traits(["Showman", "Trash Talker"]).hype_chance == 50
+    assert compile_traits([]).injury_chance is None and compile_traits([]).hype_chance is None
+
+def test_effects_combine():
+    mods = compile_traits(["Head Hunter", "Glass Cannon", "Power Puncher", "Finisher", "Fast Starter", "Diesel Engine"])
+    assert mods.power == 16 and mods.damage == pytest.approx(1.1 * 1.15) and mods.chin == pytest.approx(0.8)
+    assert mods.finish == 0.9
+    assert mods.round_scale == pytest.approx((1.1 * 0.95, 1.0, 0.9 * 1.1, 0.9 * 1.1, 0.9 * 1.1))
+    assert compile_traits(["Wet Blanket"]).submission == -100
+
+def test_unknown_traits_and_cache():
+    plain = compile_traits([])
+    unknown = compile_traits(["Not A Trait"])
+    assert [getattr(unknown, k) for k in unknown.__slots__] == [getattr(plain, k) for k in plain.__slots__]
+    assert compile_traits(["Iron Chin"]) is compile_traits(("Iron Chin",))
+
+def test_custom_definitions(tmp_path):
+    path = tmp_path / "effects.json"
+    path.write_text(json.dumps({"Brittle": {"injury_chance": 9}, "Sturdy": {"injury_chance": 3}}))
+    load_trait_definitions(str(path))
+    assert compile_traits(["Sturdy", "Brittle"]).injury_chance == 3
+    assert injury_chance_ceiling(2) == 9
+    load_trait_definitions(str(tmp_path / "missing.json"))
+    assert injury_chance_ceiling(2) == 2 and compile_traits(["Sturdy"]).injury_chance is None
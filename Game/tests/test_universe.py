@@ -0,0 +1,16 @@
+from universe import aggregate, run_universes, simulate_universe, summarize
+
+# --- PARALLEL UNIVERSES ---
+def test_universe_is_seeded():
+    assert simulate_universe((3, 1, False, 0)) == simulate_universe((3, 1, False, 0))
+
+def test_universes_aggregate():
+    summary = run_universes(2, 1, workers=1, base_seed=5)
+    assert summary["universes"] == 2
+    assert summary == aggregate([simulate_universe((5, 1, False, 0)), simulate_universe((6, 1, False, 0))])
+    assert len(summary["roster_size_by_year"]) == 2 and summary["rookies_per_year"]["n"] == 2
+
+def test_summarize():
+    assert summarize([]) == {"n": 0}
+    s = summarize(list(range(1, 11)))
+    assert (s["n"], s["min"], s["p50"], s["max"], s["mean"]) == (10, 1, 6, 10, 5.5)
@@ -0,0 +1,69 @@
+import json
+import os
+
+# --- TRAIT ENGINE ---
+# Trait effects are data (trait_effects.json, the numbers behind traits.txt). A fighter's trait
+# list is compiled once into a TraitModifiers object of plain numbers that the fight engine, the
+# predictor and the monthly events read directly. Compiled objects are cached per trait combination,
+# most fighters share a handful. Unknown traits compile to no effect.
+#   damage, chin, volume, recovery  multipliers (damage dealt, chin in KO checks, share of exchanges, stamina recovery)
+#   power, accuracy, takedown, submission  flat bonuses (KO/knockdown rolls, strike roll, takedown roll, submission roll)
+#   finish  chance to end the fight straight after scoring a knockdown
+#   round_scale  stat multiplier for rounds 1-5
+#   injury_chance, hype_chance  monthly injury % and post-fight callout %, None = game default
+MULTIPLIERS = ["damage", "chin", "volume", "recovery"]
+BONUSES = ["power", "accuracy", "takedown", "submission"]
+
+class TraitModifiers:
+    __slots__ = MULTIPLIERS + BONUSES + ["finish", "round_scale", "injury_chance", "hype_chance"]
+
+    def __init__(self):
+        for k in MULTIPLIERS: setattr(self, k, 1.0)
+        for k in BONUSES: setattr(self, k, 0)
+        self.finish = 0.0
+        self.round_scale = (1.0,) * 5
+        self.injury_chance = None; self.hype_chance = None
+
+    def apply(self, effect):
+        for k in MULTIPLIERS:
+            if k in effect: setattr(self, k, getattr(self, k) * effect[k])
+        for k in BONUSES:
+            if k in effect: setattr(self, k, getattr(self, k) + effect[k])
+        if 'finish' in effect: self.finish = max(self.finish, effect['finish'])
+        if 'round_scale' in effect: self.round_scale = tuple(a * b for a, b in zip(self.round_scale, effect['round_scale']))
+        # Overrides, not combined: traits are applied in trait_effects.json order and the later one
+        # wins, like the original checks (Fragile + Hard to Kill = 1, Trash Talker + Showman = 50)
+        if 'injury_chance' in effect: self.injury_chance = effect['injury_chance']
+        if 'hype_chance' in effect: self.hype_chance = effect['hype_chance']
+
+_definitions = None
+_compiled = {}
+
+def load_trait_definitions(path=None):
+    global _definitions
+    if path is None:
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        path = os.path.join(script_dir, 'trait_effects.json')
+    try:
+        with open(path, 'r') as f: _definitions = json.load(f)
+    except FileNotFoundError: _definitions = {}
+    _compiled.clear()
+    return _definitions
+
+def compile_traits(traits):
+    key = tuple(traits)
+    mods = _compiled.get(key)
+    if mods is None:
+        if _definitions is None: load_trait_definitions()
+        mods = TraitModifiers()
+        order = {name: i for i, name in enumerate(_definitions)}
+        for name in sorted(key, key=lambda name: order.get(name, -1)): mods.apply(_definitions.get(name, {}))
+        _compiled[key] = mods
+    return mods
+
+def trait_mods(f): return compile_traits(f.traits)
+
+def injury_chance_ceiling(default):
+    # Highest monthly injury % any fighter can have, for skipping trait lookups on rolls above it
+    if _definitions is None: load_trait_definitions()
+    return max([default] + [effect['injury_chance'] for effect in _definitions.values() if 'injury_chance' in effect])
@@ -0,0 +1,139 @@
+import argparse
+import json
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from game_logic import (WEIGHT_CLASSES, GameData, Fighter, update_rankings_logic, generate_rookie,
+                        process_monthly_events)
+from fight_engine import run_card
+from importer import import_world
+from matchmaker import build_card, recently_booked
+from registry import RosterRegistry
+
+# --- PARALLEL UNIVERSES ---
+# Each universe is a full career run (matchmaker-built card, advance_time, process_monthly_events every month)
+# from the same starting roster with its own seed. Universes run in a process pool and only their
+# compact metrics travel back to the parent, where they are merged into distributions.
+BOOKING_REFINES = 0  # predictor calls per card. Cards are booked on quick_stars alone: with 6 calls a universe-year
+                     # took ~0.43 s instead of ~0.05 s for no better cards (mean stars 3.37 vs 3.51 over 72 events)
+
+def simulate_universe(task):
+    seed, years, compact, card_workers = task
+    random.seed(seed)
+    # Fights within a card in their own pool. Off by default: a bout is ~70us and a round trip to a
+    # worker costs more, so a 10-bout card takes ~0.8ms inline and ~2.4ms through a pool
+    card_pool = ProcessPoolExecutor(max_workers=card_workers) if card_workers > 1 else None
+    if compact:
+        # Numeric fields in shared typed columns (see compact.py), for very large universes
+        from compact import FighterColumns
+        columns = FighterColumns()
+        make = columns.add
+    else: columns = None; make = Fighter
+    registry = RosterRegistry(columns=columns)
+    report = import_world(registry, make=make)
+    report.log()
+    roster = registry.roster
+    rankings = update_rankings_logic(roster)
+    game_data = GameData()
+    while len(registry.free_agents) < 5:
+        registry.add(generate_rookie(registry), free_agent=True)
+
+    month = 0
+    champs = {}  # division -> (fighter id, reign start month)
+    reigns = []; defenses = Counter()
+    retirement_ages = []; rookies_per_year = []; roster_size = [len(roster)]
+    rookies_this_year = 0; events_run = 0
+
+    def track_champions():
+        current = {f.weight_class: f.id for f in roster if f.is_champion}
+        for div in WEIGHT_CLASSES:
+            held = champs.get(div)
+            if held and current.get(div) != held[0]:
+                reigns.append(month - held[1]); champs.pop(div)
+            if div in current and div not in champs: champs[div] = (current[div], month)
+
+    track_champions()
+    for _ in range(years * 12):
+        card = build_card(roster, rankings, recent=recently_booked(game_data), refine_budget=BOOKING_REFINES)
+        if card:
+            event = run_card(card, roster, game_data, rankings=rankings, executor=card_pool)
+            events_run += 1
+            for res in event['results']:
+                if res['still_champ']: defenses[res['winner']] += 1
+        game_data.advance_time(); month += 1
+
+        before = {f.id: f for f in roster}
+        first_new_id = registry.next_id
+        process_monthly_events(registry, game_data)
+        retired = [f for fid, f in before.items() if not registry.get(fid)]
+        retirement_ages.extend(f.age for f in retired)
+        if compact:
+            for f in retired: columns.release(f)
+        rookies_this_year += registry.next_id - first_new_id
+
+        rankings.sync(roster)
+        track_champions()
+        if game_data.month_index == 0:
+            rookies_per_year.append(rookies_this_year); rookies_this_year = 0
+            roster_size.append(len(roster))
+
+    if card_pool: card_pool.shutdown()
+    # Reigns still going at the end count with their length so far
+    reigns.extend(month - start for _, start in champs.values())
+    return {"seed": seed, "events": events_run, "reigns": reigns, "defenses": list(defenses.values()),
+            "retirement_ages": retirement_ages, "rookies_per_year": rookies_per_year, "roster_size": roster_size}
+
+def summarize(values):
+    if not values: return {"n": 0}
+    s = sorted(values)
+    def pct(p): return s[min(len(s) - 1, int(p * len(s)))]
+    return {"n": len(s), "mean": round(sum(s) / len(s), 2), "min": s[0], "p10": pct(0.10), "p50": pct(0.50), "p90": pct(0.90), "max": s[-1]}
+
+def aggregate(results):
+    pooled = {"reigns": [], "defenses": [], "retirement_ages": [], "rookies_per_year": []}
+    for res in results:
+        for key in pooled: pooled[key].extend(res[key])
+    years = max(len(res["roster_size"]) for res in results)
+    drift = [summarize([res["roster_size"][y] for res in results if y < len(res["roster_size"])]) for y in range(years)]
+    return {
+        "universes": len(results),
+        "title_reign_months": summarize(pooled["reigns"]),
+        "title_defenses": summarize(pooled["defenses"]),
+        "retirement_age": summarize(pooled["retirement_ages"]),
+        "retirement_age_hist": dict(sorted(Counter(pooled["retirement_ages"]).items())),
+        "rookies_per_year": summarize(pooled["rookies_per_year"]),
+        "roster_size_by_year": drift,
+    }
+
+def run_universes(n_universes, years, workers=None, base_seed=0, compact=False, card_workers=0):
+    workers = workers or os.cpu_count() or 1
+    tasks = [(base_seed + i, years, compact, card_workers if workers == 1 else 0) for i in range(n_universes)]
+    if workers == 1:
+        results = [simulate_universe(t) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(simulate_universe, tasks, chunksize=max(1, n_universes // (workers * 4))))
+    return aggregate(results)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate many independently seeded careers in parallel.")
+    parser.add_argument("--universes", type=int, default=100)
+    parser.add_argument("--years", type=int, default=30)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--compact", action="store_true", help="Store fighters in shared typed columns")
+    parser.add_argument("--card-workers", type=int, default=0, help="Simulate each card's fights in a pool of this size (with --workers 1; slower than inline with the current engine)")
+    parser.add_argument("--out", default=None, help="Write the aggregated distributions to this JSON file")
+    args = parser.parse_args()
+
+    start = time.time()
+    summary = run_universes(args.universes, args.years, args.workers, args.seed, args.compact, args.card_workers)
+    print(f"{args.universes} universes x {args.years} years in {time.time() - start:.1f}s")
+    for key in ["title_reign_months", "title_defenses", "retirement_age", "rookies_per_year"]:
+        print(f"  {key}: {summary[key]}")
+    print(f"  roster size: start {summary['roster_size_by_year'][0].get('mean')} -> end {summary['roster_size_by_year'][-1].get('mean')}")
+    if args.out:
+        with open(args.out, 'w') as f: json.dump(summary, f, indent=4)
@@ -0,0 +1,59 @@
+import customtkinter as ctk
+
+# --- VIRTUAL BUTTON LIST ---
+# Scrollable list of clickable rows that owns only as many buttons as fit on screen. Scrolling
+# re-labels the pooled buttons instead of creating one widget per item, so a list of thousands of
+# entries costs the same as a list of twenty. Items are pulled through callbacks: count() and
+# label(index), with on_click(index) when a row is pressed.
+class VirtualList(ctk.CTkFrame):
+    def __init__(self, parent, count, label, on_click, row_height=32, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.count = count; self.label = label; self.on_click = on_click
+        self.row_height = row_height
+        self.start = 0
+        self.buttons = []
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.body = ctk.CTkFrame(self, fg_color="transparent")
+        self.body.pack(side="left", fill="both", expand=True)
+        self.body.bind("<Configure>", self.on_resize)
+        self.bind_wheel(self.body)
+
+    def bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", lambda e: self.scroll(-1 if e.delta > 0 else 1))
+        widget.bind("<Button-4>", lambda e: self.scroll(-1))
+        widget.bind("<Button-5>", lambda e: self.scroll(1))
+
+    def on_resize(self, event):
+        wanted = max(1, event.height // self.row_height)
+        while len(self.buttons) < wanted:
+            i = len(self.buttons)
+            btn = ctk.CTkButton(self.body, text="", height=self.row_height - 4, fg_color="#333", hover_color="#444", command=lambda i=i: self.click(i))
+            self.bind_wheel(btn)
+            self.buttons.append(btn)
+        while len(self.buttons) > wanted: self.buttons.pop().destroy()
+        self.refresh()
+
+    def click(self, slot):
+        index = self.start + slot
+        if index < self.count(): self.on_click(index)
+
+    def scroll(self, amount):
+        self.start += amount * 3
+        self.refresh()
+
+    def on_scrollbar(self, action, *args):
+        if action == "moveto": self.start = int(float(args[0]) * self.count())
+        elif action == "scroll": self.start += int(args[0]) * (len(self.buttons) if args[1] == "pages" else 3)
+        self.refresh()
+
+    def refresh(self):
+        total = self.count(); rows = len(self.buttons)
+        self.start = max(0, min(self.start, total - rows))
+        for slot, btn in enumerate(self.buttons):
+            index = self.start + slot
+            if index < total:
+                btn.configure(text=self.label(index))
+                if not btn.winfo_manager(): btn.pack(fill="x", pady=2)
+            elif btn.winfo_manager(): btn.pack_forget()
+        self.scrollbar.set(*((self.start / total, min(1.0, (self.start + rows) / total)) if total else (0, 1)))